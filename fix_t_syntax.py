@@ -1,60 +1,22 @@
 #!/usr/bin/env python3
 """
 Fix incorrect {t()} syntax in JSX
-Changes {t("key")} to t("key") where appropriate
-"""
-import re
-import glob
-
-def fix_file(filepath):
-    """Fix a single file"""
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        original = content
-
-        # Fix patterns like: { name: {t("key")} }
-        # Should be: { name: t("key") }
-        content = re.sub(r':\s*\{t\(', ': t(', content)
-
-        # Fix patterns like: {isLoading ? 'text' : {t("key")}}
-        # Should be: {isLoading ? 'text' : t("key")}
-        content = re.sub(r'\?\s*([^:]+)\s*:\s*\{t\(', r'? \1 : t(', content)
 
-        # Fix patterns like: {copied ? 'text' : {t("key")}}
-        content = re.sub(r'(\w+)\s*\?\s*([^:]+)\s*:\s*\{t\(', r'\1 ? \2 : t(', content)
-
-        # Fix patterns in data structures: text: {t("key")}
-        content = re.sub(r'(text|label|name):\s*\{t\(', r'\1: t(', content)
+Thin wrapper around `python3 -m i18n_tools fix`, which applies these rules
+together with the ones from fix_all_braces.py and the old sed scripts
+"""
+import sys
 
-        if content != original:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(content)
-            return True
-        return False
-    except Exception as e:
-        print(f"Error processing {filepath}: {e}")
-        return False
+from i18n_tools import cli
 
-# Find all TypeScript/TSX files
-patterns = [
+PATTERNS = [
     "src/pages/*.tsx",
     "src/pages/**/*.tsx",
     "src/components/**/*.tsx",
 ]
 
-all_files = []
-for pattern in patterns:
-    all_files.extend(glob.glob(pattern, recursive=True))
-
-print(f"Found {len(all_files)} files")
-print("Fixing files...\n")
-
-fixed = 0
-for filepath in all_files:
-    if fix_file(filepath):
-        print(f"✓ Fixed {filepath}")
-        fixed += 1
+def main():
+    return cli.main(["fix", *PATTERNS])
 
-print(f"\nCompleted! {fixed}/{len(all_files)} files fixed")
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,40 @@
+"""
+Shared i18n tooling for the translate and fix scripts
+"""
+from .engine import DEFAULT_PATTERNS, SOURCE_PATTERNS, Engine, build_table, expand_patterns
+from .fixer import FIX_RULES, Fixer
+from .locales import LocaleIndex, flatten, load_locale
+from .matcher import TranslationMatcher
+from .patch import Edit, apply_edits, diff_edits
+from .profile import RunProfile
+from .routes import build_manifest
+from .rules import RULES, RuleConflictError, UndefinedRuleKeyError, compile_rules
+from .scanner import Finding, scan
+from .validate import ValidationError, check_balance
+
+__all__ = [
+    "DEFAULT_PATTERNS",
+    "Edit",
+    "Engine",
+    "FIX_RULES",
+    "Finding",
+    "Fixer",
+    "LocaleIndex",
+    "RULES",
+    "RuleConflictError",
+    "RunProfile",
+    "SOURCE_PATTERNS",
+    "TranslationMatcher",
+    "UndefinedRuleKeyError",
+    "ValidationError",
+    "apply_edits",
+    "build_manifest",
+    "build_table",
+    "check_balance",
+    "compile_rules",
+    "diff_edits",
+    "expand_patterns",
+    "flatten",
+    "load_locale",
+    "scan",
+]
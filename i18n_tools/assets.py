@@ -0,0 +1,92 @@
+"""
+Content-hashed, precompressed locale assets
+
+Each language/namespace bundle becomes locale.<lang>.<ns>.<hash>.json with
+.gz (and, when the brotli module is installed, .br) siblings for nginx's
+gzip_static/brotli_static, plus an unhashed manifest.json that maps
+lang -> ns -> file for the loader. A copy edit changes one file name; the
+rest stay cached.
+"""
+import gzip
+import hashlib
+import json
+import os
+import re
+
+from .fileio import write_json_atomic
+
+try:
+    import brotli
+except ImportError:  # optional: pip install brotli
+    brotli = None
+
+MANIFEST_NAME = "manifest.json"
+HASH_LENGTH = 10
+
+# Bump when the manifest layout changes
+ASSETS_VERSION = 1
+
+_ASSET_NAME = re.compile(r'^locale\.[\w-]+\.[\w-]+\.[0-9a-f]+\.json(?:\.gz|\.br)?$')
+
+
+def encode_bundle(data):
+    """Minified UTF-8 bytes for one bundle, the exact bytes that get hashed and served"""
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode('utf-8')
+
+
+def asset_name(lang, ns, body):
+    digest = hashlib.sha256(body).hexdigest()[:HASH_LENGTH]
+    return f"locale.{lang}.{ns}.{digest}.json"
+
+
+def _write_if_missing(path, body):
+    """Hashed names are immutable: an existing file already holds these bytes"""
+    if os.path.exists(path):
+        return False
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(body)
+    os.replace(tmp_path, path)
+    return True
+
+
+def write_assets(out_dir, bundles, compress=True):
+    """Write hashed bundles and their compressed siblings, return the manifest dict
+
+    Stale locale.* files from earlier runs are removed once the new
+    manifest is in place.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    assets = {}
+    sizes = {}
+    written = set()
+    for lang, namespaces in bundles.items():
+        assets[lang] = {}
+        for ns, data in namespaces.items():
+            body = encode_bundle(data)
+            name = asset_name(lang, ns, body)
+            assets[lang][ns] = name
+            entry = sizes[name] = {"bytes": len(body)}
+
+            _write_if_missing(os.path.join(out_dir, name), body)
+            written.add(name)
+            if not compress:
+                continue
+            # mtime=0 keeps the .gz bytes reproducible across builds
+            gz = gzip.compress(body, compresslevel=9, mtime=0)
+            _write_if_missing(os.path.join(out_dir, name + ".gz"), gz)
+            written.add(name + ".gz")
+            entry["gzip"] = len(gz)
+            if brotli is not None:
+                br = brotli.compress(body, quality=11)
+                _write_if_missing(os.path.join(out_dir, name + ".br"), br)
+                written.add(name + ".br")
+                entry["brotli"] = len(br)
+
+    manifest = {"version": ASSETS_VERSION, "assets": assets, "sizes": sizes}
+    write_json_atomic(os.path.join(out_dir, MANIFEST_NAME), manifest, separators=(",", ":"))
+
+    for name in os.listdir(out_dir):
+        if _ASSET_NAME.match(name) and name not in written:
+            os.unlink(os.path.join(out_dir, name))
+    return manifest
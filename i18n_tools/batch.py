@@ -0,0 +1,105 @@
+"""
+Batch runs over several repository roots, e.g. every brand's checkout
+
+The rule table and locale index are compiled once and shared by all
+workers; the files of every repository go through one bounded process
+pool, and the run ends with a single report covering all of them.
+"""
+import glob
+import os
+import time
+
+from .engine import Engine, expand_patterns
+from .runner import run_files
+
+# Bump when the report layout changes
+REPORT_VERSION = 2
+
+
+def load_roots(path):
+    """Repository roots from a file, one per line; blank lines and # comments skipped"""
+    with open(path, encoding='utf-8') as f:
+        lines = (line.split("#", 1)[0].strip() for line in f)
+        return [line for line in lines if line]
+
+
+def repo_files(root, patterns):
+    """expand_patterns() with every pattern taken relative to root"""
+    return expand_patterns([os.path.join(glob.escape(root), pattern) for pattern in patterns])
+
+
+def unique_roots(roots):
+    """Return (kept, skipped): roots with duplicates and nested roots dropped
+
+    Roots are compared by realpath, so "a", "./a/" and a symlink to it
+    are one root; a root inside another given root is covered by it.
+    kept keeps the first spelling of each root in the given order;
+    skipped is [(root, covering root)].
+    """
+    first = {}
+    skipped = []
+    for root in roots:
+        real = os.path.realpath(root)
+        if real in first:
+            skipped.append((root, first[real]))
+        else:
+            first[real] = root
+    kept = []
+    for real, root in first.items():
+        outer = next((other for other in first if other != real and real.startswith(os.path.join(other, ""))), None)
+        if outer is None:
+            kept.append(root)
+        else:
+            skipped.append((root, first[outer]))
+    return kept, skipped
+
+
+def run_batch(roots, patterns, jobs=0, **engine_options):
+    """Process every root's files with one shared Engine and return the report dict"""
+    started = time.perf_counter()
+    engine = Engine(**engine_options)
+
+    roots, skipped = unique_roots(roots)
+    repos = []
+    files = []
+    owner = {}
+    seen = set()
+    for root in roots:
+        repo = {"root": root, "files": 0, "updated": [], "errors": []}
+        repos.append(repo)
+        if not os.path.isdir(root):
+            repo["missing"] = True
+            continue
+        for path in repo_files(root, patterns):
+            # Two workers must never rewrite the same file
+            real = os.path.realpath(path)
+            if real in seen:
+                continue
+            seen.add(real)
+            owner[path] = repo
+            files.append(path)
+            repo["files"] += 1
+
+    for result in run_files(engine, files, jobs=jobs, **engine_options):
+        repo = owner[result.path]
+        relative = os.path.relpath(result.path, repo["root"])
+        if result.error:
+            repo["errors"].append({"path": relative, "error": result.error})
+        elif result.changed:
+            repo["updated"].append(relative)
+
+    return {
+        "version": REPORT_VERSION,
+        "fingerprint": engine.fingerprint,
+        "entries": len(engine.table),
+        "wall_seconds": time.perf_counter() - started,
+        "totals": {
+            "repos": len(repos),
+            "files": len(files),
+            "updated": sum(len(repo["updated"]) for repo in repos),
+            "errors": sum(len(repo["errors"]) for repo in repos),
+            "missing": sum(1 for repo in repos if repo.get("missing")),
+        },
+        "repos": repos,
+        "skipped": [{"root": root, "covered_by": outer} for root, outer in skipped],
+    }
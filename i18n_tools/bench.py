@@ -0,0 +1,256 @@
+"""
+Benchmark harness for the i18n tooling
+
+generate_corpus() writes synthetic TSX pages seeded from real member pages
+(class names, imports, state hooks and Thai strings), at a chosen file
+count, file size and Thai density. run_benchmark() times each stage over
+that corpus and can be compared against a saved baseline.
+"""
+import json
+import os
+import random
+import re
+import time
+
+from .engine import Engine, build_table, expand_patterns
+from .fileio import write_json_atomic
+from .fixer import Fixer, apply_rule
+from .lexer import iter_strings
+from .locales import THAI_RE
+from .scanner import iter_findings
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+DEFAULT_SEED_FILES = [
+    "src/pages/member/LotteryBetting.tsx",
+    "src/pages/member/Deposit.tsx",
+    "src/pages/member/*.tsx",
+]
+DEFAULT_BASELINE = ".i18n-bench.json"
+
+_CLASS_NAME = re.compile(r'className="([^"{}]+)"')
+_STATE_HOOK = re.compile(r'^\s*const \[\w+, set\w+\] = useState.*$', re.MULTILINE)
+_IMPORT = re.compile(r'^import .*$', re.MULTILINE)
+
+# Fallbacks so the generator still works without a src/ tree
+_FALLBACK_CLASSES = ["flex items-center gap-2", "text-sm text-gray-400", "px-4 py-2 rounded-lg bg-yellow-500"]
+_FALLBACK_ENGLISH = ["Amount", "Submit", "Loading...", "History"]
+
+# Output of the old scripts, so the fixer has something to do
+_LEGACY_SNIPPETS = [
+    '    toast.error({t("common:messages.error")})',
+    '    const legacy = [{ label: {t("common:buttons.save")} }]',
+    '    const status = ok ? \'done\' : {t("common:status.pending")}}',
+]
+
+
+class Seeds:
+    """Material harvested from real pages"""
+
+    def __init__(self, classes, imports, hooks, thai, english, known):
+        self.classes = classes or _FALLBACK_CLASSES
+        self.imports = imports
+        self.hooks = hooks
+        self.thai = thai or list(known) or ["ข้อความ"]
+        self.english = english or _FALLBACK_ENGLISH
+        self.known = known
+
+    @classmethod
+    def harvest(cls, files, table):
+        classes, imports, hooks, thai, english = set(), set(), set(), set(), set()
+        for path in files:
+            with open(path, 'r', encoding='utf-8') as f:
+                content = f.read()
+            classes.update(_CLASS_NAME.findall(content))
+            imports.update(_IMPORT.findall(content))
+            hooks.update(m.strip() for m in _STATE_HOOK.findall(content))
+            for token in iter_strings(content, path.endswith('.tsx')):
+                text = " ".join(token.value.split())
+                if not text or "'" in text or '"' in text or "{" in text:
+                    continue
+                if THAI_RE.search(text):
+                    thai.add(text)
+                elif token.kind == "jsx_text" and text[0].isalpha():
+                    english.add(text)
+        return cls(sorted(classes), sorted(imports), sorted(hooks), sorted(thai), sorted(english), sorted(table))
+
+
+class PageGenerator:
+    """Builds one balanced TSX page at a time from Seeds"""
+
+    def __init__(self, seeds, density, legacy, rng):
+        self.seeds = seeds
+        self.density = density
+        self.legacy = legacy
+        self.rng = rng
+
+    def _text(self):
+        rng = self.rng
+        if rng.random() >= self.density:
+            return rng.choice(self.seeds.english)
+        # Half known phrases the translator rewrites, half free Thai
+        if self.seeds.known and rng.random() < 0.5:
+            return rng.choice(self.seeds.known)
+        return rng.choice(self.seeds.thai)
+
+    def _cls(self):
+        return self.rng.choice(self.seeds.classes)
+
+    def _element(self, indent):
+        pad = " " * indent
+        kind = self.rng.randrange(5)
+        if kind == 0:
+            return (
+                f'{pad}<div className="{self._cls()}">\n'
+                f'{pad}  <h3 className="{self._cls()}">{self._text()}</h3>\n'
+                f'{pad}  <p className="{self._cls()}">{self._text()}</p>\n'
+                f'{pad}</div>\n'
+            )
+        if kind == 1:
+            return f'{pad}<button onClick={{handleSubmit}} className="{self._cls()}">\n{pad}  {self._text()}\n{pad}</button>\n'
+        if kind == 2:
+            return f'{pad}<input type="text" placeholder="{self._text()}" className="{self._cls()}" />\n'
+        if kind == 3:
+            return f"{pad}<span className=\"{self._cls()}\">{{loading ? '{self._text()}' : '{self._text()}'}}</span>\n"
+        return f'{pad}<label className="{self._cls()}">{self._text()} <span className="text-red-500">*</span></label>\n'
+
+    def page(self, index, target_bytes):
+        rng = self.rng
+        name = f"BenchPage{index}"
+        head = "\n".join(self.seeds.imports[:12]) or "import React, { useState } from 'react'"
+        hooks = "\n".join("  " + h for h in rng.sample(self.seeds.hooks, min(6, len(self.seeds.hooks))))
+        parts = [
+            f"{head}\n\n",
+            f"const {name}: React.FC = () => {{\n",
+            "  const { t } = useTranslation()\n",
+            f"{hooks}\n\n",
+            "  const handleSubmit = async () => {\n",
+            "    try {\n",
+            f"      toast.success('{self._text()}')\n",
+            "    } catch (error) {\n",
+            f"      toast.error('{self._text()}')\n",
+            "    }\n",
+            "  }\n\n",
+            "  const items = [\n",
+        ]
+        parts.extend(f"    {{ label: '{self._text()}', value: '{i}' }},\n" for i in range(4))
+        parts.append("  ]\n\n")
+        if rng.random() < self.legacy:
+            parts.append(rng.choice(_LEGACY_SNIPPETS) + "\n\n")
+        parts.append("  return (\n")
+        parts.append(f'    <div className="{self._cls()}">\n')
+
+        size = sum(len(p.encode('utf-8')) for p in parts)
+        while size < target_bytes:
+            element = self._element(6)
+            parts.append(element)
+            size += len(element.encode('utf-8'))
+
+        parts.append("    </div>\n  )\n}\n\n")
+        parts.append(f"export default {name}\n")
+        return "".join(parts)
+
+
+def generate_corpus(out_dir, files=200, size_kb=20, density=0.3, legacy=0.05, seed=1, seed_files=None, table=None):
+    """Write files synthetic pages to out_dir, return their paths"""
+    seed_paths = expand_patterns(seed_files or DEFAULT_SEED_FILES)
+    seeds = Seeds.harvest(seed_paths, table or {})
+    generator = PageGenerator(seeds, density, legacy, random.Random(seed))
+
+    os.makedirs(out_dir, exist_ok=True)
+    paths = []
+    for i in range(files):
+        path = os.path.join(out_dir, f"BenchPage{i}.tsx")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(generator.page(i, size_kb * 1024))
+        paths.append(path)
+    return paths
+
+
+def peak_rss_kb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS, kilobytes elsewhere
+    return peak // 1024 if os.uname().sysname == "Darwin" else peak
+
+
+def _best_of(repeat, func):
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def run_benchmark(paths, repeat=3, locales_dir=None):
+    """Time every stage over the corpus at paths and return a results dict"""
+    started = time.perf_counter()
+    sources = []
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            sources.append((path, f.read()))
+    read_seconds = time.perf_counter() - started
+    total_bytes = sum(len(c.encode('utf-8')) for _, c in sources)
+
+    table, _ = build_table(locales_dir=locales_dir)
+    translator = Engine(locales_dir=locales_dir)
+    fixer = Fixer()
+
+    stages = {
+        "lex": lambda: [list(iter_strings(c)) for _, c in sources],
+        "translate": lambda: [translator.process(c, p) for p, c in sources],
+        "fix": lambda: [fixer.fix(c) for _, c in sources],
+        "scan": lambda: [list(iter_findings(p, c, table)) for p, c in sources],
+    }
+
+    results = {
+        "files": len(sources),
+        "bytes": total_bytes,
+        "stages": {"read": _rates(read_seconds, len(sources), total_bytes)},
+        "rules": {},
+    }
+    for name, func in stages.items():
+        results["stages"][name] = _rates(_best_of(repeat, func), len(sources), total_bytes)
+
+    for rule in fixer.rules:
+        seconds = _best_of(repeat, lambda: [apply_rule(rule, c) for _, c in sources])
+        results["rules"][rule.name] = round(seconds, 6)
+
+    results["peak_rss_kb"] = peak_rss_kb()
+    return results
+
+
+def _rates(seconds, files, total_bytes):
+    seconds = max(seconds, 1e-9)
+    return {
+        "seconds": round(seconds, 6),
+        "files_per_sec": round(files / seconds, 1),
+        "mb_per_sec": round(total_bytes / seconds / 1e6, 2),
+    }
+
+
+def compare(results, baseline, threshold=0.10):
+    """Return [(stage, baseline_rate, current_rate)] for stages slower than threshold"""
+    regressions = []
+    for stage, current in results["stages"].items():
+        before = baseline.get("stages", {}).get(stage)
+        if not before:
+            continue
+        if current["mb_per_sec"] < before["mb_per_sec"] * (1 - threshold):
+            regressions.append((stage, before["mb_per_sec"], current["mb_per_sec"]))
+    return regressions
+
+
+def load_baseline(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_baseline(path, results):
+    write_json_atomic(path, results, indent=2, sort_keys=True)
@@ -0,0 +1,154 @@
+"""
+Production locale bundles: unused-key pruning and minified output
+
+KeyUsage indexes every key the source can reach: "ns:key" literals
+anywhere in code (t() arguments, nameKey tables, codemod output),
+unprefixed t("key") calls resolved through the useTranslation() hook of
+the component they sit in, and template prefixes such as `transaction:types.${type}`,
+which keep the whole subtree. Keys built in ways the scan cannot see go
+in an allowlist of fnmatch patterns.
+"""
+import fnmatch
+import json
+import os
+import re
+
+from .fileio import write_json_atomic
+from .lexer import EXPRESSION, JSX_ATTR, TEMPLATE, TEMPLATE_CHUNK, iter_strings
+from .locales import flatten, namespace_files
+from .routes import DEFAULT_NAMESPACE
+from .textutil import KEY_PREFIX_SHAPE, PLURAL_SUFFIX, T_CALL_BEFORE, HookNamespaces
+
+DEFAULT_BUNDLE_DIR = "dist/locales"
+DEFAULT_ALLOWLIST = "i18n-keep.txt"
+
+_LITERAL_KINDS = (EXPRESSION, JSX_ATTR, TEMPLATE)
+
+
+class KeyUsage:
+    """Keys and key prefixes referenced from source, checked against the locale keys"""
+
+    def __init__(self, known):
+        self.known = set(known)
+        self.used = set()
+        self.prefixes = set()
+
+    def add_source(self, content, jsx=True):
+        # Unprefixed keys read their hook's first namespace, else defaultNS
+        hooks = HookNamespaces(content, DEFAULT_NAMESPACE)
+
+        for token in iter_strings(content, jsx):
+            value = token.value
+            if token.kind == TEMPLATE_CHUNK:
+                # `ns:path.${x}`: only the chunk before the first ${ is a prefix
+                if KEY_PREFIX_SHAPE.match(value) and content[token.start - 1] == "`":
+                    self.prefixes.add(value)
+                continue
+            if token.kind not in _LITERAL_KINDS:
+                continue
+            if value in self.known:
+                self.used.add(value)
+            elif KEY_PREFIX_SHAPE.match(value):
+                # const prefix = 'ns:path.' used as prefix + x
+                self.prefixes.add(value)
+            elif ":" not in value and T_CALL_BEFORE.search(content, max(0, token.start - 16), token.start):
+                key = f"{hooks.namespace(token.start, token.scope)}:{value}"
+                if key in self.known:
+                    self.used.add(key)
+
+    def is_used(self, key):
+        if key in self.used or PLURAL_SUFFIX.sub('', key) in self.used:
+            return True
+        return any(key.startswith(prefix) for prefix in self.prefixes)
+
+
+def collect_usage(files, known):
+    """Scan files and return their KeyUsage"""
+    usage = KeyUsage(known)
+    for path, content in _read_sources(files):
+        usage.add_source(content, path.endswith('.tsx'))
+    return usage
+
+
+def _read_sources(files):
+    # Unlike scanner.iter_sources(), no Thai filter: keys are ASCII
+    for path in files:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                yield path, f.read()
+        except (OSError, UnicodeDecodeError):
+            continue
+
+
+def load_allowlist(path):
+    """Return fnmatch patterns, one per line; # starts a comment. A missing file is empty"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return []
+    patterns = []
+    for line in lines:
+        line = line.split("#", 1)[0].strip()
+        if line:
+            patterns.append(line)
+    return patterns
+
+
+def prune(data, ns, keep, prefix=""):
+    """Return a copy of one namespace's nested data with only the kept leaves"""
+    pruned = {}
+    for key, value in data.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict):
+            child = prune(value, ns, keep, path + ".")
+            if child:
+                pruned[key] = child
+        elif keep(f"{ns}:{path}"):
+            pruned[key] = value
+    return pruned
+
+
+def build_bundles(locales_dir, langs, usage=None, allowlist=(), flat=False):
+    """Return ({lang: {ns: data}}, unused) for every language
+
+    With usage=None nothing is pruned. unused lists the dropped keys of
+    the first language, which carries the same key set as the others.
+    """
+    def keep(key):
+        if usage is None or usage.is_used(key):
+            return True
+        return any(fnmatch.fnmatchcase(key, pattern) for pattern in allowlist)
+
+    bundles = {}
+    unused = []
+    for lang in langs:
+        bundles[lang] = {}
+        for ns, path in namespace_files(locales_dir, lang).items():
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            pruned = prune(data, ns, keep)
+            if lang == langs[0]:
+                unused.extend(f"{ns}:{key}" for key, _ in flatten(data) if not keep(f"{ns}:{key}"))
+            bundles[lang][ns] = dict(flatten(pruned)) if flat else pruned
+    return bundles, unused
+
+
+def write_bundles(out_dir, bundles):
+    """Write <out_dir>/<lang>/<ns>.json, return total bytes written"""
+    total = 0
+    for lang, namespaces in bundles.items():
+        os.makedirs(os.path.join(out_dir, lang), exist_ok=True)
+        for ns, data in namespaces.items():
+            path = os.path.join(out_dir, lang, f"{ns}.json")
+            write_json_atomic(path, data, separators=(",", ":"))
+            total += os.path.getsize(path)
+    return total
+
+
+def locale_langs(locales_dir):
+    """Language directories under locales_dir, sorted"""
+    return sorted(
+        name for name in os.listdir(locales_dir)
+        if os.path.isdir(os.path.join(locales_dir, name))
+    )
@@ -0,0 +1,105 @@
+"""
+Incremental run cache so files untouched since the last run are skipped
+"""
+import hashlib
+import json
+import os
+
+from .fileio import write_json_atomic
+
+DEFAULT_CACHE_PATH = ".i18n-cache.json"
+
+# Bump when the cache layout changes
+CACHE_VERSION = 2
+
+
+def hash_bytes(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def hash_file(filepath):
+    with open(filepath, 'rb') as f:
+        return hash_bytes(f.read())
+
+
+def _read_manifest(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if data.get("version") != CACHE_VERSION:
+        return {}
+    return data.get("sections", {})
+
+
+class RunCache:
+    """Manifest of {path: size, mtime_ns, sha256} valid for one rule fingerprint
+
+    A file is clean when its size and mtime still match, or failing that
+    when its content hash does. Any change to the fingerprint (the rule
+    table or the engine version) drops every entry. Each command keeps its
+    own section so translate and fix runs do not invalidate each other.
+    """
+
+    def __init__(self, path, fingerprint, section="translate"):
+        self.path = path
+        self.fingerprint = fingerprint
+        self.section = section
+        self.entries = {}
+        self.dirty = False
+        self._load()
+
+    def _load(self):
+        stored = _read_manifest(self.path).get(self.section)
+        if stored and stored.get("fingerprint") == self.fingerprint:
+            self.entries = stored.get("files", {})
+        elif stored:
+            self.dirty = True
+
+    def is_clean(self, filepath):
+        entry = self.entries.get(filepath)
+        if entry is None:
+            return False
+        try:
+            st = os.stat(filepath)
+        except OSError:
+            return False
+        if st.st_size == entry["size"] and st.st_mtime_ns == entry["mtime_ns"]:
+            return True
+        if st.st_size != entry["size"] or hash_file(filepath) != entry["sha256"]:
+            return False
+        # Touched but identical content: remember the new mtime
+        entry["mtime_ns"] = st.st_mtime_ns
+        self.dirty = True
+        return True
+
+    def update(self, filepath):
+        """Record the file's current on-disk state as processed"""
+        try:
+            st = os.stat(filepath)
+            digest = hash_file(filepath)
+        except OSError:
+            self.forget(filepath)
+            return
+        self.entries[filepath] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "sha256": digest}
+        self.dirty = True
+
+    def forget(self, filepath):
+        if self.entries.pop(filepath, None) is not None:
+            self.dirty = True
+
+    def partition(self, files):
+        """Split files into (dirty, clean) lists, both in input order"""
+        dirty, clean = [], []
+        for filepath in files:
+            (clean if self.is_clean(filepath) else dirty).append(filepath)
+        return dirty, clean
+
+    def save(self):
+        if not self.dirty:
+            return
+        sections = _read_manifest(self.path)
+        sections[self.section] = {"fingerprint": self.fingerprint, "files": self.entries}
+        write_json_atomic(self.path, {"version": CACHE_VERSION, "sections": sections}, sort_keys=True)
+        self.dirty = False
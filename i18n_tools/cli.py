@@ -0,0 +1,728 @@
+"""
+Command line entry point: python3 -m i18n_tools <command> [options]
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+from . import assets, batch, bench, bundles, parity, routes, server, watch
+from .cache import DEFAULT_CACHE_PATH, RunCache
+from .engine import DEFAULT_PATTERNS, SOURCE_PATTERNS, Engine, build_table, expand_patterns
+from .fileio import write_json_atomic, write_text_if_changed
+from .gitfiles import GitError, changed_files, filter_patterns
+from .hooks import check_hooks
+from .keyindex import DEFAULT_KEY_INDEX, KeyIndex
+from .locales import DEFAULT_INDEX_CACHE, DEFAULT_LOCALES_DIR, SOURCE_LANG, LocaleIndex, load_locale, namespace_files
+from .localewriter import write_entries
+from .memory import DEFAULT_MEMORY, TranslationMemory
+from .profile import RunProfile
+from .rules import RuleConflictError, UndefinedRuleKeyError, compile_rules
+from .runner import run_files
+from .scanner import scan
+from .segment import Segmenter
+from .textutil import PLURAL_SUFFIX
+from .validate import check_balance
+
+
+def select_files(args, default_patterns):
+    """The command's globs, narrowed to what git reports changed with --since/--staged"""
+    patterns = args.patterns or default_patterns
+    if args.since is None and not args.staged:
+        return expand_patterns(patterns)
+    return filter_patterns(changed_files(since=args.since, staged=args.staged), patterns)
+
+
+def run_stage(args, section, default_patterns, **engine_options):
+    """Shared body of the file-rewriting commands"""
+    files = select_files(args, default_patterns)
+    # With --diff stdout carries only the patch, so it can go to git apply
+    log = sys.stderr if args.diff else sys.stdout
+
+    print(f"Found {len(files)} files", file=log)
+
+    engine = Engine(**engine_options)
+    todo = files
+    cache = None
+    # A profile must see every file: a rule whose files the cache skipped
+    # would be reported dead
+    if not args.no_cache and not args.profile:
+        cache = RunCache(args.cache, engine.fingerprint, section)
+        todo, clean = cache.partition(files)
+        if clean:
+            print(f"Skipping {len(clean)} unchanged files (cache: {args.cache})", file=log)
+
+    print("Processing files...\n", file=log)
+
+    profile = None
+    if args.profile:
+        profile = RunProfile(
+            section,
+            table=engine.table if engine.translate else None,
+            overrides=compile_rules() if engine.translate else (),
+            fix_rules=[rule.name for rule in engine.fixer.rules] if engine.fix else (),
+        )
+
+    results = run_files(engine, todo, jobs=args.jobs, profile=profile is not None, diff=args.diff, **engine_options)
+
+    # A diff run writes nothing, so nothing it saw is processed yet
+    if cache is not None and not args.diff:
+        for result in results:
+            if result.error:
+                cache.forget(result.path)
+            else:
+                cache.update(result.path)
+        cache.save()
+
+    updated = 0
+    for result in results:
+        filename = os.path.basename(result.path)
+        if result.error:
+            print(f"Error processing {result.path}: {result.error}", file=log)
+        elif result.changed:
+            if args.diff:
+                sys.stdout.write(result.diff)
+            else:
+                print(f"✓ Updated {filename}")
+            updated += 1
+        elif args.verbose:
+            print(f"- No changes {filename}", file=log)
+
+    verb = "would change" if args.diff else "updated"
+    print(f"\nCompleted! {updated}/{len(files)} files {verb}", file=log)
+
+    if profile is not None:
+        for result in results:
+            profile.add(result)
+        report = profile.report(skipped=len(files) - len(todo))
+        write_json_atomic(args.profile, report, indent=2)
+        hit = sum(1 for rule in report["rules"] if rule["matches"])
+        print(f"Profile: {hit} rules hit, {len(report['dead_rules'])} dead, written to {args.profile}", file=log)
+    return 0
+
+
+def cmd_translate(args):
+    """Replace known Thai text with t() calls, one read and at most one write per file"""
+    locales_dir = None if args.no_locales else args.locales
+    return run_stage(
+        args, "translate", DEFAULT_PATTERNS,
+        fix=args.fix, locales_dir=locales_dir, validate=not args.no_validate,
+    )
+
+
+def cmd_fix(args):
+    """Repair t() brace and syntax leftovers without translating"""
+    return run_stage(args, "fix", SOURCE_PATTERNS, translate=False, fix=True, validate=not args.no_validate)
+
+
+def cmd_batch(args):
+    """Translate several repository roots in one run with a shared rule table"""
+    roots = list(args.roots)
+    if args.roots_file:
+        roots += batch.load_roots(args.roots_file)
+    if not roots:
+        print("No repository roots given", file=sys.stderr)
+        return 2
+
+    locales_dir = None if args.no_locales else args.locales
+    report = batch.run_batch(
+        roots, args.pattern or DEFAULT_PATTERNS, jobs=args.jobs,
+        fix=args.fix, locales_dir=locales_dir, validate=not args.no_validate,
+    )
+
+    for skipped in report["skipped"]:
+        print(f"- {skipped['root']}: already covered by {skipped['covered_by']}")
+    for repo in report["repos"]:
+        if repo.get("missing"):
+            print(f"✗ {repo['root']}: not a directory")
+            continue
+        print(f"{repo['root']}: {len(repo['updated'])}/{repo['files']} files updated, {len(repo['errors'])} errors")
+        for path in repo["updated"] if args.verbose else ():
+            print(f"  ✓ {path}")
+        for error in repo["errors"]:
+            print(f"  Error processing {error['path']}: {error['error']}")
+
+    totals = report["totals"]
+    print(
+        f"\nCompleted! {totals['updated']}/{totals['files']} files updated across "
+        f"{totals['repos']} repositories in {report['wall_seconds']:.2f}s"
+    )
+    if args.report:
+        write_json_atomic(args.report, report, indent=2, sort_keys=True)
+        print(f"Report written to {args.report}")
+    return 1 if totals["missing"] else 0
+
+
+def cmd_watch(args):
+    """Keep the engine in memory and translate each file as it is saved"""
+    locales_dir = None if args.no_locales else args.locales
+    watcher = watch.open_watcher(args.root, polling=args.poll, interval=args.interval)
+    started = time.perf_counter()
+    daemon = watch.WatchDaemon(
+        watcher, args.patterns or DEFAULT_PATTERNS, debounce=args.debounce / 1000,
+        translate=True, fix=args.fix, locales_dir=locales_dir, validate=not args.no_validate,
+    )
+    elapsed = (time.perf_counter() - started) * 1000
+    print(f"Watching {args.root} ({watcher.name}, {len(daemon.engine.table)} entries loaded in {elapsed:.0f} ms), Ctrl-C to stop")
+    daemon.run()
+    return 0
+
+
+def cmd_serve(args):
+    """Answer JSON-RPC transform/check requests on stdin with a warm engine"""
+    locales_dir = None if args.no_locales else args.locales
+    server.Server(
+        translate=True, fix=args.fix, locales_dir=locales_dir, validate=not args.no_validate,
+    ).serve()
+    return 0
+
+
+def cmd_check(args):
+    """Check brace, paren, bracket, string and JSX tag balance, and that every t() has its hook"""
+    files = select_files(args, SOURCE_PATTERNS)
+    broken = 0
+    for path in files:
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        jsx = path.endswith('.tsx')
+        problems = check_balance(content, jsx) + check_hooks(content, jsx)
+        if problems:
+            broken += 1
+            for problem in problems[:1 if not args.verbose else None]:
+                print(f"{path}:{problem.line}:{problem.column}: {problem.message}")
+    print(f"{broken}/{len(files)} files with problems", file=sys.stderr)
+    return 1 if broken else 0
+
+
+def cmd_index(args):
+    """Build (or reuse) the locale reverse index and report shared texts"""
+    index = LocaleIndex.load(args.locales, args.lang, cache_path=args.cache)
+    namespaces = {key.split(":", 1)[0] for key in index.entries}
+
+    print(f"{len(index.entries)} keys in {len(namespaces)} namespaces ({args.lang})")
+    print(f"{len(index.index)} distinct texts, {len(index.collisions)} shared by several keys")
+    if args.verbose:
+        for text, keys in sorted(index.collisions.items()):
+            print(f'  "{text}": {", ".join(keys)} -> {index.index[text]}')
+    return 0
+
+
+def cmd_scan(args):
+    """Report Thai text left outside t() calls as JSONL, one record per run"""
+    started = time.perf_counter()
+    locales_dir = None if args.no_locales else args.locales
+    table, _ = build_table(locales_dir=locales_dir)
+    files = select_files(args, SOURCE_PATTERNS)
+
+    out = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    count = suggested = 0
+    paths = set()
+    try:
+        for finding in scan(files, table):
+            out.write(json.dumps(finding._asdict(), ensure_ascii=False) + "\n")
+            count += 1
+            suggested += finding.suggestion is not None
+            paths.add(finding.path)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    elapsed = time.perf_counter() - started
+    print(
+        f"{count} Thai runs in {len(paths)}/{len(files)} files, "
+        f"{suggested} with a suggested key ({elapsed:.2f}s)",
+        file=sys.stderr,
+    )
+    return 0
+
+
+def cmd_suggest(args):
+    """Suggest the closest existing locale keys for Thai text with no exact match"""
+    started = time.perf_counter()
+    with TranslationMemory.open(args.memory, args.locales) as memory:
+        if not args.bulk:
+            for text in args.texts:
+                print(text)
+                for suggestion in memory.suggest(text, k=args.k, min_score=args.min_score):
+                    print(f"  {suggestion.score:.3f}  {suggestion.key}  {suggestion.text}")
+            return 0
+
+        source = sys.stdin if args.bulk == "-" else open(args.bulk, encoding='utf-8')
+        with source:
+            records = [json.loads(line) for line in source if line.strip()]
+        pending = [record for record in records if record.get("suggestion") is None]
+        matches = memory.suggest_many((record["text"] for record in pending), k=args.k, min_score=args.min_score)
+
+    out = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    try:
+        for record in records:
+            if record.get("suggestion") is None:
+                record["matches"] = [suggestion._asdict() for suggestion in matches[record["text"]]]
+            out.write(json.dumps(record, ensure_ascii=False) + "\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    elapsed = time.perf_counter() - started
+    matched = sum(1 for record in pending if record["matches"])
+    print(f"{matched}/{len(pending)} unmapped runs with a close key ({len(matches)} distinct texts, {elapsed:.2f}s)", file=sys.stderr)
+    return 0
+
+
+def proposal_record(proposal):
+    return {
+        "call": proposal.call,
+        "template": proposal.template,
+        "coverage": proposal.coverage,
+        "segments": [
+            {"text": segment.text, "key": segment.key, "params": segment.params}
+            for segment in proposal.segments if segment.key is not None
+        ],
+    }
+
+
+def cmd_segment(args):
+    """Find known Thai phrases inside longer strings and propose t() calls"""
+    segmenter = Segmenter.from_locales(args.locales)
+    if not args.bulk:
+        for text in args.texts:
+            proposal = segmenter.propose(text)
+            print(text)
+            for segment in proposal.segments:
+                if segment.key is not None:
+                    params = f" {segment.params}" if segment.params else ""
+                    print(f"  {segment.text!r} -> {segment.key}{params}")
+            print(f"  coverage {proposal.coverage:.0%}: {proposal.call or 'no proposal'}")
+            if proposal.template:
+                print(f"  needs locale text: {proposal.template}")
+        return 0
+
+    source = sys.stdin if args.bulk == "-" else open(args.bulk, encoding='utf-8')
+    with source:
+        records = [json.loads(line) for line in source if line.strip()]
+
+    started = time.perf_counter()
+    proposals = {}
+    for record in records:
+        if record.get("suggestion") is None:
+            text = record.get("literal") or record["text"]
+            if text not in proposals:
+                proposals[text] = proposal_record(segmenter.propose(text))
+            record["proposal"] = proposals[text]
+    elapsed = time.perf_counter() - started
+
+    out = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    try:
+        for record in records:
+            out.write(json.dumps(record, ensure_ascii=False) + "\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    proposed = sum(1 for proposal in proposals.values() if proposal["call"])
+    drafted = sum(1 for proposal in proposals.values() if proposal["template"])
+    covered = sum(1 for proposal in proposals.values() if proposal["coverage"] == 1)
+    rate = len(proposals) / elapsed if elapsed else 0
+    print(
+        f"{len(proposals)} distinct unmapped strings: {covered} made entirely of known phrases, "
+        f"{proposed} with a proposed call ({drafted} need a new template), {rate:,.0f} strings/s",
+        file=sys.stderr,
+    )
+    return 0
+
+
+def open_key_index(args):
+    """The key-usage index, brought up to date with the source tree first"""
+    index = KeyIndex(args.index, namespace_files(args.locales, SOURCE_LANG).keys())
+    index.update(expand_patterns(args.pattern or SOURCE_PATTERNS))
+    return index
+
+
+def known_keys(locales_dir):
+    """Source-language keys, plus the plural bases t() reads them through"""
+    keys = set(load_locale(locales_dir, SOURCE_LANG))
+    return keys | {PLURAL_SUFFIX.sub('', key) for key in keys}
+
+
+def print_references(references, known):
+    for ref in references:
+        missing = ref.kind != "prefix" and ref.key not in known
+        print(f"{ref.path}:{ref.line}:{ref.column}\t{ref.key}\t{ref.kind}{' (missing)' if missing else ''}")
+
+
+def cmd_who_uses(args):
+    """List every file, line and column that can read the given locale keys"""
+    known = known_keys(args.locales)
+    found = False
+    with open_key_index(args) as index:
+        for key in args.keys:
+            references = index.who_uses(key)
+            found = found or bool(references)
+            print_references(references, known)
+    return 0 if found else 1
+
+
+def cmd_keys_in(args):
+    """List the locale keys each given file references, in source order"""
+    known = known_keys(args.locales)
+    with open_key_index(args) as index:
+        for path in args.files:
+            print_references(index.keys_in(path), known)
+    return 0
+
+
+def cmd_parity(args):
+    """Diff locale key sets per language and find keys used but never defined"""
+    langs = args.langs or bundles.locale_langs(args.locales)
+    known = load_locale(args.locales, SOURCE_LANG)
+    report = {
+        "source": SOURCE_LANG,
+        "languages": parity.check_parity(args.locales, langs),
+        "undefined_rules": parity.undefined_keys(compile_rules().values(), known),
+        "undefined_source": [],
+    }
+    if not args.no_source:
+        with open_key_index(args) as index:
+            references = index.references()
+        undefined = set(parity.undefined_keys((ref.key for ref in references), known))
+        report["undefined_source"] = [ref._asdict() for ref in references if ref.key in undefined]
+
+    problems = 0
+    for lang, result in report["languages"].items():
+        print(f"{lang}: {len(result['missing'])} keys missing, {len(result['extra'])} extra (against {SOURCE_LANG})")
+        for ns in result["missing_namespaces"]:
+            print(f"  missing namespace {ns}")
+        for key in result["missing"]:
+            print(f"  missing {key}")
+        for key in result["extra"] if args.verbose else ():
+            print(f"  extra   {key}")
+        problems += len(result["missing"]) + len(result["missing_namespaces"])
+    print(f"RULES: {len(report['undefined_rules'])} keys with no {SOURCE_LANG} entry")
+    for key in report["undefined_rules"]:
+        print(f"  {key}")
+    if not args.no_source:
+        print(f"Source: {len(report['undefined_source'])} references to keys with no {SOURCE_LANG} entry")
+        for ref in report["undefined_source"]:
+            print(f"  {ref['path']}:{ref['line']}:{ref['column']}\t{ref['key']}")
+    problems += len(report["undefined_rules"]) + len(report["undefined_source"])
+
+    if args.output:
+        write_json_atomic(args.output, report, indent=2)
+    if args.dts:
+        # An untouched .d.ts keeps tsc's incremental build info valid
+        if write_text_if_changed(args.dts, parity.render_dts(known)):
+            print(f"Wrote key types {args.dts}")
+    return 1 if problems else 0
+
+
+def cmd_add_keys(args):
+    """Merge new keys into the locale files, one write per namespace"""
+    source = sys.stdin if args.records == "-" else open(args.records, encoding='utf-8')
+    with source:
+        records = [json.loads(line) for line in source if line.strip()]
+
+    entries = {}
+    for record in records:
+        for lang in args.langs:
+            if record.get(lang) is not None:
+                entries.setdefault(lang, {})[record["key"]] = record[lang]
+    try:
+        updates = write_entries(args.locales, entries)
+    except ValueError as e:
+        print(f"add-keys: {e}", file=sys.stderr)
+        return 2
+
+    added = conflicts = 0
+    for update in updates:
+        if update.added:
+            print(f"{update.path}: {len(update.added)} keys added")
+        for key in update.conflicts:
+            print(f"  {update.lang} {key} already has a different value, left as is")
+        added += len(update.added)
+        conflicts += len(update.conflicts)
+    files = sum(1 for update in updates if update.added)
+    print(f"{added} entries added in {files} files, {conflicts} conflicts", file=sys.stderr)
+    return 1 if conflicts else 0
+
+
+def cmd_routes(args):
+    """Map each route in the app to the locale namespaces it reaches"""
+    manifest = routes.build_manifest(args.entry, args.tsconfig)
+    write_json_atomic(args.output, manifest, indent=2)
+
+    sizes = {ns: os.path.getsize(path) for ns, path in namespace_files(args.locales, SOURCE_LANG).items()}
+    total = sum(sizes.values())
+    loads = [sum(sizes.get(ns, 0) for ns in data["namespaces"]) for data in manifest["routes"].values()]
+    average = sum(loads) / len(loads) if loads else 0
+    print(f"{len(manifest['routes'])} routes, {len(manifest['namespaces'])} namespaces used, written to {args.output}")
+    print(f"Average route loads {average / 1024:.1f} KB of {total / 1024:.1f} KB per language ({SOURCE_LANG})")
+
+    if args.loader:
+        code = routes.render_loader(manifest, args.loader, assets_base=args.assets_base)
+        if write_text_if_changed(args.loader, code):
+            print(f"Wrote loader {args.loader}")
+    return 0
+
+
+def cmd_bundle(args):
+    """Write pruned, minified locale bundles for production"""
+    langs = bundles.locale_langs(args.locales)
+    usage = None
+    allowlist = []
+    if not args.no_prune:
+        files = expand_patterns(args.patterns or SOURCE_PATTERNS)
+        known = load_locale(args.locales, SOURCE_LANG)
+        usage = bundles.collect_usage(files, known)
+        allowlist = bundles.load_allowlist(args.allowlist)
+        print(f"Scanned {len(files)} files: {len(usage.used)} keys and {len(usage.prefixes)} key prefixes used")
+
+    result, unused = bundles.build_bundles(args.locales, langs, usage, allowlist, flat=args.flat)
+    manifest = None
+    if args.hashed:
+        manifest = assets.write_assets(args.out, result, compress=not args.no_compress)
+        written = sum(size["bytes"] for size in manifest["sizes"].values())
+    else:
+        written = bundles.write_bundles(args.out, result)
+
+    source = sum(
+        os.path.getsize(path)
+        for lang in langs
+        for path in namespace_files(args.locales, lang).values()
+    )
+    print(f"{len(unused)} unused keys dropped (allowlist: {len(allowlist)} patterns)")
+    print(f"Wrote {args.out}: {written / 1024:.1f} KB ({args.locales}: {source / 1024:.1f} KB)")
+    if manifest is not None and not args.no_compress:
+        compressed = sum(size["gzip"] for size in manifest["sizes"].values())
+        note = "" if assets.brotli else "; no .br files, the brotli module is not installed"
+        print(f"{len(manifest['sizes'])} hashed bundles, {compressed / 1024:.1f} KB gzipped{note}")
+
+    if args.unused:
+        write_json_atomic(args.unused, unused, indent=2)
+        print(f"Unused keys listed in {args.unused}")
+    return 0
+
+
+def cmd_bench(args):
+    """Generate a synthetic TSX corpus and time every stage over it"""
+    locales_dir = None if args.no_locales else args.locales
+    table, _ = build_table(locales_dir=locales_dir)
+
+    with tempfile.TemporaryDirectory(prefix="i18n-bench-") as tmp:
+        out_dir = args.corpus_dir or tmp
+        paths = bench.generate_corpus(
+            out_dir, files=args.files, size_kb=args.size, density=args.density,
+            legacy=args.legacy, seed=args.seed, seed_files=args.seed_files, table=table,
+        )
+        results = bench.run_benchmark(paths, repeat=args.repeat, locales_dir=locales_dir)
+
+    results["params"] = {
+        "files": args.files, "size_kb": args.size, "density": args.density,
+        "legacy": args.legacy, "seed": args.seed, "repeat": args.repeat,
+    }
+
+    print(f"Corpus: {results['files']} files, {results['bytes'] / 1e6:.2f} MB")
+    print(f"{'stage':<12}{'seconds':>10}{'files/s':>12}{'MB/s':>10}")
+    for name, rates in results["stages"].items():
+        print(f"{name:<12}{rates['seconds']:>10.4f}{rates['files_per_sec']:>12.1f}{rates['mb_per_sec']:>10.2f}")
+    print("\nfix rules (seconds per corpus pass):")
+    for name, seconds in sorted(results["rules"].items(), key=lambda item: -item[1]):
+        print(f"  {name:<20}{seconds:>10.4f}")
+    if results["peak_rss_kb"] is not None:
+        print(f"\nPeak RSS: {results['peak_rss_kb'] / 1024:.1f} MB")
+
+    status = 0
+    if args.compare:
+        regressions = bench.compare(results, bench.load_baseline(args.compare), args.threshold)
+        for stage, before, after in regressions:
+            print(f"REGRESSION {stage}: {before:.2f} -> {after:.2f} MB/s")
+        if regressions:
+            status = 1
+        else:
+            print(f"\nNo regressions against {args.compare}")
+    if args.save:
+        bench.save_baseline(args.save, results)
+        print(f"Saved results to {args.save}")
+    return status
+
+
+def add_git_arguments(p):
+    group = p.add_mutually_exclusive_group()
+    group.add_argument("--since", metavar="REF", help="only files changed since the merge base with REF, including uncommitted and untracked ones")
+    group.add_argument("--staged", action="store_true", help="only files staged in the git index")
+
+
+def add_stage_arguments(p, default_help):
+    p.add_argument("patterns", nargs="*", help=f"path globs (default: {default_help})")
+    add_git_arguments(p)
+    p.add_argument("-j", "--jobs", type=int, default=1, help="worker processes, 0 for one per CPU (default: 1)")
+    p.add_argument("--cache", default=DEFAULT_CACHE_PATH, help=f"incremental cache file (default: {DEFAULT_CACHE_PATH})")
+    p.add_argument("--no-cache", action="store_true", help="process every file and leave the cache alone")
+    p.add_argument("-v", "--verbose", action="store_true", help="also list unchanged files")
+    p.add_argument("--no-validate", action="store_true", help="write rewrites even if they unbalance brackets, strings or JSX tags")
+    p.add_argument("--diff", action="store_true", help="print unified diffs to stdout instead of writing files")
+    p.add_argument("--profile", metavar="PATH", help="write per-rule hits and timings and per-file wall time as JSON; implies --no-cache")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="i18n_tools", description=__doc__.strip())
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("translate", help=cmd_translate.__doc__)
+    add_stage_arguments(p, "public, member and component pages")
+    p.add_argument("--fix", action="store_true", help="also run the legacy fixer stage on each file")
+    p.add_argument("--locales", default=DEFAULT_LOCALES_DIR, help=f"locale directory to index (default: {DEFAULT_LOCALES_DIR})")
+    p.add_argument("--no-locales", action="store_true", help="match only the curated RULES table")
+    p.set_defaults(func=cmd_translate)
+
+    p = sub.add_parser("fix", help=cmd_fix.__doc__)
+    add_stage_arguments(p, "src/**/*.tsx and src/**/*.ts")
+    p.set_defaults(func=cmd_fix)
+
+    p = sub.add_parser("batch", help=cmd_batch.__doc__)
+    p.add_argument("roots", nargs="*", help="repository roots to process")
+    p.add_argument("--roots-file", metavar="PATH", help="read more roots from PATH, one per line (# comments allowed)")
+    p.add_argument("--pattern", action="append", help="path glob relative to each root, repeatable (default: public, member and component pages)")
+    p.add_argument("-j", "--jobs", type=int, default=0, help="worker processes shared by all roots, 0 for one per CPU (default: 0)")
+    p.add_argument("--fix", action="store_true", help="also run the legacy fixer stage on each file")
+    p.add_argument("--locales", default=DEFAULT_LOCALES_DIR, help=f"locale directory the shared table is built from (default: {DEFAULT_LOCALES_DIR})")
+    p.add_argument("--no-locales", action="store_true", help="match only the curated RULES table")
+    p.add_argument("--no-validate", action="store_true", help="write rewrites even if they unbalance brackets, strings or JSX tags")
+    p.add_argument("-o", "--report", metavar="PATH", help="write the consolidated JSON report here")
+    p.add_argument("-v", "--verbose", action="store_true", help="list every updated file")
+    p.set_defaults(func=cmd_batch)
+
+    p = sub.add_parser("watch", help=cmd_watch.__doc__)
+    p.add_argument("patterns", nargs="*", help="path globs (default: public, member and component pages)")
+    p.add_argument("--root", default=watch.DEFAULT_ROOT, help=f"directory to watch (default: {watch.DEFAULT_ROOT})")
+    p.add_argument("--debounce", type=float, default=watch.DEFAULT_DEBOUNCE * 1000, help="quiet milliseconds that end a burst of events (default: %(default)g)")
+    p.add_argument("--poll", action="store_true", help="poll file mtimes instead of using inotify")
+    p.add_argument("--interval", type=float, default=watch.DEFAULT_INTERVAL, help="seconds between polls (default: %(default)g)")
+    p.add_argument("--fix", action="store_true", help="also run the legacy fixer stage on each file")
+    p.add_argument("--locales", default=DEFAULT_LOCALES_DIR, help=f"locale directory to build the table from, reloaded when it changes (default: {DEFAULT_LOCALES_DIR})")
+    p.add_argument("--no-locales", action="store_true", help="match only the curated RULES table")
+    p.add_argument("--no-validate", action="store_true", help="write rewrites even if they unbalance brackets, strings or JSX tags")
+    p.set_defaults(func=cmd_watch)
+
+    p = sub.add_parser("serve", help=cmd_serve.__doc__)
+    p.add_argument("--stdio", action="store_true", required=True, help="newline-delimited JSON-RPC 2.0 on stdin/stdout (the only transport)")
+    p.add_argument("--fix", action="store_true", help="also run the legacy fixer stage on each file")
+    p.add_argument("--locales", default=DEFAULT_LOCALES_DIR, help=f"locale directory to build the table from (default: {DEFAULT_LOCALES_DIR})")
+    p.add_argument("--no-locales", action="store_true", help="match only the curated RULES table")
+    p.add_argument("--no-validate", action="store_true", help="return rewrites even if they unbalance brackets, strings or JSX tags")
+    p.set_defaults(func=cmd_serve)
+
+    p = sub.add_parser("scan", help=cmd_scan.__doc__)
+    p.add_argument("patterns", nargs="*", help="path globs (default: src/**/*.tsx and src/**/*.ts)")
+    add_git_arguments(p)
+    p.add_argument("-o", "--output", help="write JSONL here instead of stdout")
+    p.add_argument("--locales", default=DEFAULT_LOCALES_DIR, help=f"locale directory for key suggestions (default: {DEFAULT_LOCALES_DIR})")
+    p.add_argument("--no-locales", action="store_true", help="suggest keys from the curated RULES table only")
+    p.set_defaults(func=cmd_scan)
+
+    p = sub.add_parser("segment", help=cmd_segment.__doc__)
+    p.add_argument("texts", nargs="*", help="Thai strings to segment; write placeholders as ${expr} or {expr}")
+    p.add_argument("--bulk", metavar="JSONL", help="attach a proposal to every unmapped record of a scan output file (- for stdin)")
+    p.add_argument("-o", "--output", help="with --bulk, write JSONL here instead of stdout")
+    p.add_argument("--locales", default=DEFAULT_LOCALES_DIR, help=f"locale directory the phrases come from (default: {DEFAULT_LOCALES_DIR})")
+    p.set_defaults(func=cmd_segment)
+
+    p = sub.add_parser("suggest", help=cmd_suggest.__doc__)
+    p.add_argument("texts", nargs="*", help="Thai text to look up")
+    p.add_argument("--bulk", metavar="JSONL", help="attach matches to every unmapped record of a scan output file (- for stdin)")
+    p.add_argument("-o", "--output", help="with --bulk, write JSONL here instead of stdout")
+    p.add_argument("-k", type=int, default=5, help="suggestions per text (default: 5)")
+    p.add_argument("--min-score", type=float, default=0.3, help="lowest trigram similarity to report, 0-1 (default: 0.3)")
+    p.add_argument("--memory", default=DEFAULT_MEMORY, help=f"translation memory database (default: {DEFAULT_MEMORY})")
+    p.add_argument("--locales", default=DEFAULT_LOCALES_DIR, help=f"locale directory the memory is built from (default: {DEFAULT_LOCALES_DIR})")
+    p.set_defaults(func=cmd_suggest)
+
+    for name, func, target, target_help in (
+        ("who-uses", cmd_who_uses, "keys", "ns:key to look up"),
+        ("keys-in", cmd_keys_in, "files", "source files to list"),
+    ):
+        p = sub.add_parser(name, help=func.__doc__)
+        p.add_argument(target, nargs="+", help=target_help)
+        p.add_argument("--index", default=DEFAULT_KEY_INDEX, help=f"key-usage database (default: {DEFAULT_KEY_INDEX})")
+        p.add_argument("--pattern", action="append", help="path glob to index, repeatable (default: src/**/*.tsx and src/**/*.ts)")
+        p.add_argument("--locales", default=DEFAULT_LOCALES_DIR, help=f"locale directory for namespaces and missing keys (default: {DEFAULT_LOCALES_DIR})")
+        p.set_defaults(func=func)
+
+    p = sub.add_parser("parity", help=cmd_parity.__doc__)
+    p.add_argument("--langs", nargs="+", help="languages to compare with th (default: every directory under --locales)")
+    p.add_argument("--locales", default=DEFAULT_LOCALES_DIR, help=f"locale directory (default: {DEFAULT_LOCALES_DIR})")
+    p.add_argument("--dts", nargs="?", const=parity.DEFAULT_DTS, metavar="PATH", help=f"also write key literal types, only when they change (default path: {parity.DEFAULT_DTS})")
+    p.add_argument("--no-source", action="store_true", help="skip checking the keys the source references")
+    p.add_argument("--index", default=DEFAULT_KEY_INDEX, help=f"key-usage database (default: {DEFAULT_KEY_INDEX})")
+    p.add_argument("--pattern", action="append", help="path glob to check, repeatable (default: src/**/*.tsx and src/**/*.ts)")
+    p.add_argument("-o", "--output", help="write the full report as JSON")
+    p.add_argument("-v", "--verbose", action="store_true", help="also list the extra keys of each language")
+    p.set_defaults(func=cmd_parity)
+
+    p = sub.add_parser("add-keys", help=cmd_add_keys.__doc__)
+    p.add_argument("records", help='JSONL of {"key": "ns:path", "th": ..., "en": ...} records (- for stdin)')
+    p.add_argument("--langs", nargs="+", default=[SOURCE_LANG, "en"], help=f"record fields to write, one per language (default: {SOURCE_LANG} en)")
+    p.add_argument("--locales", default=DEFAULT_LOCALES_DIR, help=f"locale directory (default: {DEFAULT_LOCALES_DIR})")
+    p.set_defaults(func=cmd_add_keys)
+
+    p = sub.add_parser("check", help=cmd_check.__doc__)
+    p.add_argument("patterns", nargs="*", help="path globs (default: src/**/*.tsx src/**/*.ts)")
+    add_git_arguments(p)
+    p.add_argument("-v", "--verbose", action="store_true", help="list every problem, not just the first per file")
+    p.set_defaults(func=cmd_check)
+
+    p = sub.add_parser("routes", help=cmd_routes.__doc__)
+    p.add_argument("--entry", default=routes.DEFAULT_ENTRY, help=f"module holding the <Routes> tree (default: {routes.DEFAULT_ENTRY})")
+    p.add_argument("--tsconfig", default=routes.DEFAULT_TSCONFIG, help=f"path aliases come from here (default: {routes.DEFAULT_TSCONFIG})")
+    p.add_argument("-o", "--output", default=routes.DEFAULT_MANIFEST, help=f"manifest file (default: {routes.DEFAULT_MANIFEST})")
+    p.add_argument("--loader", metavar="PATH", help="also generate a TypeScript loader module, e.g. src/i18nRoutes.ts")
+    p.add_argument("--assets-base", default=routes.DEFAULT_ASSETS_BASE, help=f"URL of the hashed bundles for the loader (default: {routes.DEFAULT_ASSETS_BASE})")
+    p.add_argument("--locales", default=DEFAULT_LOCALES_DIR, help=f"locale directory, for the size summary (default: {DEFAULT_LOCALES_DIR})")
+    p.set_defaults(func=cmd_routes)
+
+    p = sub.add_parser("bundle", help=cmd_bundle.__doc__)
+    p.add_argument("patterns", nargs="*", help="source globs scanned for used keys (default: src/**/*.tsx src/**/*.ts)")
+    p.add_argument("--locales", default=DEFAULT_LOCALES_DIR, help=f"locale directory (default: {DEFAULT_LOCALES_DIR})")
+    p.add_argument("--out", default=bundles.DEFAULT_BUNDLE_DIR, help=f"output directory (default: {bundles.DEFAULT_BUNDLE_DIR})")
+    p.add_argument("--allowlist", default=bundles.DEFAULT_ALLOWLIST, help=f"fnmatch patterns of keys to always keep (default: {bundles.DEFAULT_ALLOWLIST})")
+    p.add_argument("--flat", action="store_true", help="write flat {\"a.b\": text} bundles; needs keySeparator: false in i18next")
+    p.add_argument("--no-prune", action="store_true", help="keep every key, only minify")
+    p.add_argument("--unused", metavar="PATH", help="also write the dropped keys as a JSON list")
+    p.add_argument("--hashed", action="store_true", help="write locale.<lang>.<ns>.<hash>.json assets with .gz/.br siblings and manifest.json")
+    p.add_argument("--no-compress", action="store_true", help="with --hashed, skip the .gz/.br siblings")
+    p.set_defaults(func=cmd_bundle)
+
+    p = sub.add_parser("bench", help=cmd_bench.__doc__)
+    p.add_argument("--files", type=int, default=200, help="pages to generate (default: 200)")
+    p.add_argument("--size", type=int, default=20, help="approximate page size in KB (default: 20)")
+    p.add_argument("--density", type=float, default=0.3, help="share of text nodes that are Thai (default: 0.3)")
+    p.add_argument("--legacy", type=float, default=0.05, help="share of pages with old-script leftovers (default: 0.05)")
+    p.add_argument("--seed", type=int, default=1, help="random seed (default: 1)")
+    p.add_argument("--seed-files", nargs="+", help="pages to harvest patterns from (default: src/pages/member/*.tsx)")
+    p.add_argument("--repeat", type=int, default=3, help="runs per stage, best is kept (default: 3)")
+    p.add_argument("--corpus-dir", help="keep the generated corpus here instead of a temp dir")
+    p.add_argument("--save", nargs="?", const=bench.DEFAULT_BASELINE, help=f"save results as a baseline (default: {bench.DEFAULT_BASELINE})")
+    p.add_argument("--compare", nargs="?", const=bench.DEFAULT_BASELINE, help="fail if a stage is slower than this baseline")
+    p.add_argument("--threshold", type=float, default=0.10, help="allowed slowdown before failing (default: 0.10)")
+    p.add_argument("--locales", default=DEFAULT_LOCALES_DIR, help=f"locale directory (default: {DEFAULT_LOCALES_DIR})")
+    p.add_argument("--no-locales", action="store_true", help="use only the curated RULES table")
+    p.set_defaults(func=cmd_bench)
+
+    p = sub.add_parser("index", help=cmd_index.__doc__)
+    p.add_argument("--locales", default=DEFAULT_LOCALES_DIR, help=f"locale directory (default: {DEFAULT_LOCALES_DIR})")
+    p.add_argument("--lang", default=SOURCE_LANG, help=f"language to index (default: {SOURCE_LANG})")
+    p.add_argument("--cache", default=DEFAULT_INDEX_CACHE, help=f"index cache file (default: {DEFAULT_INDEX_CACHE})")
+    p.add_argument("-v", "--verbose", action="store_true", help="list every shared text")
+    p.set_defaults(func=cmd_index)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        return args.func(args)
+    except (RuleConflictError, UndefinedRuleKeyError, GitError) as e:
+        print(e, file=sys.stderr)
+        return 2
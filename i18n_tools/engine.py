@@ -0,0 +1,200 @@
+"""
+Codemod engine: one read, one rewrite and at most one write per file
+"""
+import glob
+import hashlib
+import json
+import os
+import time
+
+from .fileio import write_text_atomic
+from .fixer import FIX_RULES, Fixer
+from .locales import THAI_RE, LocaleIndex
+from .matcher import TranslationMatcher
+from .patch import diff_edits, unified_diff
+from .prefilter import markers
+from .parity import undefined_keys
+from .rules import RULES, UndefinedRuleKeyError, compile_rules
+from .validate import check_rewrite
+
+# Every page and component the old per-folder scripts covered, admin excluded
+DEFAULT_PATTERNS = [
+    "src/pages/*.tsx",
+    "src/pages/auth/*.tsx",
+    "src/pages/games/*.tsx",
+    "src/pages/lottery/*.tsx",
+    "src/pages/member/*.tsx",
+    "src/pages/profile/*.tsx",
+    "src/pages/promotions/*.tsx",
+    "src/pages/transactions/*.tsx",
+    "src/components/**/*.tsx",
+]
+
+# Every source file; the fixer and the scanners also cover plain .ts
+SOURCE_PATTERNS = [
+    "src/**/*.tsx",
+    "src/**/*.ts",
+]
+
+# Bump whenever a change to this module alters what process() emits, so
+# cached results from older runs are invalidated
+ENGINE_VERSION = 9
+
+def build_table(rules=RULES, locales_dir=None):
+    """Return (table, locale_index): locale reverse index with rules filling its gaps
+
+    A rule applies only to a text the index lacks or shares between
+    several keys; an exact, unique locale match is never overridden. A
+    rule key no locale defines raises UndefinedRuleKeyError.
+    """
+    locales = None
+    overrides = compile_rules(rules)
+    table = {}
+    if locales_dir and os.path.isdir(locales_dir):
+        locales = LocaleIndex.load(locales_dir)
+        undefined = set(undefined_keys(overrides.values(), locales.entries))
+        if undefined:
+            raise UndefinedRuleKeyError({text: key for text, key in overrides.items() if key in undefined})
+        table.update(locales.index)
+        overrides = {
+            text: key for text, key in overrides.items()
+            if text not in table or text in locales.collisions
+        }
+    table.update(overrides)
+    return table, locales
+
+
+def expand_patterns(patterns):
+    """Expand path globs into a de-duplicated file list, keeping first-seen order"""
+    files = []
+    seen = set()
+    for pattern in patterns:
+        for filepath in sorted(glob.glob(pattern, recursive=True)):
+            if filepath not in seen:
+                seen.add(filepath)
+                files.append(filepath)
+    return files
+
+
+class Engine:
+    """Holds the compiled rule tables; build once and reuse for every file
+
+    translate and fix select the stages: translate rewrites Thai text to
+    t() calls, fix runs the fused brace/syntax fixer on the result. The
+    translator already emits the right t() form for each context, so the
+    fixer is only needed for trees produced by the old scripts.
+
+    With locales_dir the table is the Thai reverse index of every locale
+    key, with RULES picking among keys that share a text and adding
+    variants the locales lack (see build_table).
+    """
+
+    def __init__(self, rules=RULES, fix_rules=FIX_RULES, translate=True, fix=False, locales_dir=None, validate=True):
+        self.table, self.locales = build_table(rules, locales_dir)
+        self.matcher = TranslationMatcher(self.table)
+        self.fixer = Fixer(fix_rules)
+        self.translate = translate
+        self.fix = fix
+        self.validate = validate
+        # Every text the translator can match contains Thai, so a file
+        # without Thai bytes has nothing for it (true unless custom rules
+        # add ASCII texts)
+        self.thai_only = all(THAI_RE.search(text) for text in self.table)
+        self.fingerprint = self._fingerprint()
+
+    def _fingerprint(self):
+        """Hash of everything that decides the output: rules, stages and engine version"""
+        payload = json.dumps(
+            [
+                ENGINE_VERSION,
+                sorted(self.table.items()) if self.translate else None,
+                self.fixer.signature() if self.fix else None,
+            ],
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def process(self, content, filepath, stats=None):
+        """Return (new_content, changed) for one file's content
+
+        stats, when given, is a profile.new_stats() dict that collects
+        rule hits and stage times for this file.
+        """
+        if stats is not None:
+            return self._process_profiled(content, filepath, stats)
+
+        original = content
+        if self._translates(content):
+            content, _ = self.matcher.translate_text(content, jsx=filepath.endswith('.tsx'))
+        if self.fix:
+            content, _ = self.fixer.fix(content, jsx=filepath.endswith('.tsx'))
+        return content, content != original
+
+    def _process_profiled(self, content, filepath, stats):
+        original = content
+        if self._translates(content):
+            started = time.perf_counter()
+            content, _ = self.matcher.translate_text(
+                content, jsx=filepath.endswith('.tsx'), hits=stats["translate"],
+            )
+            stats["stages"]["translate"] = time.perf_counter() - started
+        if self.fix:
+            started = time.perf_counter()
+            content, _ = self.fixer.fix(content, hits=stats["fix"], jsx=filepath.endswith('.tsx'))
+            stats["stages"]["fix"] = time.perf_counter() - started
+        return content, content != original
+
+    def _translates(self, content):
+        return self.translate and (not self.thai_only or THAI_RE.search(content) is not None)
+
+    def needs_file(self, filepath):
+        """False when the file's raw bytes show that no enabled stage can change it"""
+        if self.translate and not self.thai_only:
+            return True
+        has_thai, has_t_call = markers(filepath)
+        return (self.translate and has_thai) or (self.fix and has_t_call)
+
+    def _prefilter(self, filepath, stats):
+        if stats is None:
+            return self.needs_file(filepath)
+        started = time.perf_counter()
+        needed = self.needs_file(filepath)
+        stats["stages"]["prefilter"] = time.perf_counter() - started
+        return needed
+
+    def _read_and_process(self, filepath, stats):
+        # newline='' keeps CRLF files byte-for-byte outside the edited ranges
+        with open(filepath, 'r', encoding='utf-8', newline='') as f:
+            original = f.read()
+
+        content, _ = self.process(original, filepath, stats)
+        if stats is not None:
+            stats["bytes"] = len(original.encode('utf-8'))
+        if self.validate and content != original:
+            check_rewrite(filepath, original, content)
+        return original, content
+
+    def process_file(self, filepath, stats=None):
+        """Rewrite a single file in place and return its edits, [] when unchanged
+
+        Only files with edits are written, through a temp file renamed into
+        place, so untouched files keep their mtime and a crash never leaves
+        half a file behind. With validate, a rewrite that unbalances the
+        file raises ValidationError and the file keeps its original content.
+        A file that changed on disk since it was read raises
+        PatchConflictError and keeps the newer content.
+        """
+        if not self._prefilter(filepath, stats):
+            return []
+        original, content = self._read_and_process(filepath, stats)
+        if content == original:
+            return []
+        write_text_atomic(filepath, content, expected=original)
+        return diff_edits(original, content)
+
+    def diff_file(self, filepath, stats=None):
+        """Return the unified diff process_file() would apply, without writing"""
+        if not self._prefilter(filepath, stats):
+            return ""
+        original, content = self._read_and_process(filepath, stats)
+        return unified_diff(filepath, original, content)
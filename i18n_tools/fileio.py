@@ -0,0 +1,75 @@
+"""
+File helpers shared by the engine stages
+"""
+import json
+import os
+import tempfile
+
+from .patch import PatchConflictError
+
+
+def _target_mode(path):
+    """Mode for a file written over path: keep the old one, else what open() would give"""
+    try:
+        return os.stat(path).st_mode & 0o7777
+    except OSError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def _write_atomic(path, write, expected=None):
+    """Call write(f) on a temp file next to path, then rename it into place"""
+    directory = os.path.dirname(os.path.abspath(path))
+    mode = _target_mode(path)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    try:
+        # mkstemp creates 0600; bundles, locale and source files must keep their mode
+        os.chmod(tmp_path, mode)
+        with os.fdopen(fd, 'w', encoding='utf-8', newline='') as f:
+            write(f)
+        if expected is not None:
+            _check_unchanged(path, expected)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def _check_unchanged(path, expected):
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        if f.read() != expected:
+            raise PatchConflictError(f"{path} changed on disk while it was being processed")
+
+
+def write_json_atomic(path, data, **dump_kwargs):
+    """Write JSON to a temp file next to path and rename it into place"""
+    _write_atomic(path, lambda f: json.dump(data, f, ensure_ascii=False, **dump_kwargs))
+
+
+def write_text_atomic(path, text, expected=None):
+    """Write text as-is (no newline translation) through a temp file and rename
+
+    With expected, the file is read again just before the rename and the
+    write is refused with PatchConflictError unless it still holds
+    expected, so an edit saved while a run was processing the file wins.
+    """
+    _write_atomic(path, lambda f: f.write(text), expected)
+
+
+def write_text_if_changed(path, text):
+    """write_text_atomic() unless path already holds exactly text; return True if written
+
+    Generated modules keep their mtime when nothing changed, so Vite and
+    tsc incremental builds do not pick them up again.
+    """
+    try:
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            if f.read() == text:
+                return False
+    except (OSError, UnicodeDecodeError):
+        pass
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    write_text_atomic(path, text)
+    return True
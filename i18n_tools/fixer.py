@@ -0,0 +1,172 @@
+"""
+Fused fix-up stage for translator output
+
+Replaces fix_t_syntax.py, fix_all_braces.py, fix_all_errors.sh and
+final_fix.sh: their rewrite rules run in that order on the in-memory
+content, repeated until nothing changes.
+"""
+import re
+import time
+from collections import namedtuple
+
+from .lexer import Lexer
+from .profile import record
+
+FixRule = namedtuple("FixRule", "name pattern replacement guard")
+
+# Stop looping if the rules have not settled after this many passes
+MAX_PASSES = 10
+
+
+def stray_close_brace(content, match, jsx=True):
+    """True when the line up to the match closes more braces than it opens
+
+    The brace-stripping rules used to fire on valid code such as
+    title={t("key")} or {a ? b : t("key")}; only an unbalanced } is stray.
+    """
+    line_start = content.rfind('\n', 0, match.start()) + 1
+    segment = content[line_start:match.end()]
+    return segment.count('}') > segment.count('{')
+
+
+class _BraceLexer(Lexer):
+    """Lexer that records the offset of every { it reads as code
+
+    The { of a JSX attribute or child expression container and the ${ of
+    a template are read by the JSX and template states, so they are not
+    among them.
+    """
+
+    def __init__(self, source, jsx):
+        super().__init__(source, jsx)
+        self.braces = set()
+
+    def _code(self):
+        start = self.pos
+        yield from super()._code()
+        if self.pos == start + 1 and self.src[start] == "{":
+            self.braces.add(start)
+
+
+# (content, jsx, braces) of the last content code_brace() lexed; every
+# match of one rule pass sees the same content
+_lexed = (None, None, None)
+
+
+def code_brace(content, match, jsx=True):
+    """True when the { of the {t( that ends the match is a brace in code
+
+    As in { name: {t("key")} } or {a ? b : {t("key")}}, where the braces
+    cannot stay. In JSX text, as in <p>label: {t("key")}</p>, the {
+    opens an expression container and must stay.
+    """
+    global _lexed
+    if _lexed[0] is not content or _lexed[1] != jsx:
+        lexer = _BraceLexer(content, jsx)
+        for _ in lexer.run():
+            pass
+        _lexed = (content, jsx, lexer.braces)
+    return match.end() - 3 in _lexed[2]
+
+
+def _rule(name, pattern, replacement, guard=None, flags=0):
+    return FixRule(name, re.compile(pattern, flags), replacement, guard)
+
+
+FIX_RULES = [
+    # fix_t_syntax.py
+    # These only strip the { of a {t( that the lexer reads as code
+    # { name: {t("key")} } -> { name: t("key") }
+    _rule("object-value", r':\s*\{t\(', ': t(', code_brace),
+    # {isLoading ? 'text' : {t("key")}} -> {isLoading ? 'text' : t("key")}
+    # on one line, and never from the ? of ?. or ??
+    _rule("ternary", r'\?(?![.?])\s*([^:?\n]+?)\s*:\s*\{t\(', r'? \1 : t(', code_brace),
+    _rule("ternary-named", r'(\w+)\s*\?(?![.?])\s*([^:?\n]+?)\s*:\s*\{t\(', r'\1 ? \2 : t(', code_brace),
+    # text: {t("key")} -> text: t("key")
+    _rule("data-field", r'(text|label|name):\s*\{t\(', r'\1: t(', code_brace),
+
+    # fix_all_braces.py
+    # toast.error({t("key")}) -> toast.error(t("key"))
+    _rule("call-arg", r'\(([\w.]+)\(\{t\(', r'(\1(t(', code_brace),
+    # label: t("key")} } -> label: t("key") }
+    _rule("double-close", r't\("([^"]+)"\)\}\s*\}', r't("\1") }', stray_close_brace),
+    # label: t("key")} }, -> label: t("key") },
+    _rule("double-close-comma", r't\("([^"]+)"\)\}\s*\},', r't("\1") },', stray_close_brace),
+    # ? 'text' : t("key")}} -> ? 'text' : t("key")}
+    _rule("double-brace", r't\("([^"]+)"\)\}\}', r't("\1")}', stray_close_brace),
+    _rule("trailing-brace", r't\("([^"]+)"\)\}([,\s])', r't("\1")\2', stray_close_brace),
+
+    # fix_all_errors.sh
+    _rule("toast-arg", r'toast\.(error|success|info|warning)\(\{t\(', r'toast.\1(t(', code_brace),
+    # toast.error(t("key")}) -> toast.error(t("key")), the sed rule only caught "}))"
+    _rule("call-close", r't\("([^"]*)"\)\}\)', r't("\1"))', stray_close_brace),
+
+    # final_fix.sh
+    # alt={t("key") className -> alt={t("key")} className
+    _rule("alt-close", r'alt=\{t\(("[^"]*")\) className', r'alt={t(\1)} className'),
+    _rule("placeholder-close", r'placeholder=\{t\(("[^"]*")\)$', r'placeholder={t(\1)}', flags=re.MULTILINE),
+    _rule("title-close", r'title=\{t\(("[^"]*")\)$', r'title={t(\1)}', flags=re.MULTILINE),
+]
+
+
+def apply_rule(rule, content, jsx=True):
+    """Apply one FixRule, honouring its guard"""
+    if rule.guard is None:
+        return rule.pattern.sub(rule.replacement, content)
+
+    def replace(match):
+        if rule.guard(content, match, jsx):
+            return match.expand(rule.replacement)
+        return match.group(0)
+
+    return rule.pattern.sub(replace, content)
+
+
+def _apply_counted(rule, content, jsx=True):
+    """apply_rule() that also returns (matches, bytes rewritten)"""
+    matches = nbytes = 0
+
+    def replace(match):
+        nonlocal matches, nbytes
+        if rule.guard is not None and not rule.guard(content, match, jsx):
+            return match.group(0)
+        matches += 1
+        nbytes += match.end() - match.start()
+        return match.expand(rule.replacement)
+
+    return rule.pattern.sub(replace, content), matches, nbytes
+
+
+class Fixer:
+    """Applies FIX_RULES in order until the content reaches a fixed point"""
+
+    def __init__(self, rules=FIX_RULES):
+        self.rules = list(rules)
+
+    def signature(self):
+        """Stable description of the rules, used in the engine fingerprint"""
+        return [[rule.name, rule.pattern.pattern, rule.replacement] for rule in self.rules]
+
+    def fix(self, content, hits=None, jsx=True):
+        """Return (new_content, changed)
+
+        hits, when given, is a profile bucket that gets matches, bytes
+        rewritten and time for every rule, summed over all passes. jsx
+        is False for plain .ts, where < never starts a tag.
+        """
+        if 't(' not in content:
+            return content, False
+
+        original = content
+        for _ in range(MAX_PASSES):
+            previous = content
+            for rule in self.rules:
+                if hits is None:
+                    content = apply_rule(rule, content, jsx)
+                    continue
+                started = time.perf_counter()
+                content, matches, nbytes = _apply_counted(rule, content, jsx)
+                record(hits, rule.name, matches, nbytes, time.perf_counter() - started)
+            if content == previous:
+                break
+        return content, content != original
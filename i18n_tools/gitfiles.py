@@ -0,0 +1,85 @@
+"""
+Changed-file lists from git, for pre-commit hooks and feature-branch CI
+
+Instead of globbing the whole tree, ask git which files differ and keep
+the ones that match the command's path globs.
+"""
+import os
+import re
+import subprocess
+
+
+class GitError(RuntimeError):
+    """git is missing, this is not a work tree, or the ref does not resolve"""
+
+
+def _git(*args, cwd=None):
+    try:
+        result = subprocess.run(
+            ["git", *args], cwd=cwd, capture_output=True, check=True,
+        )
+    except FileNotFoundError:
+        raise GitError("git is not installed") from None
+    except subprocess.CalledProcessError as e:
+        raise GitError(e.stderr.decode('utf-8', 'replace').strip() or f"git {args[0]} failed") from None
+    return result.stdout.decode('utf-8')
+
+
+def _paths(output):
+    return [path for path in output.split("\0") if path]
+
+
+def changed_files(since=None, staged=False, cwd=None):
+    """Return paths (relative to cwd) added, copied, modified or renamed
+
+    staged: what the index holds against HEAD, as a pre-commit hook sees it.
+    since: everything that differs from the merge base of ref and HEAD,
+    committed, staged, unstaged or untracked, as a feature branch sees it.
+    """
+    diff = ["diff", "--name-only", "--relative", "--diff-filter=ACMR", "-z"]
+    if staged:
+        return _paths(_git(*diff, "--cached", cwd=cwd))
+
+    base = _git("merge-base", since, "HEAD", cwd=cwd).strip()
+    files = _paths(_git(*diff, base, cwd=cwd))
+    untracked = _paths(_git("ls-files", "--others", "--exclude-standard", "-z", cwd=cwd))
+    seen = set(files)
+    return files + [path for path in untracked if path not in seen]
+
+
+def glob_regex(pattern):
+    """Compile a glob.glob(recursive=True) pattern into a regex over relative paths"""
+    pattern = os.path.normpath(pattern).replace(os.sep, "/")
+    parts = []
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith("**/", i):
+            parts.append("(?:[^/]+/)*")
+            i += 3
+        elif pattern.startswith("**", i):
+            parts.append(".*")
+            i += 2
+        elif pattern[i] == "*":
+            parts.append("[^/]*")
+            i += 1
+        elif pattern[i] == "?":
+            parts.append("[^/]")
+            i += 1
+        else:
+            parts.append(re.escape(pattern[i]))
+            i += 1
+    return re.compile("".join(parts) + r"\Z")
+
+
+def filter_patterns(files, patterns):
+    """Keep files that match any pattern and still exist, in pattern order like expand_patterns()"""
+    regexes = [glob_regex(pattern) for pattern in patterns]
+    selected = []
+    seen = set()
+    for regex in regexes:
+        for path in sorted(files):
+            normalized = os.path.normpath(path).replace(os.sep, "/")
+            if path not in seen and regex.match(normalized) and os.path.isfile(path):
+                seen.add(path)
+                selected.append(path)
+    return selected
@@ -0,0 +1,120 @@
+"""
+useTranslation() hooks for the components the translator rewrites
+
+Every t() the matcher emits sits in the body of a top-level function,
+which the lexer records as a Scope. A component (Name) or custom hook
+(useName) gets `const { t } = useTranslation()` as its first statement
+unless its body already destructures t from the hook; a concise arrow
+body, () => (...), is turned into a block for it. Any other function
+(formatters, module-level helpers, anonymous default exports) cannot
+call a hook, so literals there are left alone, as are literals where t
+is a parameter or local of a nested function. The import goes after the
+last import, only when a hook is added.
+"""
+import re
+
+from .lexer import EXPRESSION, TEMPLATE, TEMPLATE_CHUNK, iter_strings
+from .textutil import T_CALL_BEFORE, LineIndex
+from .validate import Problem
+
+HOOK = "const { t } = useTranslation()"
+IMPORT = "import { useTranslation } from 'react-i18next'"
+
+# React only allows hooks in components and in other hooks
+_HOOK_HOLDER = re.compile(r'^(?:[A-Z]|use[A-Z0-9])')
+_T_FROM_HOOK = re.compile(r'\{(?:[^{}]*,)?\s*t\s*(?:,[^{}]*)?\}\s*=\s*useTranslation\(')
+_IMPORTED = re.compile(r'''^import\s[^;'"]*\buseTranslation\b[^;'"]*\bfrom\s*['"]react-i18next['"]''', re.MULTILINE)
+_IMPORT_STATEMENT = re.compile(r'''^import\s(?:[^;'"]*?\bfrom\s*)?['"][^'"\n]*['"][ \t]*;?''', re.MULTILINE)
+_INDENT = re.compile(r'[ \t]*')
+# Code, not a line comment, on the rest of a line
+_CODE_AFTER = re.compile(r'[ \t]*(?!//)([^\s])')
+
+
+def can_hold_hook(scope):
+    """True for the body of a named component or hook that the lexer saw close
+
+    An unclosed scope means the file is unbalanced, so where the function
+    ends is unknown.
+    """
+    return (
+        scope is not None and scope.end is not None
+        and scope.name is not None and _HOOK_HOLDER.match(scope.name) is not None
+    )
+
+
+def has_hook(content, scope):
+    """True when scope's body already takes t from useTranslation()"""
+    return _T_FROM_HOOK.search(content, scope.start, scope.end) is not None
+
+
+def _line_indent(content, offset):
+    return _INDENT.match(content, content.rfind("\n", 0, offset) + 1).group()
+
+
+def hook_edits(content, scopes):
+    """Return [(start, end, replacement)] adding the hook and its import where missing
+
+    scopes are the ones that receive a t() call; each must pass
+    can_hold_hook().
+    """
+    edits = []
+    for scope in scopes:
+        if has_hook(content, scope):
+            continue
+        indent = _line_indent(content, scope.start)
+        if scope.block:
+            hook = f"\n{indent}  {HOOK}"
+            end = scope.start + 1
+            # { toast.error(...) } on one line: the code after the hook
+            # moves to a line of its own
+            code = _CODE_AFTER.match(content, end)
+            if code is not None:
+                hook += f"\n{indent}  "
+                end = code.start(1)
+            edits.append((scope.start + 1, end, hook))
+        else:
+            edits.append((scope.start, scope.start + 1, f"{{\n{indent}  {HOOK}\n{indent}  return ("))
+            edits.append((scope.end + 1, scope.end + 1, f"\n{indent}}}"))
+    if edits and not _IMPORTED.search(content):
+        imports = list(_IMPORT_STATEMENT.finditer(content))
+        if imports:
+            edits.append((imports[-1].end(), imports[-1].end(), f"\n{IMPORT}"))
+        else:
+            edits.append((0, 0, f"{IMPORT}\n\n"))
+    return sorted(edits)
+
+
+def check_hooks(source, jsx=True):
+    """Return [Problem(line, column, message)] for t("...") calls with no t in scope"""
+    calls = []
+    for token in iter_strings(source, jsx):
+        if token.kind not in (EXPRESSION, TEMPLATE, TEMPLATE_CHUNK):
+            continue
+        start = token.start - 1 if token.kind == TEMPLATE_CHUNK else token.start
+        call = T_CALL_BEFORE.search(source, max(0, start - 16), start)
+        # i18n.t("...") and $t("...") are not the hook's t
+        if call is not None and source[call.start() - 1:call.start()] not in (".", "$"):
+            calls.append((call.start(), token.scope))
+
+    # Scopes are complete only once the whole source is lexed
+    problems = []
+    hooked = {}
+    for offset, scope in calls:
+        if scope is None:
+            message = "t() outside any component"
+        elif scope.end is None:
+            continue  # unbalanced file, reported by check_balance
+        elif scope.shadowed(offset):
+            message = "t() where t is a parameter or local, not the translate function"
+        elif not can_hold_hook(scope):
+            message = f"t() in {scope.name or 'an anonymous function'}, which cannot call useTranslation()"
+        else:
+            if scope not in hooked:
+                hooked[scope] = has_hook(source, scope)
+            if hooked[scope]:
+                continue
+            message = f"t() in {scope.name} without const {{ t }} = useTranslation()"
+        problems.append((offset, message))
+
+    lines = LineIndex(source)
+    return [Problem(*lines.locate(offset), message) for offset, message in problems]
@@ -0,0 +1,214 @@
+"""
+Persistent key-usage index: where each locale key is referenced
+
+Every t("ns:key") call, unprefixed t("key") resolved through the
+useTranslation() namespace of its component, bare "ns:key" literal (nameKey tables) and
+`ns:path.${x}` template prefix is stored with its file, line and column
+in SQLite. Files are re-read only when their size/mtime and then their
+hash change, so keeping the index current costs a stat per file, and a
+who-uses query is one indexed lookup.
+"""
+import os
+import re
+import sqlite3
+from collections import namedtuple
+
+from .cache import hash_bytes
+from .lexer import EXPRESSION, JSX_ATTR, TEMPLATE, TEMPLATE_CHUNK, iter_strings
+from .routes import DEFAULT_NAMESPACE
+from .textutil import KEY_PREFIX_SHAPE, PLURAL_SUFFIX, T_CALL_BEFORE, HookNamespaces, LineIndex
+
+DEFAULT_KEY_INDEX = ".i18n-keys.sqlite"
+
+# Bump when the schema or what extract() records changes
+KEY_INDEX_VERSION = 2
+
+# How a reference names its key
+CALL = "call"        # t("ns:key") or t("key") with the hook's namespace
+LITERAL = "literal"  # "ns:key" anywhere else in code
+PREFIX = "prefix"    # `ns:path.${x}` or 'ns:path.' + x: every key below it
+
+Reference = namedtuple("Reference", "key path line column kind")
+
+_KEY_SHAPE = re.compile(r'^[\w-]+:[\w.-]*\w$')
+
+_SCHEMA = """
+CREATE TABLE meta (name TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE files (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    sha256 TEXT NOT NULL
+);
+CREATE TABLE refs (
+    key TEXT NOT NULL,
+    file INTEGER NOT NULL REFERENCES files(id),
+    line INTEGER NOT NULL,
+    col INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    PRIMARY KEY (key, file, line, col)
+) WITHOUT ROWID;
+CREATE INDEX refs_file ON refs (file, line, col);
+"""
+
+
+def extract(content, jsx=True, namespaces=None):
+    """Yield (key, offset, kind) for every key reference in one file's content
+
+    namespaces, when given, limits bare literals to the locale namespaces
+    so "http://x" or "10:30" are not taken for keys.
+    """
+    hooks = HookNamespaces(content, DEFAULT_NAMESPACE)
+
+    for token in iter_strings(content, jsx):
+        value = token.value
+        if token.kind == TEMPLATE_CHUNK:
+            if KEY_PREFIX_SHAPE.match(value) and content[token.start - 1] == "`":
+                yield value, token.start - 1, PREFIX
+            continue
+        if token.kind not in (EXPRESSION, JSX_ATTR, TEMPLATE):
+            continue
+        call = T_CALL_BEFORE.search(content, max(0, token.start - 16), token.start)
+        if call is not None:
+            key = value if ":" in value else f"{hooks.namespace(token.start, token.scope)}:{value}"
+            yield key, call.start(), CALL
+        elif namespaces is None or value.split(":", 1)[0] in namespaces:
+            if KEY_PREFIX_SHAPE.match(value):
+                yield value, token.start, PREFIX
+            elif _KEY_SHAPE.match(value):
+                yield value, token.start, LITERAL
+
+
+class KeyIndex:
+    """SQLite-backed map of ns:key -> [Reference], kept current by update()"""
+
+    def __init__(self, path=DEFAULT_KEY_INDEX, namespaces=None):
+        self.path = path
+        self.namespaces = set(namespaces) if namespaces is not None else None
+        self.db = sqlite3.connect(path)
+        self.db.execute("PRAGMA journal_mode = WAL")
+        self._ensure_schema()
+
+    def _ensure_schema(self):
+        stamp = f"{KEY_INDEX_VERSION}:{sorted(self.namespaces) if self.namespaces is not None else None}"
+        try:
+            row = self.db.execute("SELECT value FROM meta WHERE name = 'version'").fetchone()
+        except sqlite3.OperationalError:
+            row = None
+        if row and row[0] == stamp:
+            return
+        with self.db:
+            self.db.executescript("DROP TABLE IF EXISTS refs; DROP TABLE IF EXISTS files; DROP TABLE IF EXISTS meta;")
+            self.db.executescript(_SCHEMA)
+            self.db.execute("INSERT INTO meta (name, value) VALUES ('version', ?)", (stamp,))
+
+    def update(self, files):
+        """Bring the index in line with files; return (reindexed, removed) counts
+
+        Files missing from the list are dropped. A file whose size and
+        mtime match is skipped without reading; a touched file whose hash
+        still matches only gets its mtime refreshed.
+        """
+        stored = {
+            path: (file_id, size, mtime_ns, sha256)
+            for file_id, path, size, mtime_ns, sha256 in self.db.execute(
+                "SELECT id, path, size, mtime_ns, sha256 FROM files"
+            )
+        }
+        reindexed = 0
+        with self.db:
+            for path in files:
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                entry = stored.get(path)
+                if entry is not None and entry[1] == st.st_size and entry[2] == st.st_mtime_ns:
+                    continue
+                try:
+                    with open(path, 'rb') as f:
+                        data = f.read()
+                    content = data.decode('utf-8')
+                except (OSError, UnicodeDecodeError):
+                    continue
+                digest = hash_bytes(data)
+                if entry is not None and entry[3] == digest:
+                    self.db.execute("UPDATE files SET mtime_ns = ? WHERE id = ?", (st.st_mtime_ns, entry[0]))
+                    continue
+                self._index(path, content, st, digest, entry[0] if entry else None)
+                reindexed += 1
+
+            gone = set(stored) - set(files)
+            for path in gone:
+                self.db.execute("DELETE FROM refs WHERE file = ?", (stored[path][0],))
+                self.db.execute("DELETE FROM files WHERE id = ?", (stored[path][0],))
+        return reindexed, len(gone)
+
+    def _index(self, path, content, st, digest, file_id):
+        if file_id is None:
+            file_id = self.db.execute(
+                "INSERT INTO files (path, size, mtime_ns, sha256) VALUES (?, ?, ?, ?)",
+                (path, st.st_size, st.st_mtime_ns, digest),
+            ).lastrowid
+        else:
+            self.db.execute(
+                "UPDATE files SET size = ?, mtime_ns = ?, sha256 = ? WHERE id = ?",
+                (st.st_size, st.st_mtime_ns, digest, file_id),
+            )
+            self.db.execute("DELETE FROM refs WHERE file = ?", (file_id,))
+
+        lines = LineIndex(content)
+        rows = {}
+        for key, offset, kind in extract(content, path.endswith('.tsx'), self.namespaces):
+            line, column = lines.locate(offset)
+            rows.setdefault((key, line, column), kind)
+        self.db.executemany(
+            "INSERT INTO refs (key, file, line, col, kind) VALUES (?, ?, ?, ?, ?)",
+            ((key, file_id, line, column, kind) for (key, line, column), kind in rows.items()),
+        )
+
+    def who_uses(self, key):
+        """[Reference] that can read key, by path and position
+
+        Besides exact references this includes the plural base (t("items")
+        reads items_one) and the template prefixes the key falls under;
+        all of them are exact lookups on the (key, ...) primary key.
+        """
+        candidates = {key, PLURAL_SUFFIX.sub('', key)}
+        candidates.update(key[:i + 1] for i, ch in enumerate(key) if ch in ":.")
+        marks = ", ".join("?" * len(candidates))
+        rows = self.db.execute(
+            f"SELECT r.key, f.path, r.line, r.col, r.kind FROM refs r JOIN files f ON f.id = r.file "
+            f"WHERE r.key IN ({marks}) ORDER BY f.path, r.line, r.col",
+            tuple(candidates),
+        )
+        return [Reference(*row) for row in rows]
+
+    def references(self, kinds=(CALL, LITERAL)):
+        """Every [Reference] of the given kinds, by key then position"""
+        marks = ", ".join("?" * len(kinds))
+        rows = self.db.execute(
+            f"SELECT r.key, f.path, r.line, r.col, r.kind FROM refs r JOIN files f ON f.id = r.file "
+            f"WHERE r.kind IN ({marks}) ORDER BY r.key, f.path, r.line, r.col",
+            tuple(kinds),
+        )
+        return [Reference(*row) for row in rows]
+
+    def keys_in(self, path):
+        """[Reference] made by one file, in source order"""
+        rows = self.db.execute(
+            "SELECT r.key, f.path, r.line, r.col, r.kind FROM refs r JOIN files f ON f.id = r.file "
+            "WHERE f.path = ? ORDER BY r.line, r.col",
+            (os.path.normpath(path),),
+        )
+        return [Reference(*row) for row in rows]
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,402 @@
+"""
+Lightweight streaming lexer for TS/TSX string literals
+
+Not a parser: it tracks just enough state (code, template literal, JSX tag,
+JSX children) to say where each string literal sits, so the translator can
+emit t("key") in expressions and {t("key")} in JSX without a fix-up pass.
+"""
+import re
+from collections import namedtuple
+
+# Where a string literal sits
+JSX_ATTR = "jsx_attr"      # <input placeholder="..." />
+JSX_TEXT = "jsx_text"      # <p>...</p>, span covers the whole text run
+EXPRESSION = "expression"  # "..." or '...' anywhere in code
+TEMPLATE = "template"      # `...` without ${} substitutions
+TEMPLATE_CHUNK = "template_chunk"  # raw text between the ${} of other templates
+
+# start/end span the literal including its quotes; value is the raw text
+# between them. prev is the significant code token before the literal.
+# scope is the Scope of the outermost function body around the literal,
+# None at module level, where no t() is in scope.
+StringToken = namedtuple("StringToken", "kind start end value prev scope")
+
+
+class Scope:
+    """The body of a top-level function: the component or hook a literal sits in
+
+    name is the declared name (const Name = ..., function Name), None for
+    anonymous functions; start is the offset of the body's opening { or (
+    (a concise arrow body) and end that of its closer, None until the
+    lexer has passed it. shadows are the [start, end] ranges inside it
+    where t is a parameter or local, as in items.map((t) => ...), so a
+    t() there would not call the translate function.
+    """
+
+    __slots__ = ("name", "start", "end", "block", "shadows")
+
+    def __init__(self, name, start, block):
+        self.name = name
+        self.start = start
+        self.end = None
+        self.block = block
+        self.shadows = []
+
+    def __repr__(self):
+        return f"Scope({self.name!r}, {self.start}, {self.end})"
+
+    def shadowed(self, offset):
+        """True when t names a parameter or local at offset"""
+        return any(start <= offset and (end is None or offset < end) for start, end in self.shadows)
+
+_CODE_TOKEN = re.compile(r'''
+    (?P<ws>\s+)
+  | (?P<comment>//[^\n]*|/\*.*?(?:\*/|\Z))
+  | (?P<name>[A-Za-z_$][\w$]*)
+  | (?P<number>\d[\w.]*)
+  | (?P<quote>["'])
+  | (?P<backtick>`)
+  | (?P<punct>===|!==|==|!=|=>|&&|\|\||\?\?|\?\.|\.\.\.|.)
+''', re.VERBOSE | re.DOTALL)
+
+_STRING_BODY = {
+    '"': re.compile(r'(?:[^"\\\n]|\\.)*'),
+    "'": re.compile(r"(?:[^'\\\n]|\\.)*"),
+}
+_TEMPLATE_CHUNK = re.compile(r'(?:[^`\\$]|\\.|\$(?!\{))*', re.DOTALL)
+_REGEX_LITERAL = re.compile(r'/(?:[^/\\\[\n]|\\.|\[(?:[^\]\\\n]|\\.)*\])+/[A-Za-z]*')
+_JSX_TEXT = re.compile(r'[^<{]+')
+_TAG_NAME = re.compile(r'[\w$.:-]*')
+_ATTR_NAME = re.compile(r'[\w$:.-]+')
+_WS = re.compile(r'\s*')
+
+# After these a "/" starts a regex and a "<" may start JSX
+_EXPRESSION_KEYWORDS = {
+    "return", "case", "default", "yield", "await", "typeof", "void",
+    "in", "of", "delete", "else", "do", "throw",
+}
+
+# A "{" after these opens a block, not an object literal
+_BLOCK_KEYWORDS = {"else", "try", "finally", "do"}
+
+# The name after these is what a following top-level function is called
+_DECLARATION_KEYWORDS = {"const", "let", "var", "function"}
+
+# These start a top-level statement that is not a function declaration
+_STATEMENT_KEYWORDS = {"class", "if", "for", "while", "switch", "interface", "type", "enum"}
+
+# A name after these declares a local
+_BINDING_KEYWORDS = {"const", "let", "var", "function"}
+
+# Frame kinds on the lexer stack
+CODE_FRAME, TEMPLATE_FRAME, TAG_FRAME, CHILDREN_FRAME = range(4)
+
+# prev marker for "a value just ended" (literal, JSX element, ...)
+VALUE = "<value>"
+
+
+def _expects_operand(prev):
+    """True when the previous token leaves the lexer expecting an expression"""
+    if prev is None:
+        return True
+    if prev == VALUE or prev in (")", "]", "}"):
+        return False
+    if prev[0].isalnum() or prev[0] in "_$":
+        return prev in _EXPRESSION_KEYWORDS
+    return True
+
+
+class Lexer:
+    def __init__(self, source, jsx):
+        self.src = source
+        self.jsx = jsx
+        self.pos = 0
+        self.prev = None
+        # Each frame is [kind, brace_depth, start, has_substitutions]
+        self.stack = [[CODE_FRAME, 0, 0, False]]
+        # Brackets open in the top-level code frame, as (char, is_function_body)
+        self.openers = []
+        # Set by the function keyword so a return type annotation before
+        # the body, as in function f(): T {, does not hide the body
+        self.function_pending = False
+        # Outermost function body open now, and the name the last
+        # top-level declaration gave
+        self.scope = None
+        self.declared = None
+        # Brackets open in any code frame, as [char, offset, names, params,
+        # shadows]: names at parameter positions of a (, whether the ( is
+        # a function or catch parameter list, and the shadows of t its
+        # closer ends
+        self.nest = []
+        self.closed = None
+        self.params_next = False
+        # Offset of a => whose parameters name t, until its body starts,
+        # and the open shadows of concise bodies as (shadow, nest depth,
+        # stack depth)
+        self.arrow = None
+        self.concise = []
+
+    def _track_bracket(self, text, offset):
+        """Follow (, [ and { in top-level code to tell function bodies from data"""
+        if text in "([{":
+            if text == "{":
+                body = self.prev in ("=>", ")") or self.prev in _BLOCK_KEYWORDS or self.function_pending
+                self.function_pending = False
+            else:
+                body = text == "(" and self.prev == "=>"
+            if body and self.scope is None:
+                self.scope = Scope(self.declared, offset, text == "{")
+                self.openers.append((text, self.scope))
+            else:
+                self.openers.append((text, None))
+        elif self.openers:
+            _, scope = self.openers.pop()
+            if scope is not None:
+                scope.end = offset
+                self.scope = None
+
+    def _closed_binds_t(self, params=False):
+        """True when the ( just closed names t, with params a function's or catch's"""
+        return self.closed is not None and "t" in self.closed[2] and (self.closed[3] or not params)
+
+    def _shadow(self, start, entry=None):
+        """Record that t is not the translate function from start on
+
+        With entry the shadow ends where that bracket closes.
+        """
+        shadow = [start, None]
+        if self.scope is not None:
+            self.scope.shadows.append(shadow)
+        if entry is not None:
+            entry[4].append(shadow)
+        return shadow
+
+    def _end_concise(self, offset, depth, frames):
+        """End the shadows of concise arrow bodies that offset has left
+
+        A body is left when its enclosing bracket or code frame closes.
+        """
+        while self.concise and (self.concise[-1][1] > depth or self.concise[-1][2] > frames):
+            self.concise.pop()[0][1] = offset
+
+    def _track_binding(self, group, text, offset):
+        """Follow parameters and locals named t, in every code frame"""
+        frames = len(self.stack)
+        arrow, self.arrow = self.arrow, None
+        if group == "punct" and text in "([{":
+            entry = [text, offset, set(), text == "(" and self.params_next, []]
+            self.nest.append(entry)
+            self.params_next = False
+            if arrow is not None and text != "[":
+                # (t) => { ... } or (t) => ( ... ): the body is the bracket
+                self._shadow(arrow, entry)
+                return
+            if text == "{" and self.prev == ")" and self._closed_binds_t(params=True):
+                # function f(t) { ... }, catch (t) { ... }
+                self._shadow(self.closed[1], entry)
+        elif arrow is not None:
+            # t => t.label: a concise body ends at a , or ; or its enclosing closer
+            self.concise.append((self._shadow(arrow), len(self.nest), frames))
+
+        if group == "punct":
+            if text in ")]}":
+                if text == "}" and self.stack[-1][1] == 0 and frames > 1:
+                    # closes a JSX {...} or ${...}, not a bracket of its own
+                    self._end_concise(offset, len(self.nest), frames - 1)
+                    return
+                if self.nest:
+                    entry = self.nest.pop()
+                    for shadow in entry[4]:
+                        shadow[1] = offset
+                    self.closed = entry
+                self._end_concise(offset, len(self.nest), frames)
+            elif text in ",;":
+                # ends a concise body at this bracket depth and code frame
+                while self.concise and self.concise[-1][1] >= len(self.nest) and self.concise[-1][2] >= frames:
+                    self.concise.pop()[0][1] = offset
+            elif text == "=>" and (self.prev == "t" or self.prev == ")" and self._closed_binds_t()):
+                self.arrow = offset
+        elif group == "name":
+            if text in ("function", "catch"):
+                self.params_next = True
+            elif text == "t":
+                if self.nest and self.nest[-1][0] == "(" and self.prev in ("(", ",", "..."):
+                    self.nest[-1][2].add(text)
+                elif self.prev in _BINDING_KEYWORDS:
+                    # const t = ... shadows the whole block it sits in, before
+                    # the declaration as well
+                    block = next((entry for entry in reversed(self.nest) if entry[0] == "{"), None)
+                    if block is not None:
+                        self._shadow(block[1], block)
+
+    def _track_name(self, text):
+        if text == "function":
+            self.function_pending = True
+        # Only statements at the top level name things; const X = memo(...)
+        # keeps the X
+        if self.openers:
+            return
+        if text in _DECLARATION_KEYWORDS or text in _STATEMENT_KEYWORDS:
+            self.declared = None
+        elif self.prev in _DECLARATION_KEYWORDS:
+            self.declared = text
+
+    def run(self):
+        src = self.src
+        n = len(src)
+        while self.pos < n:
+            kind = self.stack[-1][0]
+            if kind == CODE_FRAME:
+                yield from self._code()
+            elif kind == TEMPLATE_FRAME:
+                yield from self._template()
+            elif kind == TAG_FRAME:
+                yield from self._tag()
+            else:
+                yield from self._children()
+
+    # -- code -------------------------------------------------------------
+    def _code(self):
+        src = self.src
+        frame = self.stack[-1]
+        m = _CODE_TOKEN.match(src, self.pos)
+        group = m.lastgroup
+        text = m.group()
+        self.pos = m.end()
+
+        if group in ("ws", "comment"):
+            return
+        if len(self.stack) == 1 and text in "([{)]}":
+            self._track_bracket(text, m.start())
+        self._track_binding(group, text, m.start())
+        if group in ("name", "number"):
+            if len(self.stack) == 1:
+                self._track_name(text)
+            self.prev = text
+            return
+        if group == "quote":
+            yield self._string(m.start(), text, EXPRESSION)
+            return
+        if group == "backtick":
+            self.stack.append([TEMPLATE_FRAME, 0, m.start(), False])
+            return
+
+        # punctuation
+        if text == "{":
+            frame[1] += 1
+        elif text == "}":
+            if frame[1] == 0 and len(self.stack) > 1:
+                self.stack.pop()
+                self.prev = VALUE
+                return
+            frame[1] -= 1
+        elif text == "/" and _expects_operand(self.prev):
+            rm = _REGEX_LITERAL.match(src, m.start())
+            if rm:
+                self.pos = rm.end()
+                self.prev = VALUE
+                return
+        elif text == "<" and self.jsx and _expects_operand(self.prev):
+            nxt = src[self.pos:self.pos + 1]
+            if nxt == ">" or nxt.isalpha() or nxt == "_":
+                self._open_tag()
+                return
+        self.prev = text
+
+    def _string(self, start, quote, kind):
+        body = _STRING_BODY[quote].match(self.src, start + 1)
+        end = body.end()
+        if self.src.startswith(quote, end):
+            end += 1
+        self.pos = end
+        token = StringToken(kind, start, end, body.group(), self.prev, self.scope)
+        self.prev = VALUE
+        return token
+
+    # -- template literals ----------------------------------------------------
+    def _template(self):
+        src = self.src
+        frame = self.stack[-1]
+        m = _TEMPLATE_CHUNK.match(src, self.pos)
+        self.pos = m.end()
+        if self.pos >= len(src):
+            self.stack.pop()
+            return
+        if src[self.pos] == "`":
+            self.pos += 1
+            self.stack.pop()
+            if not frame[3]:
+                start = frame[2]
+                yield StringToken(TEMPLATE, start, self.pos, src[start + 1:self.pos - 1], self.prev, self.scope)
+            elif m.group():
+                yield StringToken(TEMPLATE_CHUNK, m.start(), m.end(), m.group(), None, self.scope)
+            self.prev = VALUE
+        else:
+            # "${"
+            if m.group():
+                yield StringToken(TEMPLATE_CHUNK, m.start(), m.end(), m.group(), None, self.scope)
+            frame[3] = True
+            self.pos += 2
+            self.prev = None
+            self.stack.append([CODE_FRAME, 0, self.pos, False])
+
+    # -- JSX --------------------------------------------------------------------
+    def _open_tag(self):
+        m = _TAG_NAME.match(self.src, self.pos)
+        self.pos = m.end()
+        self.stack.append([TAG_FRAME, 0, self.pos, False])
+
+    def _tag(self):
+        src = self.src
+        self.pos = _WS.match(src, self.pos).end()
+        if self.pos >= len(src):
+            return
+        ch = src[self.pos]
+
+        if src.startswith("/>", self.pos):
+            self.pos += 2
+            self.stack.pop()
+            self.prev = VALUE
+        elif ch == ">":
+            self.pos += 1
+            self.stack[-1] = [CHILDREN_FRAME, 0, self.pos, False]
+        elif ch == "{":
+            self.pos += 1
+            self.prev = None
+            self.stack.append([CODE_FRAME, 0, self.pos, False])
+        elif ch in "\"'":
+            yield self._string(self.pos, ch, JSX_ATTR)
+        elif ch == "<":
+            self.pos += 1
+            self._open_tag()
+        else:
+            m = _ATTR_NAME.match(src, self.pos)
+            self.pos = m.end() if m else self.pos + 1
+            self.prev = "="
+
+    def _children(self):
+        src = self.src
+        m = _JSX_TEXT.match(src, self.pos)
+        if m:
+            self.pos = m.end()
+            if m.group().strip():
+                yield StringToken(JSX_TEXT, m.start(), m.end(), m.group(), None, self.scope)
+            return
+
+        if src[self.pos] == "{":
+            self.pos += 1
+            self.prev = None
+            self.stack.append([CODE_FRAME, 0, self.pos, False])
+        elif src.startswith("</", self.pos):
+            end = src.find(">", self.pos)
+            self.pos = len(src) if end == -1 else end + 1
+            self.stack.pop()
+            self.prev = VALUE
+        else:
+            self.pos += 1
+            self._open_tag()
+
+
+def iter_strings(source, jsx=True):
+    """Yield a StringToken for every string literal and JSX text run, in order"""
+    return Lexer(source, jsx).run()
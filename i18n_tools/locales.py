@@ -0,0 +1,160 @@
+"""
+Locale loader: flattens src/locales/<lang>/*.json into ns:dotted.key form
+and builds the Thai text -> key reverse index the translator matches on
+"""
+import glob
+import json
+import os
+import re
+
+from .cache import hash_file
+from .fileio import write_json_atomic
+
+DEFAULT_LOCALES_DIR = "src/locales"
+DEFAULT_INDEX_CACHE = ".i18n-locale-index.json"
+SOURCE_LANG = "th"
+
+# Same order as src/i18n.ts; decides which key wins when one text has several
+NAMESPACE_ORDER = [
+    "common", "navigation", "member", "lottery", "transaction",
+    "promotion", "game", "auth", "affiliate", "landing",
+]
+
+# Thai block, U+0E00-U+0E7F
+THAI_RE = re.compile('[\u0e00-\u0e7f]')
+
+# Bump when the cached index layout or the index rules change
+INDEX_VERSION = 1
+
+
+def flatten(data, prefix=""):
+    """Yield (dotted.key, value) for every string leaf, in file order"""
+    for key, value in data.items():
+        if isinstance(value, dict):
+            yield from flatten(value, f"{prefix}{key}.")
+        elif isinstance(value, str):
+            yield f"{prefix}{key}", value
+
+
+def namespace_files(locales_dir, lang):
+    """Return {namespace: path} for one language, in NAMESPACE_ORDER"""
+    paths = glob.glob(os.path.join(locales_dir, lang, "*.json"))
+    files = {os.path.splitext(os.path.basename(p))[0]: p for p in paths}
+    rank = {ns: i for i, ns in enumerate(NAMESPACE_ORDER)}
+    order = sorted(files, key=lambda ns: (rank.get(ns, len(rank)), ns))
+    return {ns: files[ns] for ns in order}
+
+
+def load_locale(locales_dir, lang):
+    """Return {"ns:dotted.key": text} for every namespace of one language"""
+    entries = {}
+    for ns, path in namespace_files(locales_dir, lang).items():
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        for key, value in flatten(data):
+            entries[f"{ns}:{key}"] = value
+    return entries
+
+
+def build_reverse_index(entries, require=None):
+    """Return (index, collisions) for {key: text} entries
+
+    index maps each text to the first key that carries it; collisions maps
+    texts shared by several keys to all of them. Interpolated values
+    ({{count}}) never appear verbatim in source and are left out, as are
+    texts that do not match the optional require regex.
+    """
+    index = {}
+    collisions = {}
+    for key, text in entries.items():
+        text = " ".join(text.split())
+        if not text or "{{" in text:
+            continue
+        if require is not None and not require.search(text):
+            continue
+        if text in index:
+            collisions.setdefault(text, [index[text]]).append(key)
+        else:
+            index[text] = key
+    return index, collisions
+
+
+class LocaleIndex:
+    """Flattened entries plus reverse index for one language, cached on disk
+
+    The cache is keyed by every namespace file's size, mtime and content
+    hash; adding, removing or editing a locale file rebuilds it.
+    """
+
+    def __init__(self, lang, entries, index, collisions):
+        self.lang = lang
+        self.entries = entries
+        self.index = index
+        self.collisions = collisions
+
+    @classmethod
+    def build(cls, locales_dir=DEFAULT_LOCALES_DIR, lang=SOURCE_LANG):
+        entries = load_locale(locales_dir, lang)
+        # Only Thai source text is worth matching; "0.00" or "OK" are not
+        index, collisions = build_reverse_index(entries, THAI_RE if lang == SOURCE_LANG else None)
+        return cls(lang, entries, index, collisions)
+
+    @classmethod
+    def load(cls, locales_dir=DEFAULT_LOCALES_DIR, lang=SOURCE_LANG, cache_path=DEFAULT_INDEX_CACHE):
+        """Return the cached index when still valid, otherwise rebuild and cache it"""
+        sources = namespace_files(locales_dir, lang)
+        cached = _read_cache(cache_path).get(lang) if cache_path else None
+        if cached and _sources_match(cached.get("sources", {}), sources):
+            return cls(lang, cached["entries"], cached["index"], cached["collisions"])
+
+        stamps = {path: _stamp(path) for path in sources.values()}
+        result = cls.build(locales_dir, lang)
+        if cache_path:
+            _write_cache(cache_path, lang, {
+                "sources": stamps,
+                "entries": result.entries,
+                "index": result.index,
+                "collisions": result.collisions,
+            })
+        return result
+
+
+def _stamp(path):
+    st = os.stat(path)
+    return {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "sha256": hash_file(path)}
+
+
+def _sources_match(stamps, sources):
+    if set(stamps) != set(sources.values()):
+        return False
+    for path, stamp in stamps.items():
+        try:
+            st = os.stat(path)
+        except OSError:
+            return False
+        if st.st_size == stamp["size"] and st.st_mtime_ns == stamp["mtime_ns"]:
+            continue
+        if st.st_size != stamp["size"] or hash_file(path) != stamp["sha256"]:
+            return False
+    return True
+
+
+def _read_cache(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if data.get("version") != INDEX_VERSION:
+        return {}
+    return data.get("langs", {})
+
+
+def _write_cache(path, lang, payload):
+    langs = _read_cache(path)
+    langs[lang] = payload
+    try:
+        write_json_atomic(path, {"version": INDEX_VERSION, "langs": langs})
+    except OSError:
+        # A read-only checkout still works, it just rebuilds every time
+        pass
@@ -0,0 +1,148 @@
+"""
+Batched locale writer: merge new keys into src/locales/<lang>/<ns>.json
+
+New entries are grouped by language and namespace and each namespace
+file gets one read-merge-write under a lock on its language directory,
+so concurrent workers serialise instead of losing each other's keys.
+Files are parsed into ordered (key, value) pairs and written back in the
+same layout: existing keys keep their order (duplicates included, as
+lottery.json has), new keys go to the end of their parent object, and
+indentation and the trailing newline are detected from the file. A file
+without additions is not touched.
+"""
+import json
+import os
+import re
+from collections import namedtuple
+from contextlib import contextmanager
+
+from .fileio import write_text_atomic
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process lock, writes are still atomic
+    fcntl = None
+
+# added and conflicts list "ns:key"; a conflict is a key that already holds
+# a different value, or a path running through an existing string
+NamespaceUpdate = namedtuple("NamespaceUpdate", "lang ns path added conflicts")
+
+_INDENT = re.compile(r'^([ \t]+)\S', re.MULTILINE)
+
+
+class _Pairs(list):
+    """A JSON object as its ordered (key, value) pairs, duplicates kept"""
+
+    def find(self, key):
+        # JSON.parse and json.load both keep the last of duplicate keys
+        for i in range(len(self) - 1, -1, -1):
+            if self[i][0] == key:
+                return i
+        return None
+
+
+def _dump(value, indent, level=0):
+    """json.dumps(indent=...) output for values parsed into _Pairs"""
+    if isinstance(value, list):
+        is_object = isinstance(value, _Pairs)
+        if not value:
+            return "{}" if is_object else "[]"
+        pad = indent * (level + 1)
+        if is_object:
+            items = [f"{pad}{json.dumps(k, ensure_ascii=False)}: {_dump(v, indent, level + 1)}" for k, v in value]
+        else:
+            items = [f"{pad}{_dump(v, indent, level + 1)}" for v in value]
+        open_, close = ("{", "}") if is_object else ("[", "]")
+        return open_ + "\n" + ",\n".join(items) + "\n" + indent * level + close
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _insert(root, path, value):
+    """Add path = value under root; return "added", "exists" or "conflict" """
+    node = root
+    parts = path.split(".")
+    for part in parts[:-1]:
+        i = node.find(part)
+        if i is None:
+            child = _Pairs()
+            node.append((part, child))
+            node = child
+        elif isinstance(node[i][1], _Pairs):
+            node = node[i][1]
+        else:
+            return "conflict"
+    i = node.find(parts[-1])
+    if i is None:
+        node.append((parts[-1], value))
+        return "added"
+    return "exists" if node[i][1] == value else "conflict"
+
+
+@contextmanager
+def _locked(directory):
+    """Exclusive lock on a directory, held across one read-merge-write"""
+    if fcntl is None:
+        yield
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        os.close(fd)
+
+
+def merge_namespace(path, entries):
+    """Merge {dotted.key: value} into one namespace file; return (added, conflicts)
+
+    The file is created when missing. It is only written when something
+    was added, in one atomic replace.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    with _locked(directory):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                text = f.read()
+        except FileNotFoundError:
+            text = "{}\n"
+        root = json.loads(text, object_pairs_hook=_Pairs)
+        indent = _INDENT.search(text)
+        indent = indent.group(1) if indent else "  "
+
+        added, conflicts = [], []
+        for key, value in sorted(entries.items()):
+            result = _insert(root, key, value)
+            if result == "added":
+                added.append(key)
+            elif result == "conflict":
+                conflicts.append(key)
+        if added:
+            trailer = "\n" if text.endswith("\n") else ""
+            write_text_atomic(path, _dump(root, indent) + trailer)
+    return added, conflicts
+
+
+def write_entries(locales_dir, entries):
+    """Merge {lang: {"ns:dotted.key": value}} into the locale files
+
+    One write per namespace file that gains keys; returns a
+    NamespaceUpdate for every file that had entries.
+    """
+    updates = []
+    for lang in sorted(entries):
+        by_ns = {}
+        for key, value in entries[lang].items():
+            ns, sep, path = key.partition(":")
+            if not sep or not ns or not path:
+                raise ValueError(f"{key!r} is not an ns:key")
+            by_ns.setdefault(ns, {})[path] = value
+        for ns in sorted(by_ns):
+            path = os.path.join(locales_dir, lang, f"{ns}.json")
+            added, conflicts = merge_namespace(path, by_ns[ns])
+            updates.append(NamespaceUpdate(
+                lang, ns, path,
+                [f"{ns}:{key}" for key in added],
+                [f"{ns}:{key}" for key in conflicts],
+            ))
+    return updates
@@ -0,0 +1,97 @@
+"""
+Context-aware matcher that rewrites known Thai strings to t() calls
+"""
+import re
+
+from .hooks import can_hold_hook, hook_edits
+from .lexer import EXPRESSION, JSX_ATTR, JSX_TEXT, TEMPLATE, iter_strings
+from .profile import record
+from .textutil import build_trie, trie_to_regex
+
+
+# A literal compared against or used as a type/key is data, not UI text
+_GUARD_PREV = {"===", "!==", "==", "!=", "case", "|"}
+_GUARD_AFTER = re.compile(r'\s*(?:===|!==|==|!=|\|(?!\|))')
+_KEY_AFTER = re.compile(r'\s*:')
+
+
+def _is_data_literal(content, token):
+    if token.prev in _GUARD_PREV or _GUARD_AFTER.match(content, token.end):
+        return True
+    # { 'text': ... } object key
+    return token.prev in ("{", ",") and _KEY_AFTER.match(content, token.end) is not None
+
+
+class TranslationMatcher:
+    """Compiled once from a Thai text -> i18n key table, applied in one pass
+
+    Each string literal is replaced according to where it sits:
+    JSX attribute "text" -> {t("key")}, JSX text -> {t("key")} (surrounding
+    whitespace kept), string or template literal in code -> t("key").
+    Literals that are compared against, used as object keys or in type
+    unions are left alone, and so is anything outside the body of a
+    component or hook, where no useTranslation() can put t() in scope,
+    or where t names a parameter or local, as in items.map((t) => ...).
+    Each component that receives a t() gets the hook (see hooks).
+    """
+
+    def __init__(self, translations):
+        self.translations = dict(translations)
+        self.pattern = None
+        if self.translations:
+            self.pattern = re.compile(trie_to_regex(build_trie(self.translations)))
+
+    def _matches(self, content, jsx):
+        """Return [(start, end, replacement, text, scope)], text being the table entry hit"""
+        if self.pattern is None or not self.pattern.search(content):
+            return []
+
+        table = self.translations
+        edits = []
+        for token in iter_strings(content, jsx):
+            if token.scope is None:
+                continue
+            if token.kind == JSX_TEXT:
+                text = " ".join(token.value.split())
+                key = table.get(text)
+                if key is None:
+                    continue
+                value = token.value
+                start = token.start + len(value) - len(value.lstrip())
+                end = token.end - (len(value) - len(value.rstrip()))
+                edits.append((start, end, f'{{t("{key}")}}', text, token.scope))
+                continue
+
+            key = table.get(token.value)
+            if key is None or _is_data_literal(content, token):
+                continue
+            if token.kind == JSX_ATTR:
+                edits.append((token.start, token.end, f'{{t("{key}")}}', token.value, token.scope))
+            elif token.kind in (EXPRESSION, TEMPLATE):
+                edits.append((token.start, token.end, f't("{key}")', token.value, token.scope))
+        # A scope's end and its shadows are only known once the lexer has
+        # passed them
+        return [edit for edit in edits if can_hold_hook(edit[4]) and not edit[4].shadowed(edit[0])]
+
+    def translate_text(self, content, jsx=True, hits=None):
+        """Return (new_content, changed)
+
+        hits, when given, is a profile bucket that gets one entry per
+        table text rewritten (see profile.record).
+        """
+        edits = self._matches(content, jsx)
+        if not edits:
+            return content, False
+
+        if hits is not None:
+            for start, end, _, text, _ in edits:
+                record(hits, text, 1, end - start)
+        scopes = list(dict.fromkeys(edit[4] for edit in edits))
+        parts = []
+        pos = 0
+        for start, end, replacement in sorted([edit[:3] for edit in edits] + hook_edits(content, scopes)):
+            parts.append(content[pos:start])
+            parts.append(replacement)
+            pos = end
+        parts.append(content[pos:])
+        return "".join(parts), True
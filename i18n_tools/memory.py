@@ -0,0 +1,162 @@
+"""
+Translation memory: every Thai locale value in SQLite, searchable by similarity
+
+Thai is written without spaces between words, so there is nothing to
+tokenise on; the index is an inverted list of character trigrams instead.
+A query's candidates are the entries that share at least one trigram with
+it, ranked by the Dice coefficient of the two trigram sets, all in one
+SQL statement over the (gram, entry) primary key.
+"""
+import hashlib
+import heapq
+import json
+import sqlite3
+from collections import Counter, namedtuple
+
+from .locales import DEFAULT_LOCALES_DIR, SOURCE_LANG, THAI_RE, LocaleIndex
+
+DEFAULT_MEMORY = ".i18n-memory.sqlite"
+
+# Bump when the schema or trigrams() changes; older stores are rebuilt
+MEMORY_VERSION = 1
+
+Suggestion = namedtuple("Suggestion", "key text score")
+
+_SCHEMA = """
+CREATE TABLE meta (name TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE entries (
+    id INTEGER PRIMARY KEY,
+    key TEXT NOT NULL UNIQUE,
+    text TEXT NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE TABLE postings (
+    gram TEXT NOT NULL,
+    entry INTEGER NOT NULL REFERENCES entries(id),
+    PRIMARY KEY (gram, entry)
+) WITHOUT ROWID;
+"""
+
+_QUERY = """
+SELECT e.key, e.text, 2.0 * COUNT(*) / (e.size + ?) AS score
+FROM postings p JOIN entries e ON e.id = p.entry
+WHERE p.gram IN ({grams})
+GROUP BY p.entry
+HAVING score >= ?
+ORDER BY score DESC, e.key
+LIMIT ?
+"""
+
+
+def normalize(text):
+    return " ".join(text.split()).lower()
+
+
+def trigrams(text):
+    """Character trigrams of text, padded so short strings and word edges count"""
+    padded = f"\x02{normalize(text)}\x03"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _entries_digest(entries):
+    payload = json.dumps(sorted(entries.items()), ensure_ascii=False)
+    return hashlib.sha256(f"{MEMORY_VERSION}:{payload}".encode('utf-8')).hexdigest()
+
+
+class TranslationMemory:
+    """SQLite store of {key: Thai text} with a trigram inverted index
+
+    open() keeps it in step with the locale files: the store records a
+    digest of the entries it was built from and rebuilds when they differ.
+    """
+
+    def __init__(self, path=DEFAULT_MEMORY):
+        self.path = path
+        self.db = sqlite3.connect(path)
+        self.db.execute("PRAGMA journal_mode = WAL")
+
+    @classmethod
+    def open(cls, path=DEFAULT_MEMORY, locales_dir=DEFAULT_LOCALES_DIR, lang=SOURCE_LANG):
+        memory = cls(path)
+        entries = LocaleIndex.load(locales_dir, lang).entries
+        memory.refresh({key: text for key, text in entries.items() if THAI_RE.search(text)})
+        return memory
+
+    def _digest(self):
+        try:
+            row = self.db.execute("SELECT value FROM meta WHERE name = 'digest'").fetchone()
+        except sqlite3.OperationalError:
+            return None
+        return row[0] if row else None
+
+    def refresh(self, entries):
+        """Rebuild from {key: text} unless the store already holds exactly these; return True if rebuilt"""
+        digest = _entries_digest(entries)
+        if self._digest() == digest:
+            return False
+        with self.db:
+            self.db.executescript(
+                "DROP TABLE IF EXISTS postings; DROP TABLE IF EXISTS entries; DROP TABLE IF EXISTS meta;"
+            )
+            self.db.executescript(_SCHEMA)
+            for key, text in sorted(entries.items()):
+                grams = trigrams(text)
+                cursor = self.db.execute(
+                    "INSERT INTO entries (key, text, size) VALUES (?, ?, ?)", (key, text, len(grams)),
+                )
+                self.db.executemany(
+                    "INSERT INTO postings (gram, entry) VALUES (?, ?)",
+                    ((gram, cursor.lastrowid) for gram in grams),
+                )
+            self.db.execute("INSERT INTO meta (name, value) VALUES ('digest', ?)", (digest,))
+        self.db.execute("ANALYZE")
+        return True
+
+    def __len__(self):
+        return self.db.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def suggest(self, text, k=5, min_score=0.0):
+        """Top-k [Suggestion(key, text, score)] for text, best first; score is in (0, 1]"""
+        grams = sorted(trigrams(text))
+        sql = _QUERY.format(grams=", ".join("?" * len(grams)))
+        rows = self.db.execute(sql, (len(grams), *grams, min_score, k))
+        return [Suggestion(key, value, round(score, 4)) for key, value, score in rows]
+
+    def suggest_many(self, texts, k=5, min_score=0.0):
+        """Bulk suggest(): {text: [Suggestion]} for every distinct text
+
+        Thousands of one-off queries would each pay for a GROUP BY; here the
+        postings are read once into memory and each text is scored with a
+        Counter over its trigrams' posting lists, same ranking as suggest().
+        """
+        postings = {}
+        for gram, entry in self.db.execute("SELECT gram, entry FROM postings"):
+            postings.setdefault(gram, []).append(entry)
+        entries = {row[0]: row[1:] for row in self.db.execute("SELECT id, key, text, size FROM entries")}
+
+        results = {}
+        for text in set(texts):
+            grams = trigrams(text)
+            shared = Counter()
+            for gram in grams:
+                shared.update(postings.get(gram, ()))
+            ranked = []
+            for entry, count in shared.items():
+                key, value, size = entries[entry]
+                score = 2.0 * count / (size + len(grams))
+                if score >= min_score:
+                    ranked.append((-score, key, value))
+            results[text] = [
+                Suggestion(key, value, round(-score, 4))
+                for score, key, value in heapq.nsmallest(k, ranked)
+            ]
+        return results
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
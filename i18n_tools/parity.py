@@ -0,0 +1,92 @@
+"""
+Locale parity and key types
+
+Set differences over the flattened namespaces: keys the source language
+(th) has that another language lacks, keys only the other language has,
+and keys the code or the curated RULES emit that no locale defines. Plural
+forms are compared by their base, so th "items" matches en "items_one" /
+"items_other". render_dts() turns the source key set into a TypeScript
+declaration of the valid key literals per namespace.
+"""
+import json
+import re
+
+from .locales import SOURCE_LANG, load_locale, namespace_files
+from .textutil import PLURAL_SUFFIX
+
+DEFAULT_DTS = "src/types/i18nKeys.d.ts"
+
+
+def _bases(keys):
+    return {PLURAL_SUFFIX.sub('', key) for key in keys}
+
+
+def compare(source_keys, other_keys):
+    """Return (missing, extra): keys of source absent from other and the reverse, sorted"""
+    source_bases = _bases(source_keys)
+    other_bases = _bases(other_keys)
+    missing = sorted(key for key in source_keys if PLURAL_SUFFIX.sub('', key) not in other_bases)
+    extra = sorted(key for key in other_keys if PLURAL_SUFFIX.sub('', key) not in source_bases)
+    return missing, extra
+
+
+def undefined_keys(keys, known):
+    """The keys, sorted, that neither exist in known nor are a plural base of one"""
+    defined = set(known) | _bases(known)
+    return sorted(set(keys) - defined)
+
+
+def check_parity(locales_dir, langs, source=SOURCE_LANG):
+    """Return {lang: {"missing_namespaces", "extra_namespaces", "missing", "extra"}} for every lang but source"""
+    source_namespaces = set(namespace_files(locales_dir, source))
+    source_keys = set(load_locale(locales_dir, source))
+    report = {}
+    for lang in langs:
+        if lang == source:
+            continue
+        namespaces = set(namespace_files(locales_dir, lang))
+        missing, extra = compare(source_keys, set(load_locale(locales_dir, lang)))
+        report[lang] = {
+            "missing_namespaces": sorted(source_namespaces - namespaces),
+            "extra_namespaces": sorted(namespaces - source_namespaces),
+            "missing": missing,
+            "extra": extra,
+        }
+    return report
+
+
+def _type_name(ns):
+    return "".join(part.capitalize() for part in re.split(r'[^0-9A-Za-z]+', ns) if part) + "Key"
+
+
+def render_dts(keys):
+    """TypeScript declarations for a set of "ns:key" strings, stable for a given set
+
+    Every key is declared as it is, plural variants also by their base,
+    the form t() is called with.
+    """
+    by_ns = {}
+    for key in set(keys) | _bases(keys):
+        ns, _, path = key.partition(":")
+        by_ns.setdefault(ns, set()).add(path)
+
+    lines = [
+        "// Generated by `python3 -m i18n_tools parity --dts`; do not edit.",
+        "// Rewritten only when the set of locale keys changes.",
+        "",
+    ]
+    for ns in sorted(by_ns):
+        lines.append(f"export type {_type_name(ns)} =")
+        lines.extend(f"  | {json.dumps(path, ensure_ascii=False)}" for path in sorted(by_ns[ns]))
+        lines.append("")
+    lines.append("export interface LocaleKeys {")
+    lines.extend(f"  {json.dumps(ns)}: {_type_name(ns)}" for ns in sorted(by_ns))
+    lines.append("}")
+    lines.append("")
+    lines.append("export type Namespace = keyof LocaleKeys")
+    lines.append("")
+    lines.append("/** Every key in the ns:key form the codemod emits */")
+    lines.append("export type NamespacedKey = {")
+    lines.append("  [N in Namespace]: `${N}:${LocaleKeys[N]}`")
+    lines.append("}[Namespace]")
+    return "\n".join(lines) + "\n"
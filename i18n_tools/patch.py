@@ -0,0 +1,65 @@
+"""
+Edits as (offset, old, new) ranges over a file's text
+
+diff_edits() turns a rewrite into the smallest set of line-range edits
+against the content that was read, which is what process_file() and the
+serve protocol report. apply_edits() checks every old span before
+splicing, so edits applied to a buffer that has moved on are refused
+rather than misplaced. Offsets count characters of the decoded text.
+"""
+import difflib
+from collections import namedtuple
+
+Edit = namedtuple("Edit", "offset old new")
+
+
+class PatchConflictError(ValueError):
+    """The content being patched is not the content the edits were made against"""
+
+
+def diff_edits(original, new):
+    """Return the line-range edits that turn original into new, in order"""
+    if original == new:
+        return []
+    a = original.splitlines(keepends=True)
+    b = new.splitlines(keepends=True)
+
+    starts = [0]
+    for line in a:
+        starts.append(starts[-1] + len(line))
+
+    edits = []
+    matcher = difflib.SequenceMatcher(None, a, b, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag != "equal":
+            edits.append(Edit(starts[i1], "".join(a[i1:i2]), "".join(b[j1:j2])))
+    return edits
+
+
+def apply_edits(content, edits):
+    """Return content with edits applied; edits must be sorted and not overlap"""
+    parts = []
+    pos = 0
+    for edit in edits:
+        end = edit.offset + len(edit.old)
+        if edit.offset < pos or content[edit.offset:end] != edit.old:
+            raise PatchConflictError(f"edit at offset {edit.offset} does not match the content")
+        parts.append(content[pos:edit.offset])
+        parts.append(edit.new)
+        pos = end
+    parts.append(content[pos:])
+    return "".join(parts)
+
+
+def unified_diff(path, original, new):
+    """git-style unified diff text for one file, '' when unchanged"""
+    lines = difflib.unified_diff(
+        original.splitlines(keepends=True),
+        new.splitlines(keepends=True),
+        fromfile=f"a/{path}",
+        tofile=f"b/{path}",
+    )
+    return "".join(
+        line if line.endswith("\n") else line + "\n\\ No newline at end of file\n"
+        for line in lines
+    )
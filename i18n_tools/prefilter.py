@@ -0,0 +1,35 @@
+"""
+Byte-level prefilter: decide from the raw bytes whether a stage can touch a file
+
+Every Thai character (U+0E00-U+0E7F) is three UTF-8 bytes starting with
+E0 B8 or E0 B9, and every fixer rule needs a "t(" in the text. Both are
+plain byte searches, so files under src/api, src/store or src/types that
+have neither are never decoded, lexed or run through a regex.
+"""
+import mmap
+import os
+
+THAI_LEAD_BYTES = (b"\xe0\xb8", b"\xe0\xb9")
+T_CALL = b"t("
+
+# Below this a plain read is cheaper than setting up a mapping
+MMAP_THRESHOLD = 64 * 1024
+
+
+def _search(data):
+    thai = any(data.find(lead) != -1 for lead in THAI_LEAD_BYTES)
+    return thai, data.find(T_CALL) != -1
+
+
+def markers(path):
+    """Return (has_thai, has_t_call) for the file at path, without decoding it"""
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < MMAP_THRESHOLD:
+            return _search(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return _search(data)
+
+
+def has_thai_bytes(path):
+    return markers(path)[0]
@@ -0,0 +1,99 @@
+"""
+Run instrumentation: per-rule hit counters and timing, per-file wall time
+
+Engine.process() fills a small per-file stats dict when asked to; workers
+send it back with their FileResult and RunProfile folds them into one
+report that --profile writes as JSON.
+"""
+import time
+
+# Bump when the report layout changes
+PROFILE_VERSION = 1
+
+
+def new_stats():
+    """Empty per-file stats: {stage: {rule: [matches, bytes, seconds]}} plus stage times"""
+    return {"translate": {}, "fix": {}, "stages": {}}
+
+
+def record(bucket, name, matches, nbytes, seconds=0.0):
+    """Add one rule's hits to a stats bucket"""
+    entry = bucket.get(name)
+    if entry is None:
+        bucket[name] = [matches, nbytes, seconds]
+    else:
+        entry[0] += matches
+        entry[1] += nbytes
+        entry[2] += seconds
+
+
+class RunProfile:
+    """Aggregates per-file stats into one report for a whole run
+
+    Translation is a single lexer pass, so its rules (one per Thai text)
+    carry match and byte counts only; the time is reported for the stage.
+    Fix rules carry all three. Curated overrides and fix rules that never
+    matched are listed under dead_rules so they can be pruned; texts that
+    only come from the locale index are not rules anyone maintains.
+    """
+
+    def __init__(self, command, table=None, overrides=(), fix_rules=()):
+        self.command = command
+        self.table = table or {}
+        self.overrides = list(overrides)
+        self.fix_rules = list(fix_rules)
+        self.started = time.perf_counter()
+        self.files = []
+        self.stages = {}
+        self.rules = {"translate": {}, "fix": {}}
+
+    def add(self, result):
+        """Fold in one FileResult"""
+        stats = result.stats or {}
+        self.files.append({
+            "path": result.path,
+            "seconds": round(stats.get("seconds", 0.0), 6),
+            "bytes": stats.get("bytes", 0),
+            "changed": result.changed,
+            "error": result.error,
+        })
+        for stage, seconds in stats.get("stages", {}).items():
+            self.stages[stage] = self.stages.get(stage, 0.0) + seconds
+        for stage in ("translate", "fix"):
+            bucket = self.rules[stage]
+            for name, (matches, nbytes, seconds) in stats.get(stage, {}).items():
+                record(bucket, name, matches, nbytes, seconds)
+
+    def report(self, skipped=0):
+        rules = []
+        for stage, bucket in self.rules.items():
+            for name, (matches, nbytes, seconds) in bucket.items():
+                rules.append({
+                    "stage": stage,
+                    "rule": name,
+                    "key": self.table.get(name) if stage == "translate" else None,
+                    "matches": matches,
+                    "bytes": nbytes,
+                    "seconds": round(seconds, 6) if stage == "fix" else None,
+                })
+        rules.sort(key=lambda r: (-(r["seconds"] or 0.0), -r["matches"], r["stage"], r["rule"]))
+
+        dead = [
+            {"stage": "translate", "rule": name}
+            for name in self.overrides if name not in self.rules["translate"]
+        ] + [
+            {"stage": "fix", "rule": name}
+            for name in self.fix_rules if self.rules["fix"].get(name, [0])[0] == 0
+        ]
+
+        return {
+            "version": PROFILE_VERSION,
+            "command": self.command,
+            "wall_seconds": round(time.perf_counter() - self.started, 6),
+            "files_processed": len(self.files),
+            "files_skipped": skipped,
+            "stages": {stage: round(seconds, 6) for stage, seconds in self.stages.items()},
+            "rules": rules,
+            "dead_rules": dead,
+            "files": sorted(self.files, key=lambda f: -f["seconds"]),
+        }
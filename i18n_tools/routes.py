@@ -0,0 +1,379 @@
+"""
+Per-route locale namespace analysis
+
+Walks the static import graph from src/App.tsx, collects the namespaces
+each module uses (t("ns:key") prefixes and useTranslation([...]) lists)
+and folds them per <Route>, layouts and guards included. The result is a
+manifest, or a generated loader module, that loads only the namespaces a
+route reaches, per language, on demand.
+"""
+import json
+import os
+import re
+from collections import namedtuple
+
+from .locales import NAMESPACE_ORDER
+
+DEFAULT_ENTRY = "src/App.tsx"
+DEFAULT_TSCONFIG = "tsconfig.json"
+DEFAULT_MANIFEST = "i18n-routes.json"
+# Where nginx serves `bundle --hashed` output from (dist/locales)
+DEFAULT_ASSETS_BASE = "/locales/"
+# Matches defaultNS in src/i18n.ts: t("key") without a prefix reads it
+DEFAULT_NAMESPACE = "common"
+
+# Bump when the manifest layout changes
+MANIFEST_VERSION = 1
+
+_RESOLVE_SUFFIXES = ["", ".tsx", ".ts", "/index.tsx", "/index.ts"]
+
+_IMPORT = re.compile(r'''(?:^|[;\s])(?:import|export)\b[^'"`;]*?\bfrom\s*['"]([^'"]+)['"]|\bimport\s*\(?\s*['"]([^'"]+)['"]''')
+_DEFAULT_IMPORT = re.compile(r'''^import\s+(\w+)\s*(?:,\s*\{[^}]*\})?\s*from\s*['"]([^'"]+)['"]''', re.MULTILINE)
+_T_PREFIX = re.compile(r'''\bt\(\s*['"`]([\w-]+):''')
+_USE_TRANSLATION = re.compile(r'\buseTranslation\(([^)]*)\)')
+_STRING = re.compile(r'''['"]([\w-]+)['"]''')
+_COMMENT = re.compile(r'//[^\n]*|/\*.*?\*/', re.DOTALL)
+_TRAILING_COMMA = re.compile(r',(\s*[}\]])')
+
+ModuleInfo = namedtuple("ModuleInfo", "imports namespaces")
+Route = namedtuple("Route", "path components")
+
+
+def load_aliases(tsconfig=DEFAULT_TSCONFIG):
+    """Return [(prefix, directory)] from compilerOptions.paths, longest prefix first
+
+    tsconfig.json allows comments and trailing commas, so both are
+    stripped before parsing. A missing or unreadable file means no aliases.
+    """
+    try:
+        with open(tsconfig, 'r', encoding='utf-8') as f:
+            text = f.read()
+        options = json.loads(_TRAILING_COMMA.sub(r'\1', _COMMENT.sub('', text)))["compilerOptions"]
+    except (OSError, ValueError, KeyError):
+        return []
+
+    base = os.path.join(os.path.dirname(tsconfig), options.get("baseUrl", "."))
+    aliases = []
+    for pattern, targets in options.get("paths", {}).items():
+        if not pattern.endswith("/*") or not targets:
+            continue
+        target = targets[0][:-2] if targets[0].endswith("/*") else targets[0]
+        aliases.append((pattern[:-1], os.path.normpath(os.path.join(base, target))))
+    return sorted(aliases, key=lambda alias: -len(alias[0]))
+
+
+def resolve_import(spec, importer, aliases):
+    """Return the source file an import specifier points at, or None for packages and assets"""
+    if spec.startswith("."):
+        base = os.path.normpath(os.path.join(os.path.dirname(importer), spec))
+    else:
+        for prefix, directory in aliases:
+            if spec.startswith(prefix):
+                base = os.path.join(directory, spec[len(prefix):])
+                break
+        else:
+            return None
+
+    for suffix in _RESOLVE_SUFFIXES:
+        path = base + suffix
+        if path.endswith((".tsx", ".ts")) and os.path.isfile(path):
+            return os.path.normpath(path)
+    return None
+
+
+def module_namespaces(content):
+    """Return the set of namespaces one module's t() calls can read"""
+    namespaces = set(_T_PREFIX.findall(content))
+    hooks = _USE_TRANSLATION.findall(content)
+    for args in hooks:
+        listed = _STRING.findall(args)
+        namespaces.update(listed)
+        if not listed:
+            # useTranslation() reads unprefixed keys from defaultNS
+            namespaces.add(DEFAULT_NAMESPACE)
+    return namespaces
+
+
+class ImportGraph:
+    """Lazily parsed static import graph over the source tree"""
+
+    def __init__(self, aliases):
+        self.aliases = aliases
+        self.modules = {}
+
+    def info(self, path):
+        info = self.modules.get(path)
+        if info is None:
+            with open(path, 'r', encoding='utf-8') as f:
+                content = f.read()
+            imports = []
+            for m in _IMPORT.finditer(content):
+                target = resolve_import(m.group(1) or m.group(2), path, self.aliases)
+                if target is not None and target not in imports:
+                    imports.append(target)
+            info = self.modules[path] = ModuleInfo(imports, module_namespaces(content))
+        return info
+
+    def reachable(self, roots):
+        """Every module reachable from roots, roots included"""
+        seen = set()
+        todo = list(roots)
+        while todo:
+            path = todo.pop()
+            if path in seen:
+                continue
+            seen.add(path)
+            todo.extend(self.info(path).imports)
+        return seen
+
+    def namespaces(self, roots):
+        found = set()
+        for path in self.reachable(roots):
+            found |= self.info(path).namespaces
+        return found
+
+
+def _tag_end(src, pos):
+    """Return (end, self_closing) for a JSX tag whose attributes start at pos"""
+    depth = 0
+    quote = None
+    while pos < len(src):
+        ch = src[pos]
+        if quote:
+            if ch == quote:
+                quote = None
+        elif ch in "\"'`":
+            quote = ch
+        elif ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+        elif ch == ">" and depth == 0:
+            return pos + 1, src[pos - 1] == "/"
+        pos += 1
+    return pos, True
+
+
+_ROUTE_TAG = re.compile(r'<Route\b|</Route\s*>')
+_PATH_ATTR = re.compile(r'''\bpath=(?:"([^"]*)"|'([^']*)'|\{\s*["'`]([^"'`]*)["'`]\s*\})''')
+_INDEX_ATTR = re.compile(r'\bindex\b(?!\s*=\s*\{\s*false)')
+_COMPONENT = re.compile(r'<([A-Z][\w.]*)')
+
+
+def _join_route(parent, path):
+    if path.startswith("/"):
+        return path
+    return parent.rstrip("/") + "/" + path if path else parent
+
+
+def parse_routes(source):
+    """Return a Route(path, components) for every <Route> that renders a path
+
+    Components are the element={...} components of the route and of every
+    enclosing layout route, outermost first.
+    """
+    routes = []
+    # Each entry: (path, components) of an open <Route>...</Route>
+    stack = [("/", [])]
+    for m in _ROUTE_TAG.finditer(source):
+        if m.group().startswith("</"):
+            if len(stack) > 1:
+                stack.pop()
+            continue
+
+        end, self_closing = _tag_end(source, m.end())
+        attrs = source[m.end():end]
+        parent_path, parent_components = stack[-1]
+
+        props = _strip_element(attrs)
+        path_match = _PATH_ATTR.search(props)
+        path = next((g for g in path_match.groups() if g is not None), "") if path_match else None
+        element = _element_attr(attrs)
+        components = parent_components + [c for c in _COMPONENT.findall(element) if c not in parent_components]
+
+        full_path = _join_route(parent_path, path) if path is not None else parent_path
+        if path is not None or _INDEX_ATTR.search(props):
+            routes.append(Route(full_path, components))
+        if not self_closing:
+            stack.append((full_path, components))
+    return routes
+
+
+def _element_attr(attrs):
+    """Return the body of element={...}, or ''"""
+    start = attrs.find("element={")
+    if start == -1:
+        return ""
+    pos = start + len("element={")
+    depth = 1
+    for i in range(pos, len(attrs)):
+        if attrs[i] == "{":
+            depth += 1
+        elif attrs[i] == "}":
+            depth -= 1
+            if depth == 0:
+                return attrs[pos:i]
+    return attrs[pos:]
+
+
+def _strip_element(attrs):
+    """attrs without the element={...} body, so nested props do not match"""
+    body = _element_attr(attrs)
+    return attrs.replace(body, "", 1) if body else attrs
+
+
+def _ordered(namespaces):
+    rank = {ns: i for i, ns in enumerate(NAMESPACE_ORDER)}
+    return sorted(namespaces, key=lambda ns: (rank.get(ns, len(rank)), ns))
+
+
+def build_manifest(entry=DEFAULT_ENTRY, tsconfig=DEFAULT_TSCONFIG):
+    """Analyse entry and return the manifest dict
+
+    shell holds what the entry module needs outside any route (stores,
+    helpers, the entry itself); every route lists its full set, shell
+    included, so a loader can take one lookup per navigation.
+    """
+    graph = ImportGraph(load_aliases(tsconfig))
+    with open(entry, 'r', encoding='utf-8') as f:
+        source = f.read()
+
+    imported = {}
+    for name, spec in _DEFAULT_IMPORT.findall(source):
+        target = resolve_import(spec, entry, graph.aliases)
+        if target is not None:
+            imported[name] = target
+
+    routes = parse_routes(source)
+    # Imported components only count for the routes that render them
+    components = set(imported.values())
+    shell_roots = [p for p in graph.info(entry).imports if p not in components]
+    shell = graph.namespaces(shell_roots) | graph.info(entry).namespaces
+
+    entries = {}
+    for route in routes:
+        roots = [imported[c] for c in route.components if c in imported]
+        namespaces = graph.namespaces(roots) | shell
+        entry_data = entries.setdefault(route.path, {"components": [], "namespaces": []})
+        entry_data["components"] = sorted(set(entry_data["components"]) | set(route.components))
+        entry_data["namespaces"] = _ordered(set(entry_data["namespaces"]) | namespaces)
+
+    used = set(shell)
+    for data in entries.values():
+        used.update(data["namespaces"])
+    return {
+        "version": MANIFEST_VERSION,
+        "entry": entry,
+        "shell": _ordered(shell),
+        "namespaces": _ordered(used),
+        "routes": entries,
+    }
+
+
+def route_pattern(path):
+    """JS regex source for a react-router path: :param, :param? and * segments"""
+    parts = []
+    for segment in path.strip("/").split("/"):
+        if not segment:
+            continue
+        if segment == "*":
+            parts.append("(?:/.*)?")
+        elif segment.startswith(":") and segment.endswith("?"):
+            parts.append("(?:/[^/]+)?")
+        elif segment.startswith(":"):
+            parts.append("/[^/]+")
+        else:
+            parts.append("/" + re.escape(segment))
+    return "^" + "".join(parts) + "/?$"
+
+
+_LOADER_TEMPLATE = """\
+// Generated by `python3 -m i18n_tools routes --loader`; do not edit.
+// Namespaces each route reaches, from the import graph of {entry}.
+import i18n from '{i18n_import}'
+
+export const SHELL_NAMESPACES: string[] = {shell}
+// Used for paths no route matches
+export const ALL_NAMESPACES: string[] = {all}
+
+const ROUTES: Array<[RegExp, string[]]> = [
+{routes}
+]
+
+// Hashed bundles from `python3 -m i18n_tools bundle --hashed`; the source
+// JSON is the fallback when no manifest is deployed (vite dev server)
+const ASSET_BASE = '{assets_base}'
+const loaders = import.meta.glob('{locales_glob}')
+
+type Bundle = Record<string, unknown>
+let assetManifest: Promise<Record<string, Record<string, string>> | null> | null = null
+
+function loadAssetManifest() {{
+  if (!assetManifest) {{
+    assetManifest = fetch(`${{ASSET_BASE}}manifest.json`, {{ cache: 'no-cache' }})
+      .then((res) => (res.ok ? res.json() : null))
+      .then((data) => (data ? data.assets : null))
+      .catch(() => null)
+  }}
+  return assetManifest
+}}
+
+async function loadBundle(lang: string, ns: string): Promise<Bundle | null> {{
+  const file = (await loadAssetManifest())?.[lang]?.[ns]
+  if (file) {{
+    const res = await fetch(ASSET_BASE + file)
+    if (res.ok) return (await res.json()) as Bundle
+  }}
+  const load = loaders[`{locales_prefix}/${{lang}}/${{ns}}.json`]
+  return load ? ((await load()) as {{ default: Bundle }}).default : null
+}}
+
+export function namespacesForPath(pathname: string): string[] {{
+  const match = ROUTES.find(([pattern]) => pattern.test(pathname))
+  return match ? match[1] : ALL_NAMESPACES
+}}
+
+export async function loadRouteNamespaces(pathname: string, lang: string = i18n.language): Promise<void> {{
+  const missing = namespacesForPath(pathname).filter((ns) => !i18n.hasResourceBundle(lang, ns))
+  await Promise.all(
+    missing.map(async (ns) => {{
+      const bundle = await loadBundle(lang, ns)
+      if (bundle) i18n.addResourceBundle(lang, ns, bundle, true, true)
+    }})
+  )
+}}
+"""
+
+
+def _relative_import(from_file, target):
+    rel = os.path.relpath(target, os.path.dirname(from_file) or ".").replace(os.sep, "/")
+    return rel if rel.startswith(".") else "./" + rel
+
+
+def render_loader(manifest, out_path, i18n_module="src/i18n.ts", locales_dir="src/locales", assets_base=DEFAULT_ASSETS_BASE):
+    """Return TypeScript for a loader module written at out_path
+
+    assets_base is the URL the hashed bundles and their manifest.json are
+    served from.
+    """
+    # Most specific routes first: splats last, then more literal segments, then longer paths
+    def specificity(path):
+        segments = [s for s in path.strip("/").split("/") if s]
+        literal = sum(1 for s in segments if not s.startswith(":") and s != "*")
+        return ("*" in segments, -literal, -len(segments), path)
+
+    lines = [
+        f"  [/{route_pattern(path).replace('/', chr(92) + '/')}/, {json.dumps(data['namespaces'])}],"
+        for path, data in sorted(manifest["routes"].items(), key=lambda item: specificity(item[0]))
+    ]
+    locales_prefix = _relative_import(out_path, locales_dir)
+    return _LOADER_TEMPLATE.format(
+        entry=manifest["entry"],
+        i18n_import=_relative_import(out_path, os.path.splitext(i18n_module)[0]),
+        shell=json.dumps(manifest["shell"]),
+        all=json.dumps(manifest["namespaces"]),
+        routes="\n".join(lines),
+        locales_glob=f"{locales_prefix}/*/*.json",
+        locales_prefix=locales_prefix,
+        assets_base=assets_base,
+    )
@@ -0,0 +1,178 @@
+"""
+Curated Thai text -> i18n key rules
+
+The engine builds most of its table from src/locales/th (see locales.py);
+these entries only apply where that index has no entry for the text, to
+map variants that are not locale values themselves, or where several
+keys share the text, to pick one. A text with one exact locale key always
+gets that key, and every key here must be defined in the locales.
+"""
+
+# Kept as (thai_text, i18n_key) pairs rather than a dict literal so a
+# duplicated text is caught by compile_rules() instead of silently
+# overwriting the earlier entry.
+RULES = [
+    # Dashboard & Common
+    ("แดชบอร์ด", "member:dashboard.title"),
+    ("ยินดีต้อนรับ", "member:dashboard.welcome"),
+    ("ยอดเงินคงเหลือ", "member:credit.balance"),
+    ("เครดิต", "member:credit.credit"),
+    ("ฝากวันนี้", "member:dashboard.todayDeposit"),
+    ("ถอนวันนี้", "member:dashboard.todayWithdrawal"),
+    ("แทงวันนี้", "member:dashboard.todayBet"),
+    ("กำไรวันนี้", "member:dashboard.todayProfit"),
+
+    # Actions
+    ("ยืนยัน", "common:buttons.submit"),
+    # Also used for common:status.cancelled; buttons are by far the common case
+    ("ยกเลิก", "common:buttons.cancel"),
+    ("บันทึก", "common:buttons.save"),
+    ("แก้ไข", "common:buttons.edit"),
+    ("ลบ", "common:buttons.delete"),
+    ("ปิด", "common:buttons.close"),
+    ("ย้อนกลับ", "common:buttons.back"),
+    ("ถัดไป", "common:buttons.next"),
+    ("ค้นหา", "common:buttons.search"),
+    ("รีเฟรช", "common:buttons.refresh"),
+    ("คัดลอก", "common:buttons.copy"),
+    ("อัปโหลด", "common:buttons.upload"),
+    ("เพิ่ม", "common:buttons.add"),
+
+    # Status
+    ("รอดำเนินการ", "common:status.pending"),
+    ("กำลังดำเนินการ", "common:status.processing"),
+    ("สำเร็จ", "common:status.success"),
+    ("ล้มเหลว", "common:status.failed"),
+    ("ไม่สำเร็จ", "common:status.failed"),
+    ("ถูกปฏิเสธ", "common:status.rejected"),
+    ("อนุมัติ", "common:status.approved"),
+    ("เสร็จสิ้น", "common:status.completed"),
+
+    # Messages
+    ("กำลังโหลด...", "common:messages.loading"),
+    ("กำลังโหลดข้อมูล...", "common:messages.loading"),
+    ("ไม่มีข้อมูล", "common:messages.noData"),
+    ("ยังไม่มีรายการ", "common:messages.noData"),
+    ("เกิดข้อผิดพลาด", "common:messages.error"),
+    ("โหลดข้อมูลไม่สำเร็จ", "common:messages.error"),
+
+    # Navigation
+    ("หน้าแรก", "navigation:menu.home"),
+    ("ฝากเงิน", "navigation:menu.deposit"),
+    ("ถอนเงิน", "navigation:menu.withdraw"),
+    ("โปรโมชั่น", "navigation:menu.promotions"),
+    # Same text as member:profile.title; the menu label is what the pages render
+    ("โปรไฟล์", "navigation:menu.profile"),
+    ("ประวัติ", "navigation:menu.history"),
+    ("หวย", "navigation:menu.lottery"),
+    ("เกมส์", "navigation:menu.games"),
+    ("เกม", "navigation:menu.games"),
+    ("แนะนำเพื่อน", "navigation:menu.affiliate"),
+    ("ออกจากระบบ", "navigation:menu.logout"),
+
+    # Profile
+    ("ข้อมูลส่วนตัว", "member:profile.personalInfo"),
+    ("บัญชีธนาคาร", "member:profile.bankAccount"),
+    ("เปลี่ยนรหัสผ่าน", "member:profile.changePassword"),
+    ("ชื่อ-นามสกุล", "member:profile.fullName"),
+    # The login/register field label, shared with member:profile.phone
+    ("เบอร์โทรศัพท์", "auth:login.username"),
+    ("ไลน์ไอดี", "member:profile.lineId"),
+    ("ธนาคาร", "member:profile.bankName"),
+    ("เลขที่บัญชี", "member:profile.accountNumber"),
+    ("ชื่อบัญชี", "member:profile.accountName"),
+    ("รหัสผ่านปัจจุบัน", "member:profile.currentPassword"),
+    ("รหัสผ่านใหม่", "member:profile.newPassword"),
+    ("ยืนยันรหัสผ่านใหม่", "member:profile.confirmPassword"),
+
+    # Deposit
+    ("เลือกวิธีการฝาก", "member:deposit.selectMethod"),
+    ("ระบุจำนวนเงิน", "member:deposit.enterAmount"),
+    ("อัปโหลดสลิป", "member:deposit.uploadSlip"),
+    ("ฝากขั้นต่ำ", "member:deposit.minimumDeposit"),
+
+    # Withdrawal
+    ("ถอนขั้นต่ำ", "member:withdrawal.minimumWithdrawal"),
+    ("เครดิตที่ถอนได้", "member:withdrawal.availableBalance"),
+    ("บัญชีที่รับเงิน", "member:withdrawal.bankAccount"),
+
+    # Transaction
+    ("ประวัติธุรกรรม", "transaction:history"),
+    ("ประวัติฝาก", "transaction:depositHistory"),
+    ("ประวัติถอน", "transaction:withdrawalHistory"),
+    ("ประวัติโบนัส", "transaction:bonusHistory"),
+    ("ไม่มีรายการธุรกรรม", "transaction:noTransactions"),
+    ("ไม่มีรายการ", "transaction:noTransactions"),
+
+    # Lottery
+    ("แทงหวย", "lottery:betting"),
+    ("ผลหวย", "lottery:results"),
+    ("หวยที่เปิดรับ", "member:dashboard.activeLotteries"),
+    ("ไม่มีหวยที่เปิดรับ", "common:messages.noData"),
+    ("3 ตัวบน", "lottery:betTypes.teng_bon_3"),
+    ("3 ตัวโต๊ด", "lottery:betTypes.tode_3"),
+    ("3 ตัวล่าง", "lottery:betTypes.teng_lang_3"),
+    ("2 ตัวบน", "lottery:betTypes.teng_bon_2"),
+    ("2 ตัวล่าง", "lottery:betTypes.teng_lang_2"),
+    ("วิ่งบน", "lottery:betTypes.teng_bon_1"),
+    ("วิ่งล่าง", "lottery:betTypes.teng_lang_1"),
+    ("ยืนยันการแทง", "lottery:confirmBet"),
+    ("แทงหวยสำเร็จ", "lottery:betSuccess"),
+    ("ยกเลิกโพย", "lottery:cancelBet"),
+    ("เปิดรับแทง", "lottery:opened"),
+
+    # Promotion
+    ("รับโปรโมชั่น", "promotion:claim"),
+    ("รับแล้ว", "promotion:claimed_status"),
+    ("รับโปรโมชั่นสำเร็จ", "promotion:claimSuccess"),
+
+    # Auth
+    ("เข้าสู่ระบบ", "auth:login.title"),
+    ("สมัครสมาชิก", "auth:register.title"),
+    ("รหัสผ่าน", "auth:login.password"),
+    ("จำฉันไว้", "auth:login.rememberMe"),
+    ("ยังไม่มีบัญชี", "auth:login.noAccount"),
+    ("มีบัญชีอยู่แล้ว", "auth:register.haveAccount"),
+
+    # Game
+    ("เล่นเลย", "game:playNow"),
+    ("ทดลองเล่น", "game:demo"),
+    ("คาสิโน", "game:categories.casino"),
+    ("สล็อต", "game:categories.slot"),
+]
+
+
+class RuleConflictError(ValueError):
+    """Raised when the rule table maps one Thai text to more than one key"""
+
+    def __init__(self, conflicts):
+        self.conflicts = conflicts
+        lines = [
+            f'  "{text}": {", ".join(keys)}' for text, keys in sorted(conflicts.items())
+        ]
+        super().__init__("Conflicting translation rules:\n" + "\n".join(lines))
+
+
+class UndefinedRuleKeyError(ValueError):
+    """Raised when a rule maps a Thai text to a key no locale defines"""
+
+    def __init__(self, undefined):
+        self.undefined = undefined
+        lines = [f'  "{text}": {key}' for text, key in sorted(undefined.items())]
+        super().__init__("Translation rules with keys the locales do not define:\n" + "\n".join(lines))
+
+
+def compile_rules(rules=RULES):
+    """Validate the rule pairs and return a {thai_text: i18n_key} dict"""
+    table = {}
+    conflicts = {}
+    for text, key in rules:
+        if text in table and table[text] != key:
+            conflicts.setdefault(text, [table[text]])
+            if key not in conflicts[text]:
+                conflicts[text].append(key)
+        table.setdefault(text, key)
+
+    if conflicts:
+        raise RuleConflictError(conflicts)
+    return table
@@ -0,0 +1,90 @@
+"""
+Run the engine over a file list, optionally across a process pool
+"""
+import multiprocessing
+import os
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from .engine import Engine
+from .patch import PatchConflictError
+from .profile import new_stats
+from .validate import ValidationError
+
+# stats is the per-file profile dict, or None when not profiling;
+# diff is the unified diff in diff mode, where nothing is written
+FileResult = namedtuple("FileResult", "path changed error stats diff")
+
+# One engine per process: the parent's, inherited by forked workers, or
+# built once per worker by _init_worker where processes are spawned
+_engine = None
+_profile = False
+_diff = False
+
+
+def _init_worker(engine_options, profile=False, diff=False):
+    global _engine, _profile, _diff
+    _engine = Engine(**engine_options)
+    _profile = profile
+    _diff = diff
+
+
+def _adopt_engine(engine, profile=False, diff=False):
+    global _engine, _profile, _diff
+    _engine = engine
+    _profile = profile
+    _diff = diff
+
+
+def _process(filepath):
+    stats = new_stats() if _profile else None
+    started = time.perf_counter()
+    diff = None
+    try:
+        if _diff:
+            diff = _engine.diff_file(filepath, stats)
+            changed = bool(diff)
+        else:
+            changed = bool(_engine.process_file(filepath, stats))
+        error = None
+    except (OSError, UnicodeDecodeError, PatchConflictError) as e:
+        changed, error = False, str(e)
+    except ValidationError as e:
+        first = e.problems[0]
+        changed, error = False, f"{first.line}:{first.column}: {first.message} (not written)"
+    if stats is not None:
+        stats["seconds"] = time.perf_counter() - started
+    return FileResult(filepath, changed, error, stats, diff)
+
+
+def resolve_jobs(jobs):
+    """0 or a negative count means one worker per CPU"""
+    if jobs is None or jobs < 1:
+        return os.cpu_count() or 1
+    return jobs
+
+
+def run_files(engine, files, jobs=1, profile=False, diff=False, **engine_options):
+    """Run an Engine already built in this process over files
+
+    Returns one FileResult per file, in input order. Serial runs use
+    engine itself; where the platform forks, workers inherit it as it is
+    and compile nothing. Elsewhere each worker builds its own from
+    engine_options, which must describe the same engine. With profile
+    each result carries its rule hits and timings; with diff nothing is
+    written and each result carries its unified diff instead.
+    """
+    jobs = min(resolve_jobs(jobs), max(len(files), 1))
+    _adopt_engine(engine, profile, diff)
+    if jobs == 1:
+        return [_process(filepath) for filepath in files]
+
+    # A few chunks per worker keeps IPC low without starving the tail
+    chunksize = max(1, len(files) // (jobs * 4))
+    if "fork" in multiprocessing.get_all_start_methods():
+        pool = ProcessPoolExecutor(max_workers=jobs, mp_context=multiprocessing.get_context("fork"))
+    else:
+        pool = ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(engine_options, profile, diff))
+    with pool:
+        return list(pool.map(_process, files, chunksize=chunksize))
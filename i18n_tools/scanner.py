@@ -0,0 +1,73 @@
+"""
+Streaming scanner for Thai text still left in the source tree
+
+Every stage is a generator, so only one file is held in memory at a time:
+files -> sources with Thai -> string tokens -> Thai runs -> findings.
+"""
+import re
+from collections import namedtuple
+
+from .lexer import JSX_TEXT, TEMPLATE_CHUNK, iter_strings
+from .locales import THAI_RE
+from .prefilter import has_thai_bytes
+from .textutil import T_CALL_BEFORE, LineIndex
+
+# Thai words, optionally joined by single spaces, as one run
+THAI_RUN = re.compile('[\u0e00-\u0e7f]+(?: [\u0e00-\u0e7f]+)*')
+
+# blocked says why translate leaves the literal alone even with a key,
+# None when nothing stops it
+Finding = namedtuple("Finding", "path line column kind text literal context suggestion blocked")
+
+SHADOWED = "t is a parameter or local here"
+
+
+def iter_sources(files):
+    """Yield (path, content) for files that contain any Thai at all"""
+    for path in files:
+        try:
+            # Files without Thai lead bytes are never decoded
+            if not has_thai_bytes(path):
+                continue
+            with open(path, 'r', encoding='utf-8') as f:
+                content = f.read()
+        except (OSError, UnicodeDecodeError):
+            continue
+        if THAI_RE.search(content):
+            yield path, content
+
+
+def iter_findings(path, content, table=None, jsx=None):
+    """Yield a Finding for every Thai run outside comments and t() calls"""
+    if jsx is None:
+        jsx = path.endswith('.tsx')
+    table = table or {}
+    lines = None
+
+    # A local t shadows its whole block, so one file is lexed in full first
+    for token in list(iter_strings(content, jsx)):
+        if not THAI_RE.search(token.value):
+            continue
+        # Literal passed straight to t(): a key or default value, not UI text
+        if T_CALL_BEFORE.search(content, max(0, token.start - 16), token.start):
+            continue
+        if lines is None:
+            lines = LineIndex(content)
+
+        literal = " ".join(token.value.split())
+        literal_key = table.get(literal)
+        # Quoted literals start one char after the token span
+        body_start = token.start if token.kind in (JSX_TEXT, TEMPLATE_CHUNK) else token.start + 1
+        blocked = SHADOWED if token.scope is not None and token.scope.shadowed(token.start) else None
+        for run in THAI_RUN.finditer(token.value):
+            line, column = lines.locate(body_start + run.start())
+            yield Finding(
+                path, line, column, token.kind, run.group(), literal,
+                lines.line_text(line), literal_key or table.get(run.group()), blocked,
+            )
+
+
+def scan(files, table=None):
+    """Yield findings for every file, in file order"""
+    for path, content in iter_sources(files):
+        yield from iter_findings(path, content, table)
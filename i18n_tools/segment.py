@@ -0,0 +1,202 @@
+"""
+Dictionary-driven Thai segmentation: known phrases inside longer strings
+
+The translator only rewrites a literal that is exactly a table text.
+Segmenter finds the known pieces of everything else by maximal matching:
+at each position the longest known phrase wins, then matching resumes
+after it. Plain phrases come from the locale reverse index, compiled into
+the same factored trie regex the matcher uses, so a pass costs one regex
+scan per string. Interpolated entries ("ยอดฝากขั้นต่ำ {{amount}} บาท")
+become patterns whose {{param}} slots take a number, a word without Thai
+or a ${expr} / {expr} placeholder, which turns into a t() parameter.
+"""
+import json
+import re
+from collections import namedtuple
+
+from .locales import DEFAULT_LOCALES_DIR, SOURCE_LANG, THAI_RE, LocaleIndex
+from .textutil import build_trie, trie_to_regex
+
+# Shorter phrases ("ลบ", "ดู") match inside too many unrelated words
+MIN_PHRASE = 3
+
+# One {{param}} value: a placeholder, or one run of non-space, non-Thai text
+_PARAM_VALUE = r'(?:\$\{[^{}]*\}|\{[^{}]*\}|[^\s' + '\u0e00-\u0e7f' + ']+)'
+_PARAM = re.compile(r'\{\{\s*(\w+)\s*\}\}')
+_PLACEHOLDER = re.compile(r'^\$?\{\s*(.*?)\s*\}$', re.DOTALL)
+_NUMBER = re.compile(r'^-?\d+(?:\.\d+)?$')
+_AMOUNT = re.compile(r'^-?\d[\d,]*(?:\.\d+)?$')
+_IDENTIFIER = re.compile(r'[A-Za-z_$][\w$]*')
+_CURRENCY = re.compile('บาท|฿')
+
+# key is None for text between known phrases; params maps {{name}} -> value text
+Segment = namedtuple("Segment", "start end text key params")
+
+# call is the t() expression when known phrases cover all of the Thai, else
+# None; template is the locale text call needs when the key does not have it
+# yet ("ฝากขั้นต่ำ {{amount}} บาท" for a phrase plus a number), else None
+Proposal = namedtuple("Proposal", "call coverage segments template")
+
+
+def _template_regex(text, prefix):
+    """Regex for an interpolated entry; {{name}} number n becomes group <prefix>p<n>"""
+    parts = []
+    names = []
+    pos = 0
+    for match in _PARAM.finditer(text):
+        parts.append(re.escape(text[pos:match.start()]))
+        parts.append(f"(?P<{prefix}p{len(names)}>{_PARAM_VALUE})")
+        names.append(match.group(1))
+        pos = match.end()
+    parts.append(re.escape(text[pos:]))
+    # Any run of whitespace in the entry matches any run in the source
+    return re.sub(r'(?:\\ )+', r'\\s+', "".join(parts)), names
+
+
+def param_expression(value):
+    """TypeScript for one parameter value found in source text"""
+    placeholder = _PLACEHOLDER.match(value)
+    if placeholder:
+        return placeholder.group(1)
+    if _NUMBER.match(value):
+        return value
+    return json.dumps(value, ensure_ascii=False)
+
+
+def render_call(key, params):
+    if not params:
+        return f't("{key}")'
+    args = ", ".join(f"{name}: {param_expression(value)}" for name, value in params.items())
+    return f't("{key}", {{ {args} }})'
+
+
+class Segmenter:
+    """Maximal-matching segmenter over a language's locale entries"""
+
+    def __init__(self, entries, index):
+        """entries is {key: text} for templates, index the {text: key} reverse index"""
+        phrases = [text for text in index if len(text) >= MIN_PHRASE]
+        self.index = index
+        self.phrases = re.compile(trie_to_regex(build_trie(phrases))) if phrases else None
+
+        templates = {}
+        for key, text in entries.items():
+            text = " ".join(text.split())
+            if "{{" in text and text not in templates and THAI_RE.search(text):
+                templates[text] = key
+        # Longest literal text first, so the most specific template wins ties
+        self.templates = []
+        for text in sorted(templates, key=lambda text: (-len(_PARAM.sub("", text)), text)):
+            pattern, names = _template_regex(text, f"t{len(self.templates)}")
+            self.templates.append((templates[text], names, pattern))
+        self.template_pattern = None
+        if self.templates:
+            self.template_pattern = re.compile("|".join(
+                f"(?P<t{i}>{pattern})" for i, (_, _, pattern) in enumerate(self.templates)
+            ))
+
+    @classmethod
+    def from_locales(cls, locales_dir=DEFAULT_LOCALES_DIR, lang=SOURCE_LANG):
+        locales = LocaleIndex.load(locales_dir, lang)
+        return cls(locales.entries, locales.index)
+
+    def _template_segment(self, match):
+        # The outer t<i> group closes last, so it is the one lastgroup names
+        i = int(match.lastgroup[1:])
+        key, names, _ = self.templates[i]
+        params = {name: match.group(f"t{i}p{n}") for n, name in enumerate(names)}
+        return Segment(match.start(), match.end(), match.group(), key, params)
+
+    def _next(self, pattern, text, pos):
+        return pattern.search(text, pos) if pattern is not None else None
+
+    def segment(self, text):
+        """Split text (whitespace collapsed) into [Segment], known phrases keyed
+
+        At every position the longer of the template and phrase matches is
+        taken; each pattern is searched again only once matching has moved
+        past its last hit, so a string is scanned a bounded number of times.
+        """
+        text = " ".join(text.split())
+        segments = []
+        pos = 0
+        template = self._next(self.template_pattern, text, 0)
+        phrase = self._next(self.phrases, text, 0)
+        while template is not None or phrase is not None:
+            if template is not None and template.start() < pos:
+                template = self._next(self.template_pattern, text, pos)
+            if phrase is not None and phrase.start() < pos:
+                phrase = self._next(self.phrases, text, pos)
+            candidates = [m for m in (template, phrase) if m is not None and m.end() > m.start()]
+            if not candidates:
+                break
+            best = min(candidates, key=lambda m: (m.start(), -(m.end() - m.start())))
+            if best.start() > pos:
+                segments.append(Segment(pos, best.start(), text[pos:best.start()], None, {}))
+            if best is template:
+                segments.append(self._template_segment(best))
+            else:
+                segments.append(Segment(best.start(), best.end(), best.group(), self.index[best.group()], {}))
+            pos = best.end()
+        if pos < len(text):
+            segments.append(Segment(pos, len(text), text[pos:], None, {}))
+        return segments
+
+    def propose(self, text):
+        """Return a Proposal for text: its segments, the share of Thai
+        characters known phrases cover, and a t() call when they cover all
+        of it, either one entry as it stands or phrases around numbers and
+        placeholders, drafted as a new interpolated template"""
+        segments = self.segment(text)
+        thai = covered = 0
+        for segment in segments:
+            count = len(THAI_RE.findall(segment.text))
+            thai += count
+            if segment.key is not None:
+                covered += count
+        coverage = round(covered / thai, 4) if thai else 0.0
+        keyed = [segment for segment in segments if segment.key is not None]
+        if not thai or covered != thai:
+            return Proposal(None, coverage, segments, None)
+        if len(keyed) == 1 and all(not s.text.strip() for s in segments if s.key is None):
+            return Proposal(render_call(keyed[0].key, keyed[0].params), coverage, segments, None)
+        return self._draft(segments, keyed, coverage)
+
+    def _draft(self, segments, keyed, coverage):
+        """Phrases with numbers or placeholders between them: one template, keyed by the first phrase"""
+        if any(segment.params for segment in keyed):
+            return Proposal(None, coverage, segments, None)
+        parts = []
+        params = {}
+        for i, segment in enumerate(segments):
+            value = segment.text.strip()
+            if segment.key is not None or not value:
+                parts.append(segment.text)
+                continue
+            if not (_PLACEHOLDER.match(value) or _AMOUNT.match(value)):
+                # Punctuation or Latin text stays literal
+                parts.append(segment.text)
+                continue
+            name = self._param_name(value, segments, i, params)
+            params[name] = value.replace(",", "") if _AMOUNT.match(value) else value
+            parts.append(segment.text.replace(value, f"{{{{{name}}}}}"))
+        if not params:
+            return Proposal(None, coverage, segments, None)
+        template = "".join(parts).strip()
+        return Proposal(render_call(keyed[0].key, params), coverage, segments, template)
+
+    @staticmethod
+    def _param_name(value, segments, i, taken):
+        placeholder = _PLACEHOLDER.match(value)
+        if placeholder:
+            names = _IDENTIFIER.findall(placeholder.group(1))
+            name = names[-1] if names else "value"
+        else:
+            around = "".join(s.text for s in segments[max(i - 1, 0):i + 2])
+            name = "amount" if _CURRENCY.search(around) else "count"
+        unique = name
+        n = 2
+        while unique in taken:
+            unique = f"{name}{n}"
+            n += 1
+        return unique
@@ -0,0 +1,213 @@
+"""
+JSON-RPC 2.0 over stdio, one message per line, for build tools
+
+A Vite plugin spawns `python3 -m i18n_tools serve --stdio` once and sends
+file contents as they load; the rule table and locale index stay warm
+between calls, so each file costs only its own rewrite. Batches (JSON
+arrays) are answered with arrays, notifications (no id) get no answer.
+
+Methods:
+  transform {files: [{path, content}]}
+      -> {files: [{path, changed, content, edits, diagnostics}]}
+  check     {files: [{path, content}]} -> {files: [{path, diagnostics}]}
+  info      {} -> {fingerprint, entries, translate, fix, validate}
+  reload    {} -> info, after rebuilding the engine (locale edits)
+  shutdown  {} -> null, then the server exits
+
+Edit offsets count Unicode code points of content, like the rest of the
+package; they equal JS string offsets except around astral characters.
+"""
+import json
+import subprocess
+import sys
+import time
+
+from .engine import Engine
+from .patch import diff_edits
+from .validate import ValidationError, check_balance, check_rewrite
+
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+
+class RpcError(Exception):
+    def __init__(self, code, message):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+def _problems(problems):
+    return [{"line": p.line, "column": p.column, "message": p.message} for p in problems]
+
+
+def _files(params):
+    files = params.get("files") if isinstance(params, dict) else None
+    if not isinstance(files, list) or not all(
+        isinstance(f, dict) and isinstance(f.get("path"), str) and isinstance(f.get("content"), str)
+        for f in files
+    ):
+        raise RpcError(INVALID_PARAMS, "params.files must be a list of {path, content} strings")
+    return files
+
+
+class Server:
+    """Dispatches decoded JSON-RPC messages to one long-lived Engine"""
+
+    def __init__(self, **engine_options):
+        self.engine_options = engine_options
+        self.engine = Engine(**engine_options)
+        self.running = True
+
+    def transform_one(self, path, content):
+        started = time.perf_counter()
+        engine = self.engine
+        new, _ = engine.process(content, path)
+        diagnostics = []
+        if engine.validate and new != content:
+            try:
+                check_rewrite(path, content, new)
+            except ValidationError as e:
+                # Same policy as the CLI: a rewrite that breaks the file is not applied
+                diagnostics = _problems(e.problems)
+                new = content
+        edits = diff_edits(content, new)
+        return {
+            "path": path,
+            "changed": bool(edits),
+            "content": new,
+            "edits": [edit._asdict() for edit in edits],
+            "diagnostics": diagnostics,
+            "micros": round((time.perf_counter() - started) * 1e6),
+        }
+
+    def rpc_transform(self, params):
+        return {"files": [self.transform_one(f["path"], f["content"]) for f in _files(params)]}
+
+    def rpc_check(self, params):
+        return {"files": [
+            {"path": f["path"], "diagnostics": _problems(check_balance(f["content"], f["path"].endswith(".tsx")))}
+            for f in _files(params)
+        ]}
+
+    def rpc_info(self, params):
+        return {
+            "fingerprint": self.engine.fingerprint,
+            "entries": len(self.engine.table),
+            "translate": self.engine.translate,
+            "fix": self.engine.fix,
+            "validate": self.engine.validate,
+        }
+
+    def rpc_reload(self, params):
+        try:
+            engine = Engine(**self.engine_options)
+        except ValueError as e:
+            # Broken locale JSON or a rule key gone from the locales: keep
+            # serving with the engine we have
+            raise RpcError(INTERNAL_ERROR, str(e))
+        self.engine = engine
+        return self.rpc_info(params)
+
+    def rpc_shutdown(self, params):
+        self.running = False
+        return None
+
+    def _call(self, message):
+        """Return the response dict for one request, None for a notification"""
+        if not isinstance(message, dict) or message.get("jsonrpc") != "2.0" or not isinstance(message.get("method"), str):
+            return {"jsonrpc": "2.0", "id": None, "error": {"code": INVALID_REQUEST, "message": "invalid request"}}
+        notification = "id" not in message
+        try:
+            method = getattr(self, "rpc_" + message["method"], None)
+            if method is None:
+                raise RpcError(METHOD_NOT_FOUND, f"unknown method {message['method']}")
+            result = method(message.get("params") or {})
+        except RpcError as e:
+            if notification:
+                return None
+            return {"jsonrpc": "2.0", "id": message["id"], "error": {"code": e.code, "message": e.message}}
+        if notification:
+            return None
+        return {"jsonrpc": "2.0", "id": message["id"], "result": result}
+
+    def handle(self, message):
+        """Answer a decoded message or batch; None when there is nothing to send"""
+        if isinstance(message, list):
+            if not message:
+                return {"jsonrpc": "2.0", "id": None, "error": {"code": INVALID_REQUEST, "message": "empty batch"}}
+            responses = [r for r in map(self._call, message) if r is not None]
+            return responses or None
+        return self._call(message)
+
+    def handle_line(self, line):
+        try:
+            message = json.loads(line)
+        except ValueError as e:
+            return {"jsonrpc": "2.0", "id": None, "error": {"code": PARSE_ERROR, "message": str(e)}}
+        return self.handle(message)
+
+    def serve(self, stdin=None, stdout=None):
+        """Read requests line by line until EOF or shutdown"""
+        stdin = stdin or sys.stdin.buffer
+        stdout = stdout or sys.stdout.buffer
+        for line in stdin:
+            if not line.strip():
+                continue
+            response = self.handle_line(line.decode('utf-8', 'replace'))
+            if response is not None:
+                stdout.write(json.dumps(response, ensure_ascii=False).encode('utf-8') + b"\n")
+                stdout.flush()
+            if not self.running:
+                break
+
+
+class StdioClient:
+    """Minimal client that drives a `serve --stdio` subprocess, as the Vite plugin would
+
+        with StdioClient() as client:
+            result = client.transform([{"path": "src/pages/Home.tsx", "content": text}])
+    """
+
+    def __init__(self, args=(), command=None):
+        self.command = command or [sys.executable, "-m", "i18n_tools", "serve", "--stdio", *args]
+        self.process = subprocess.Popen(self.command, stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+        self.next_id = 0
+
+    def call(self, method, params=None):
+        self.next_id += 1
+        request = {"jsonrpc": "2.0", "id": self.next_id, "method": method, "params": params or {}}
+        self.process.stdin.write(json.dumps(request, ensure_ascii=False).encode('utf-8') + b"\n")
+        self.process.stdin.flush()
+        line = self.process.stdout.readline()
+        if not line:
+            raise ConnectionError(f"server exited with status {self.process.wait()}")
+        response = json.loads(line)
+        if "error" in response:
+            raise RpcError(response["error"]["code"], response["error"]["message"])
+        return response["result"]
+
+    def transform(self, files):
+        return self.call("transform", {"files": files})["files"]
+
+    def check(self, files):
+        return self.call("check", {"files": files})["files"]
+
+    def close(self):
+        if self.process.poll() is None:
+            try:
+                self.call("shutdown")
+            except (ConnectionError, BrokenPipeError):
+                pass
+            self.process.stdin.close()
+            self.process.wait()
+        self.process.stdout.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,111 @@
+"""
+Source and key helpers shared by the stages
+
+The regexes that recognise t() calls, key prefixes and plural suffixes,
+the namespace each useTranslation() hook gives unprefixed keys, the
+offset -> line/column index the reports use, and the factored trie regex
+the matcher and the segmenter compile their phrase tables into.
+"""
+import bisect
+import re
+
+# i18next plural suffixes: "items_one" is read through t("items"). Numeric
+# endings are not among them: lottery:betTypes.teng_bon_1 is a key of its own
+PLURAL_SUFFIX = re.compile(r'_(?:zero|one|two|few|many|other|plural)$')
+
+# Literal passed straight to t(): search the few characters before it
+T_CALL_BEFORE = re.compile(r'\bt\(\s*\Z')
+
+# A useTranslation() hook and the first namespace it names, if any
+USE_TRANSLATION = re.compile(r'\buseTranslation\(\s*(?:\[\s*)?(?:[\'"]([\w-]+)[\'"])?')
+
+# "ns:path." prefix of dynamically built keys
+KEY_PREFIX_SHAPE = re.compile(r'^[\w-]+:[\w.-]*\.$')
+
+# Longest source line a report quotes
+CONTEXT_WIDTH = 120
+
+
+class LineIndex:
+    """Offset -> (line, column), both 1-based"""
+
+    def __init__(self, content):
+        self.content = content
+        self.starts = [0] + [m.end() for m in re.finditer('\n', content)]
+
+    def locate(self, offset):
+        line = bisect.bisect_right(self.starts, offset) - 1
+        return line + 1, offset - self.starts[line] + 1
+
+    def line_text(self, line):
+        start = self.starts[line - 1]
+        end = self.content.find('\n', start)
+        text = self.content[start:] if end == -1 else self.content[start:end]
+        return text.strip()[:CONTEXT_WIDTH]
+
+
+class HookNamespaces:
+    """The namespace an unprefixed t("key") reads, per useTranslation() hook
+
+    A file can hold several components, each with its own hook: a key
+    reads the namespace of the nearest hook before it in the same
+    top-level function (the lexer's Scope), and default where there is
+    none or the hook names no namespace.
+    """
+
+    def __init__(self, content, default):
+        self.default = default
+        self.offsets = []
+        self.namespaces = []
+        for m in USE_TRANSLATION.finditer(content):
+            self.offsets.append(m.start())
+            self.namespaces.append(m.group(1) or default)
+
+    def namespace(self, offset, scope):
+        i = bisect.bisect_right(self.offsets, offset) - 1
+        if i < 0 or scope is None or self.offsets[i] < scope.start:
+            return self.default
+        return self.namespaces[i]
+
+
+def build_trie(words):
+    """Build a nested dict trie, '' marks the end of a word"""
+    trie = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = True
+    return trie
+
+
+def trie_to_regex(root):
+    """Turn a trie into a factored regex so matching cost follows text length, not key count
+
+    The trie is walked with an explicit stack: it is one level deep per
+    character, and a locale value of a few hundred characters would
+    exceed the recursion limit.
+    """
+    patterns = {}
+    stack = [(root, False)]
+    while stack:
+        node, children_done = stack.pop()
+        if not children_done:
+            stack.append((node, True))
+            stack.extend((child, False) for ch, child in node.items() if ch != "")
+            continue
+
+        branches = [
+            re.escape(ch) + patterns.pop(id(child))
+            for ch, child in sorted(node.items())
+            if ch != ""
+        ]
+        if not branches:
+            patterns[id(node)] = ""
+            continue
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if "" in node:
+            # Greedy optional group: the longer phrase is always tried first
+            body = "(?:" + body + ")?"
+        patterns[id(node)] = body
+    return patterns[id(root)]
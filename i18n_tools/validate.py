@@ -0,0 +1,237 @@
+"""
+Balance checker for rewritten TS/TSX: brackets, strings, comments,
+template literals and JSX tags
+
+Runs the lexer with bookkeeping on top, so it agrees with the translator
+on what is a string, a regex or JSX. It is not a type checker; it catches
+what the old scripts kept producing, {t("key")}} or placeholder={t("key")
+with the exact line and column, in milliseconds instead of a tsc build.
+"""
+import difflib
+import re
+from collections import Counter, namedtuple
+
+from .lexer import CODE_FRAME, Lexer
+from .patch import diff_edits
+from .textutil import LineIndex
+
+Problem = namedtuple("Problem", "line column message")
+
+_CLOSERS = {")": "(", "]": "[", "}": "{"}
+
+# Where the other half of a mismatch sits is not part of what the problem is
+_OPENED_AT = re.compile(r' opened at \d+:\d+')
+
+
+class ValidationError(ValueError):
+    """A rewrite introduced balance problems; the file was left as it was"""
+
+    def __init__(self, path, problems):
+        self.path = path
+        self.problems = problems
+        first = problems[0]
+        super().__init__(f"{path}:{first.line}:{first.column}: {first.message}")
+
+
+class _Checker(Lexer):
+    """Lexer that also tracks brackets per code frame and open JSX tags"""
+
+    def __init__(self, source, jsx):
+        super().__init__(source, jsx)
+        # Open brackets of each code frame, keyed by the frame list's id
+        self.brackets = {id(self.stack[0]): []}
+        self.tags = []
+        self.problems = []
+
+    def _report(self, offset, message):
+        self.problems.append((offset, message))
+
+    def _frame_popped(self, frame):
+        for char, offset in self.brackets.pop(id(frame), ()):
+            self._report(offset, f"'{char}' is never closed")
+
+    def _on_stack(self, frame):
+        return any(f is frame for f in self.stack)
+
+    def _sync_frames(self, before):
+        """Open bracket lists for new code frames, check the ones that closed"""
+        for frame in before:
+            if frame[0] == CODE_FRAME and not self._on_stack(frame):
+                self._frame_popped(frame)
+        for frame in self.stack:
+            if frame[0] == CODE_FRAME and id(frame) not in self.brackets:
+                self.brackets[id(frame)] = []
+
+    def _code(self):
+        src = self.src
+        start = self.pos
+        frames = list(self.stack)
+        frame = frames[-1]
+        yield from super()._code()
+        text = src[start:self.pos]
+
+        if len(self.stack) < len(frames):
+            # "}" closing a ${...} or JSX {...}
+            self._sync_frames(frames)
+            return
+        if len(self.stack) > len(frames):
+            # backtick or JSX tag opened
+            self._sync_frames(frames)
+            if self.stack[-1][0] != CODE_FRAME and src[start] == "<":
+                self._open_jsx(start)
+            return
+
+        if text in ("(", "[", "{"):
+            self.brackets[id(frame)].append((text, start))
+        elif text in _CLOSERS:
+            opened = self.brackets[id(frame)]
+            if not opened:
+                self._report(start, f"unexpected '{text}'")
+            elif opened[-1][0] != _CLOSERS[text]:
+                char, offset = opened.pop()
+                line, column = LineIndex(src).locate(offset)
+                self._report(start, f"'{text}' does not match '{char}' opened at {line}:{column}")
+            else:
+                opened.pop()
+        elif text == "/" and src.startswith(">", self.pos) and len(self.stack) > 1:
+            # "/>" is never valid code: the tag ended inside an attribute's {...}
+            self._report(frame[2] - 1, "'{' is not closed before '/>'")
+        elif text[:1] in ("\"", "'") and (len(text) < 2 or text[-1] != text[0]):
+            self._report(start, "unterminated string literal")
+        elif text.startswith("/*") and not text.endswith("*/"):
+            self._report(start, "unterminated comment")
+
+    def _open_jsx(self, start):
+        """Record the tag _open_tag() just consumed, which started at start"""
+        self.tags.append((self.src[start + 1:self.pos], start))
+
+    def _template(self):
+        start_frame = self.stack[-1]
+        frames = list(self.stack)
+        yield from super()._template()
+        if not self._on_stack(start_frame) and not self.src.startswith("`", self.pos - 1):
+            self._report(start_frame[2], "unterminated template literal")
+        self._sync_frames(frames)
+
+    def _tag(self):
+        src = self.src
+        start = self.pos
+        frames = list(self.stack)
+        yield from super()._tag()
+        raw = src[start:self.pos]
+        body = raw.lstrip()
+        offset = start + len(raw) - len(body)
+        if body.startswith("/>"):
+            if self.tags:
+                self.tags.pop()
+        elif body[:1] in ("\"", "'") and (len(body) < 2 or body[-1] != body[0]):
+            self._report(offset, "unterminated attribute string")
+        elif body.startswith("<"):
+            self._open_jsx(offset)
+        self._sync_frames(frames)
+
+    def _children(self):
+        src = self.src
+        start = self.pos
+        frames = list(self.stack)
+        yield from super()._children()
+        text = src[start:self.pos]
+        if text[:1] not in ("<", "{"):
+            # TSX rejects a bare } or > in JSX text, as in {t("key")}}
+            for i, ch in enumerate(text):
+                if ch in "}>":
+                    self._report(start + i, f"unexpected '{ch}' in JSX text")
+        elif src.startswith("</", start):
+            name = src[start + 2:self.pos - 1].strip()
+            if not self.tags:
+                self._report(start, f"closing tag </{name}> without an opening tag")
+            else:
+                opened, offset = self.tags.pop()
+                if opened != name:
+                    line, column = LineIndex(src).locate(offset)
+                    self._report(start, f"</{name}> does not match <{opened}> opened at {line}:{column}")
+        elif len(self.stack) > len(frames) and self.stack[-1][0] != CODE_FRAME:
+            # child element: _open_tag() consumed "<name"
+            self._open_jsx(start)
+        self._sync_frames(frames)
+
+    def raw_problems(self):
+        """[(offset, message)] in detection order"""
+        for _ in self.run():
+            pass
+        for depth, frame in enumerate(self.stack):
+            if frame[0] != CODE_FRAME:
+                continue
+            self._frame_popped(frame)
+            if depth > 0:
+                # the { of a JSX attribute, child expression or ${
+                self._report(frame[2] - 1, "'{' is never closed")
+        for name, offset in self.tags:
+            self._report(offset, f"<{name}> is never closed")
+        return self.problems
+
+    def check(self):
+        # Detection order: the first mismatch is the cause, unclosed openers the echo
+        lines = LineIndex(self.src)
+        return [Problem(*lines.locate(offset), message) for offset, message in self.raw_problems()]
+
+
+def check_balance(source, jsx=True):
+    """Return [Problem(line, column, message)] for source, [] when balanced"""
+    return _Checker(source, jsx).check()
+
+
+def _changed_spans(original, content):
+    """[(old_start, old_end, new_start, new_end)] of the characters a rewrite changed"""
+    spans = []
+    delta = 0
+    for edit in diff_edits(original, content):
+        new_offset = edit.offset + delta
+        chars = difflib.SequenceMatcher(None, edit.old, edit.new, autojunk=False)
+        for tag, i1, i2, j1, j2 in chars.get_opcodes():
+            if tag != "equal":
+                spans.append((edit.offset + i1, edit.offset + i2, new_offset + j1, new_offset + j2))
+        delta += len(edit.new) - len(edit.old)
+    return spans
+
+
+def _original_offset(offset, spans):
+    """Map an offset in the rewritten text back to the original, None inside new text"""
+    shift = 0
+    for old_start, old_end, new_start, new_end in spans:
+        if offset < new_start:
+            break
+        if offset < new_end:
+            return None
+        shift = old_end - new_end
+    return offset + shift
+
+
+def check_rewrite(path, original, content):
+    """Raise ValidationError when content has a problem original did not have
+
+    Problems are compared by kind and position, positions in content being
+    mapped back through the characters the rewrite changed, so a rewrite
+    that fixes one imbalance and causes another is still refused. Files
+    that were already broken are not held to a higher standard than
+    before; a rewrite just must not add to it.
+    """
+    jsx = path.endswith('.tsx')
+    checker = _Checker(content, jsx)
+    problems = checker.check()
+    if not problems:
+        return
+    before = Counter(
+        (_OPENED_AT.sub('', message), offset)
+        for offset, message in _Checker(original, jsx).raw_problems()
+    )
+    spans = _changed_spans(original, content)
+    new = []
+    for problem, (offset, message) in zip(problems, checker.problems):
+        key = (_OPENED_AT.sub('', message), _original_offset(offset, spans))
+        if before[key] > 0:
+            before[key] -= 1
+        else:
+            new.append(problem)
+    if new:
+        raise ValidationError(path, new)
@@ -0,0 +1,266 @@
+"""
+Watch mode: translate (and with --fix, fix) each file as it is saved
+
+One Engine (rule automaton and locale index) stays in memory for the
+whole session, so a save costs one file's rewrite instead of a full run.
+Changes come from inotify on Linux and from an mtime poll everywhere
+else. Events are debounced so an editor's write-rename-chmod burst is one
+rewrite, and files the daemon wrote itself are recognised by their stat
+signature and not processed again.
+"""
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+
+from .engine import Engine
+from .gitfiles import glob_regex
+from .patch import PatchConflictError
+from .validate import ValidationError
+
+DEFAULT_ROOT = "src"
+DEFAULT_DEBOUNCE = 0.05
+DEFAULT_INTERVAL = 0.5
+
+# <sys/inotify.h>
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE_SELF = 0x00000400
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ISDIR = 0x40000000
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+
+# Saves land as close-after-write or, for atomic savers like ours, a rename
+_WATCH_MASK = _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE_SELF
+_EVENT = struct.Struct("iIII")
+
+
+def _walk_files(root):
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [name for name in dirnames if not name.startswith(".")]
+        for name in filenames:
+            yield os.path.join(dirpath, name)
+
+
+def _signature(path):
+    """What identifies one version of a file without reading it"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+class InotifyWatcher:
+    """Recursive inotify watch over root; raises OSError where unavailable"""
+
+    name = "inotify"
+
+    def __init__(self, root):
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify is only available on Linux")
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self.root = root
+        self.fd = self._libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.dirs = {}
+        for dirpath, dirnames, _ in os.walk(root):
+            dirnames[:] = [name for name in dirnames if not name.startswith(".")]
+            self._add(dirpath)
+
+    def _add(self, directory):
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(directory), _WATCH_MASK)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, f"inotify_add_watch {directory}: {os.strerror(errno)}")
+        self.dirs[wd] = directory
+
+    def wait(self, timeout=None):
+        """Return the set of paths changed, empty after timeout seconds of quiet"""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+        try:
+            data = os.read(self.fd, 65536)
+        except BlockingIOError:
+            return set()
+
+        changed = set()
+        pos = 0
+        while pos < len(data):
+            wd, mask, _, length = _EVENT.unpack_from(data, pos)
+            name = data[pos + _EVENT.size:pos + _EVENT.size + length].rstrip(b"\0")
+            pos += _EVENT.size + length
+
+            if mask & _IN_Q_OVERFLOW:
+                # The kernel dropped events; only a rescan is safe
+                return set(_walk_files(self.root))
+            if mask & (_IN_IGNORED | _IN_DELETE_SELF):
+                self.dirs.pop(wd, None)
+                continue
+            directory = self.dirs.get(wd)
+            if directory is None or not name:
+                continue
+            path = os.path.join(directory, os.fsdecode(name))
+            if mask & _IN_ISDIR:
+                if mask & (_IN_CREATE | _IN_MOVED_TO) and not os.path.basename(path).startswith("."):
+                    # A new directory can fill up before its watch exists
+                    for dirpath, dirnames, _ in os.walk(path):
+                        dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+                        self._add(dirpath)
+                    changed.update(_walk_files(path))
+            elif mask & (_IN_CLOSE_WRITE | _IN_MOVED_TO):
+                changed.add(path)
+        return changed
+
+    def close(self):
+        os.close(self.fd)
+
+
+class PollingWatcher:
+    """Compares stat signatures of every file under root each interval"""
+
+    name = "polling"
+
+    def __init__(self, root, interval=DEFAULT_INTERVAL):
+        self.root = root
+        self.interval = interval
+        self.snapshot = self._scan()
+
+    def _scan(self):
+        snapshot = {}
+        for path in _walk_files(self.root):
+            signature = _signature(path)
+            if signature is not None:
+                snapshot[path] = signature
+        return snapshot
+
+    def wait(self, timeout=None):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            delay = self.interval
+            if deadline is not None:
+                delay = min(delay, max(deadline - time.monotonic(), 0))
+            time.sleep(delay)
+            snapshot = self._scan()
+            changed = {path for path, signature in snapshot.items() if self.snapshot.get(path) != signature}
+            self.snapshot = snapshot
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+
+    def close(self):
+        pass
+
+
+def open_watcher(root, polling=False, interval=DEFAULT_INTERVAL):
+    """inotify when the platform has it, otherwise (or with polling) the stat poll"""
+    if not polling:
+        try:
+            return InotifyWatcher(root)
+        except (OSError, AttributeError):
+            # AttributeError: a libc without inotify_init1
+            pass
+    return PollingWatcher(root, interval)
+
+
+class WatchDaemon:
+    """Re-runs the engine on each saved file that matches patterns
+
+    engine_options are passed to Engine() and pick the stages; the engine
+    is rebuilt only when a locale JSON file under locales_dir changes.
+    """
+
+    def __init__(self, watcher, patterns, debounce=DEFAULT_DEBOUNCE, log=sys.stdout, **engine_options):
+        self.watcher = watcher
+        self.regexes = [glob_regex(pattern) for pattern in patterns]
+        self.debounce = debounce
+        self.log = log
+        self.engine_options = engine_options
+        self.engine = Engine(**engine_options)
+        locales_dir = engine_options.get("locales_dir")
+        self.locales_prefix = os.path.normpath(locales_dir) + os.sep if locales_dir else None
+        # path -> stat signature of the version this daemon wrote
+        self.written = {}
+
+    def _matches(self, path):
+        normalized = os.path.normpath(path).replace(os.sep, "/")
+        return any(regex.match(normalized) for regex in self.regexes)
+
+    def _is_locale(self, path):
+        return (
+            self.locales_prefix is not None
+            and path.endswith(".json")
+            and os.path.normpath(path).startswith(self.locales_prefix)
+        )
+
+    def collect(self):
+        """Block for the first change, then gather events until debounce seconds pass quietly"""
+        paths = self.watcher.wait()
+        while paths:
+            more = self.watcher.wait(self.debounce)
+            if not more:
+                break
+            paths |= more
+        return paths
+
+    def handle(self, paths):
+        """Process one debounced batch; return the paths rewritten"""
+        if any(self._is_locale(path) for path in paths):
+            started = time.perf_counter()
+            try:
+                self.engine = Engine(**self.engine_options)
+            except ValueError as e:
+                # Broken locale JSON or a rule key gone from the locales:
+                # keep the table we have until the next locale save
+                print(f"Locales not reloaded: {e}", file=self.log)
+            else:
+                elapsed = (time.perf_counter() - started) * 1000
+                print(f"Reloaded locales ({len(self.engine.table)} entries, {elapsed:.0f} ms)", file=self.log)
+
+        updated = []
+        for path in sorted(paths):
+            if not self._matches(path):
+                continue
+            signature = _signature(path)
+            if signature is None:
+                continue
+            if self.written.get(path) == signature:
+                # Our own rename echoing back
+                continue
+            self.written.pop(path, None)
+
+            started = time.perf_counter()
+            try:
+                edits = self.engine.process_file(path)
+            except (OSError, UnicodeDecodeError) as e:
+                print(f"Error processing {path}: {e}", file=self.log)
+                continue
+            except PatchConflictError:
+                # Saved again mid-run: the newer content has its own event
+                continue
+            except ValidationError as e:
+                first = e.problems[0]
+                print(f"Error processing {path}: {first.line}:{first.column}: {first.message} (not written)", file=self.log)
+                continue
+            elapsed = (time.perf_counter() - started) * 1000
+            if edits:
+                self.written[path] = _signature(path)
+                updated.append(path)
+                print(f"✓ Updated {path} ({len(edits)} edits, {elapsed:.1f} ms)", file=self.log)
+        return updated
+
+    def run(self):
+        try:
+            while True:
+                self.handle(self.collect())
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.watcher.close()
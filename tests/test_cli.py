@@ -0,0 +1,36 @@
+import json
+
+from i18n_tools.cli import build_parser, main
+
+PAGE = "const Home = () => {\n  return <button>ยืนยัน</button>\n}\n"
+
+
+def test_watch_runs_the_fixer_only_when_asked():
+    parser = build_parser()
+    assert parser.parse_args(["watch"]).fix is False
+    assert parser.parse_args(["watch", "--fix"]).fix is True
+
+
+def test_profile_processes_files_the_cache_would_skip(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "Home.tsx").write_text(PAGE, encoding="utf-8")
+    (tmp_path / "Other.tsx").write_text(PAGE.replace("Home", "Other"), encoding="utf-8")
+    assert main(["translate", "--no-locales", "Home.tsx"]) == 0
+    assert (tmp_path / ".i18n-cache.json").exists()
+
+    # Home.tsx is cached as processed; Other.tsx still has the text
+    assert main(["translate", "--no-locales", "--profile", "run.json", "Home.tsx", "Other.tsx"]) == 0
+    report = json.loads((tmp_path / "run.json").read_text(encoding="utf-8"))
+    assert report["files_processed"] == 2
+    assert report["files_skipped"] == 0
+    hits = {rule["rule"]: rule["matches"] for rule in report["rules"]}
+    assert hits["ยืนยัน"] == 1
+    assert {"stage": "translate", "rule": "ยืนยัน"} not in report["dead_rules"]
+
+
+def test_translate_writes_the_hook_and_check_accepts_it(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "Home.tsx").write_text(PAGE, encoding="utf-8")
+    assert main(["translate", "--no-locales", "--no-cache", "Home.tsx"]) == 0
+    assert 'const { t } = useTranslation()' in (tmp_path / "Home.tsx").read_text(encoding="utf-8")
+    assert main(["check", "Home.tsx"]) == 0
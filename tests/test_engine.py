@@ -0,0 +1,51 @@
+import json
+import os
+
+import pytest
+
+from i18n_tools.engine import build_table
+from i18n_tools.rules import UndefinedRuleKeyError
+
+
+@pytest.fixture
+def locales(tmp_path, monkeypatch):
+    # LocaleIndex.load caches next to the working directory
+    monkeypatch.chdir(tmp_path)
+    th = tmp_path / "locales" / "th"
+    th.mkdir(parents=True)
+    (th / "common.json").write_text(json.dumps({
+        "buttons": {"submit": "ยืนยัน", "confirm": "ยืนยัน", "view": "ดู"},
+    }), encoding="utf-8")
+    (th / "member.json").write_text(json.dumps({
+        "dashboard": {"title": "แดชบอร์ด", "todayStats": "สถิติวันนี้"},
+    }), encoding="utf-8")
+    return os.path.join(tmp_path, "locales")
+
+
+def test_an_exact_unique_locale_key_beats_a_rule(locales):
+    table, _ = build_table([("สถิติวันนี้", "member:dashboard.title")], locales)
+    assert table["สถิติวันนี้"] == "member:dashboard.todayStats"
+
+
+def test_a_rule_picks_among_keys_sharing_a_text(locales):
+    table, _ = build_table([("ยืนยัน", "common:buttons.confirm")], locales)
+    assert table["ยืนยัน"] == "common:buttons.confirm"
+
+
+def test_a_rule_maps_a_variant_the_locales_lack(locales):
+    table, _ = build_table([("ดูทั้งหมด", "common:buttons.view")], locales)
+    assert table["ดูทั้งหมด"] == "common:buttons.view"
+
+
+def test_a_rule_key_no_locale_defines_is_rejected(locales):
+    with pytest.raises(UndefinedRuleKeyError, match="lottery:history"):
+        build_table([("ประวัติแทง", "lottery:history")], locales)
+
+
+def test_shipped_rules_agree_with_the_shipped_locales(tmp_path, monkeypatch):
+    repo = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    monkeypatch.chdir(tmp_path)
+    table, locales = build_table(locales_dir=os.path.join(repo, "src", "locales"))
+    for text, key in locales.index.items():
+        if text not in locales.collisions:
+            assert table[text] == key
@@ -0,0 +1,36 @@
+import pytest
+
+from i18n_tools.fixer import Fixer
+
+
+def fix(source, jsx=True):
+    return Fixer().fix(source, jsx=jsx)
+
+
+@pytest.mark.parametrize("source", [
+    '<p>ยอด: {t("member:credit.balance")} บาท</p>\n',
+    '<p>name: {t("member:profile.fullName")}</p>\n',
+    'return (\n  <div>\n    <p>{user?.name}</p>\n    <p>a: {t("common:buttons.submit")}</p>\n  </div>\n)\n',
+    '<Input title={t("common:buttons.submit")} />\n',
+    '<span>{loading ? "..." : t("common:buttons.save")}</span>\n',
+])
+def test_valid_jsx_is_left_alone(source):
+    assert fix(source) == (source, False)
+
+
+@pytest.mark.parametrize("source, expected", [
+    ('const item = { name: {t("common:buttons.save")} }\n', 'const item = { name: t("common:buttons.save") }\n'),
+    ('toast.error({t("common:messages.error")})\n', 'toast.error(t("common:messages.error"))\n'),
+    (
+        '<span>{isLoading ? "..." : {t("common:buttons.save")}}</span>\n',
+        '<span>{isLoading ? "..." : t("common:buttons.save") }</span>\n',
+    ),
+])
+def test_old_script_leftovers_are_repaired(source, expected):
+    assert fix(source) == (expected, True)
+
+
+def test_ternary_does_not_start_at_optional_chaining():
+    source = 'const a = user?.name\nconst item = { label: {t("common:buttons.save")} }\n'
+    content, _ = fix(source)
+    assert content == 'const a = user?.name\nconst item = { label: t("common:buttons.save") }\n'
@@ -0,0 +1,87 @@
+from i18n_tools.hooks import HOOK, IMPORT, check_hooks
+from i18n_tools.matcher import TranslationMatcher
+from i18n_tools.validate import check_balance
+
+TABLE = {
+    "ยืนยัน": "common:buttons.submit",
+    "เกิดข้อผิดพลาด": "common:messages.error",
+}
+
+
+def translate(source):
+    content, _ = TranslationMatcher(TABLE).translate_text(source)
+    assert check_balance(content) == []
+    return content
+
+
+def test_one_line_arrow_body_gets_the_hook_on_its_own_line():
+    content = translate('export const useNotify = () => { toast.error("เกิดข้อผิดพลาด") }\n')
+    assert f"{{\n  {HOOK}\n  toast.error(t(\"common:messages.error\")) }}" in content
+
+
+def test_one_line_function_body_gets_the_hook_on_its_own_line():
+    content = translate("function useThing() { return 'ยืนยัน' }\n")
+    assert f"{{\n  {HOOK}\n  return t(\"common:buttons.submit\") }}" in content
+
+
+def test_line_comment_after_the_brace_stays_on_the_hook_line():
+    content = translate("function useThing() { // label\n  return 'ยืนยัน'\n}\n")
+    assert f"{{\n  {HOOK} // label\n  return t(" in content
+
+
+def test_check_hooks_flags_t_calls_where_t_is_a_callback_parameter():
+    source = (
+        "const List = ({ items }) => {\n"
+        "  const { t } = useTranslation()\n"
+        "  return <ul>{items.map((t) => <li key={t.id}>{t(\"common:buttons.submit\")}</li>)}</ul>\n"
+        "}\n"
+    )
+    problems = check_hooks(source)
+    assert [(p.line, p.message) for p in problems] == [
+        (3, "t() where t is a parameter or local, not the translate function"),
+    ]
+
+
+def test_check_hooks_accepts_a_component_with_its_hook():
+    source = (
+        "const Title = () => {\n"
+        "  const { t } = useTranslation()\n"
+        "  return <h1>{t(\"member:dashboard.title\")}</h1>\n"
+        "}\n"
+    )
+    assert check_hooks(source) == []
+
+
+def test_concise_arrow_body_becomes_a_block():
+    content = translate("import React from 'react'\n\nconst Title = () => (\n  <h1>ยืนยัน</h1>\n)\n")
+    assert content == (
+        "import React from 'react'\n"
+        f"{IMPORT}\n\n"
+        "const Title = () => {\n"
+        f"  {HOOK}\n"
+        "  return (\n"
+        '  <h1>{t("common:buttons.submit")}</h1>\n'
+        ")\n"
+        "}\n"
+    )
+
+
+def test_existing_hook_and_import_are_reused():
+    source = (
+        "import { useTranslation } from 'react-i18next'\n"
+        "const Save = () => {\n"
+        "  const { t, i18n } = useTranslation('common')\n"
+        "  return <button>ยืนยัน</button>\n"
+        "}\n"
+    )
+    content = translate(source)
+    assert content == source.replace("ยืนยัน", '{t("common:buttons.submit")}')
+
+
+def test_functions_that_cannot_call_hooks_are_left_alone():
+    source = (
+        "const format = () => 'ยืนยัน'\n"
+        "export default function () { return <p>ยืนยัน</p> }\n"
+        "const label = 'ยืนยัน'\n"
+    )
+    assert translate(source) == source
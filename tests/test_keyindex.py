@@ -0,0 +1,38 @@
+from i18n_tools.bundles import KeyUsage
+from i18n_tools.keyindex import CALL, extract
+
+TWO_COMPONENTS = (
+    "export const Balance = () => {\n"
+    "  const { t } = useTranslation('member')\n"
+    "  return <p>{t('credit.balance')}</p>\n"
+    "}\n"
+    "\n"
+    "export const Promo = () => {\n"
+    "  const { t } = useTranslation(['promotion', 'common'])\n"
+    "  return <p>{t('claim')}</p>\n"
+    "}\n"
+    "\n"
+    "export const Plain = () => {\n"
+    "  const { t } = useTranslation()\n"
+    "  return <p>{t('buttons.save')}</p>\n"
+    "}\n"
+)
+
+
+def test_unprefixed_keys_read_their_own_components_namespace():
+    calls = [key for key, _, kind in extract(TWO_COMPONENTS) if kind == CALL]
+    assert calls == ["member:credit.balance", "promotion:claim", "common:buttons.save"]
+
+
+def test_bundle_usage_keeps_keys_of_every_component():
+    usage = KeyUsage({"member:credit.balance", "promotion:claim", "common:buttons.save", "member:claim"})
+    usage.add_source(TWO_COMPONENTS)
+    assert usage.used == {"member:credit.balance", "promotion:claim", "common:buttons.save"}
+
+
+def test_literals_and_template_prefixes_are_references():
+    source = "const names = { a: 'lottery:betTypes.tode_3' }\nconst k = `transaction:types.${type}`\n"
+    assert [(key, kind) for key, _, kind in extract(source)] == [
+        ("lottery:betTypes.tode_3", "literal"),
+        ("transaction:types.", "prefix"),
+    ]
@@ -0,0 +1,74 @@
+from i18n_tools.lexer import EXPRESSION, JSX_ATTR, JSX_TEXT, TEMPLATE, TEMPLATE_CHUNK, iter_strings
+
+SOURCE = '''import x from 'y'
+const re = /"[a-z]'/g
+// 'comment'
+export default function () { return 'anon' }
+const Card = memo(({ a }) => {
+  const list: Array<string> = ["a"]
+  return <div title="ชื่อ" data-x={`tpl`}>
+    ข้อความ {`pre ${a} post`} <b>ตัวหนา</b>
+  </div>
+})
+const useThing = () => ('hook')
+'''
+
+
+def lex(source, jsx=True):
+    return list(iter_strings(source, jsx))
+
+
+def test_each_literal_gets_the_kind_of_its_context():
+    assert [(t.kind, t.value.strip()) for t in lex(SOURCE)] == [
+        (EXPRESSION, "y"),
+        (EXPRESSION, "anon"),
+        (EXPRESSION, "a"),
+        (JSX_ATTR, "ชื่อ"),
+        (TEMPLATE, "tpl"),
+        (JSX_TEXT, "ข้อความ"),
+        (TEMPLATE_CHUNK, "pre"),
+        (TEMPLATE_CHUNK, "post"),
+        (JSX_TEXT, "ตัวหนา"),
+        (EXPRESSION, "hook"),
+    ]
+
+
+def test_spans_cover_the_quotes():
+    token = lex("const a = 'ยืนยัน'\n")[0]
+    assert (token.start, token.end) == (10, 18)
+
+
+def test_scopes_follow_top_level_functions():
+    tokens = lex(SOURCE)
+    assert tokens[0].scope is None
+    anon, card, hook = tokens[1].scope, tokens[2].scope, tokens[-1].scope
+    assert anon.name is None and anon.block
+    assert card.name == "Card" and card.block
+    assert all(t.scope is card for t in tokens[2:9])
+    assert hook.name == "useThing" and not hook.block
+    assert SOURCE[hook.start] == "(" and SOURCE[hook.end] == ")"
+
+
+def test_a_scope_ends_where_its_body_closes():
+    source = "function Foo() {\n  return 'a'\n}\nconst b = 'b'\n"
+    first, second = lex(source)
+    assert source[first.scope.start] == "{" and source[first.scope.end] == "}"
+    assert second.scope is None
+
+
+def test_without_jsx_a_less_than_is_an_operator():
+    tokens = lex("const ok = a <b> c ? 'x' : 'y'\n", jsx=False)
+    assert [t.value for t in tokens] == ["x", "y"]
+
+
+def test_function_and_catch_parameters_named_t_shadow_their_body():
+    source = (
+        "const Foo = () => {\n"
+        "  function pick(t) { return 'a' }\n"
+        "  try { run() } catch (t) { log('b') }\n"
+        "  if (t) { log('c') }\n"
+        "  return 'd'\n"
+        "}\n"
+    )
+    tokens = lex(source)
+    assert [t.scope.shadowed(t.start) for t in tokens] == [True, True, False, False]
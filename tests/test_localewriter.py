@@ -0,0 +1,68 @@
+import os
+
+import pytest
+
+from i18n_tools.localewriter import merge_namespace, write_entries
+
+COMMON = '''{
+    "buttons": {
+        "save": "บันทึก",
+        "save": "บันทึก",
+        "close": "ปิด"
+    },
+    "title": "หน้าแรก"
+}
+'''
+
+
+@pytest.fixture
+def common(tmp_path):
+    path = tmp_path / "th" / "common.json"
+    path.parent.mkdir()
+    path.write_text(COMMON, encoding="utf-8")
+    return path
+
+
+def test_new_keys_go_to_the_end_of_their_object_in_the_files_layout(common):
+    added, conflicts = merge_namespace(str(common), {"buttons.copy": "คัดลอก", "messages.error": "เกิดข้อผิดพลาด"})
+    assert (added, conflicts) == (["buttons.copy", "messages.error"], [])
+    assert common.read_text(encoding="utf-8") == '''{
+    "buttons": {
+        "save": "บันทึก",
+        "save": "บันทึก",
+        "close": "ปิด",
+        "copy": "คัดลอก"
+    },
+    "title": "หน้าแรก",
+    "messages": {
+        "error": "เกิดข้อผิดพลาด"
+    }
+}
+'''
+
+
+def test_nothing_new_leaves_the_file_untouched(common):
+    os.utime(common, ns=(1, 1))
+    added, conflicts = merge_namespace(str(common), {"buttons.close": "ปิด", "title": "อื่น", "title.sub": "x"})
+    assert added == []
+    assert conflicts == ["title", "title.sub"]
+    assert common.stat().st_mtime_ns == 1
+    assert common.read_text(encoding="utf-8") == COMMON
+
+
+def test_entries_are_grouped_per_language_and_namespace(tmp_path):
+    updates = write_entries(str(tmp_path), {
+        "th": {"common:buttons.copy": "คัดลอก", "member:title": "สมาชิก"},
+        "en": {"common:buttons.copy": "Copy"},
+    })
+    assert [(u.lang, u.ns, u.added) for u in updates] == [
+        ("en", "common", ["common:buttons.copy"]),
+        ("th", "common", ["common:buttons.copy"]),
+        ("th", "member", ["member:title"]),
+    ]
+    assert (tmp_path / "en" / "common.json").read_text(encoding="utf-8") == '{\n  "buttons": {\n    "copy": "Copy"\n  }\n}\n'
+
+
+def test_keys_without_a_namespace_are_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        write_entries(str(tmp_path), {"th": {"buttons.copy": "คัดลอก"}})
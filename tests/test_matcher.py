@@ -0,0 +1,78 @@
+from i18n_tools.matcher import TranslationMatcher
+
+TABLE = {
+    "ยืนยัน": "common:buttons.submit",
+    "ปิด": "common:buttons.close",
+}
+
+
+def translate(source, jsx=True):
+    return TranslationMatcher(TABLE).translate_text(source, jsx)
+
+
+def test_literals_under_a_t_parameter_are_left_alone():
+    source = (
+        "const List = ({ items }) => {\n"
+        "  return <ul>{items.map((t) => <li key={t.id}>ยืนยัน</li>)}<p>ปิด</p></ul>\n"
+        "}\n"
+    )
+    content, changed = translate(source)
+    assert changed
+    assert "<li key={t.id}>ยืนยัน</li>" in content
+    assert '<p>{t("common:buttons.close")}</p>' in content
+
+
+def test_a_local_t_blocks_the_whole_component():
+    source = (
+        "const Picker = () => {\n"
+        "  const label = 'ยืนยัน'\n"
+        "  const t = 5\n"
+        "  return label\n"
+        "}\n"
+    )
+    assert translate(source) == (source, False)
+
+
+def test_concise_t_parameter_body_ends_at_the_comma():
+    source = (
+        "const Picker = () => {\n"
+        "  const pick = (t) => 'ยืนยัน', close = 'ปิด'\n"
+        "  return pick\n"
+        "}\n"
+    )
+    content, _ = translate(source)
+    assert "(t) => 'ยืนยัน'" in content
+    assert 'close = t("common:buttons.close")' in content
+
+
+def test_each_context_gets_its_own_call_form():
+    source = (
+        "const Form = () => {\n"
+        "  toast.success('ยืนยัน')\n"
+        "  return <button title=\"ปิด\">\n"
+        "    ยืนยัน\n"
+        "  </button>\n"
+        "}\n"
+    )
+    content, _ = translate(source)
+    assert "toast.success(t(\"common:buttons.submit\"))" in content
+    assert 'title={t("common:buttons.close")}' in content
+    assert '\n    {t("common:buttons.submit")}\n' in content
+
+
+def test_data_literals_are_left_alone():
+    source = (
+        "const Status = ({ s }) => {\n"
+        "  if (s === 'ยืนยัน') return null\n"
+        "  const labels = { 'ปิด': 1 }\n"
+        "  switch (s) { case 'ปิด': return null }\n"
+        "  return labels\n"
+        "}\n"
+    )
+    assert translate(source) == (source, False)
+
+
+def test_hits_are_recorded_per_table_text():
+    hits = {}
+    TranslationMatcher(TABLE).translate_text("const A = () => {\n  return <p>ยืนยัน</p>\n}\n", hits=hits)
+    assert hits["ยืนยัน"][0] == 1
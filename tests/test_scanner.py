@@ -0,0 +1,22 @@
+from i18n_tools.scanner import SHADOWED, iter_findings
+
+
+def test_findings_skip_t_arguments_and_carry_suggestions():
+    source = "const A = () => <p title=\"ยืนยัน\">{t('ปิด')} ข้อความ</p>\n"
+    findings = list(iter_findings("a.tsx", source, {"ยืนยัน": "common:buttons.submit"}))
+    assert [(f.line, f.column, f.text, f.suggestion) for f in findings] == [
+        (1, 27, "ยืนยัน", "common:buttons.submit"),
+        (1, 46, "ข้อความ", None),
+    ]
+
+
+def test_text_where_t_is_a_local_is_marked_blocked():
+    source = (
+        "const A = ({ rows }) => {\n"
+        "  return <ul>{rows.map((t) => <li>ยืนยัน</li>)}<li>ปิด</li></ul>\n"
+        "}\n"
+    )
+    assert [(f.text, f.blocked) for f in iter_findings("a.tsx", source)] == [
+        ("ยืนยัน", SHADOWED),
+        ("ปิด", None),
+    ]
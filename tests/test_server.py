@@ -0,0 +1,76 @@
+import os
+
+import pytest
+
+from i18n_tools.server import INVALID_PARAMS, INVALID_REQUEST, METHOD_NOT_FOUND, PARSE_ERROR, Server, StdioClient
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PAGE = "const Home = () => {\n  return <button>ยืนยัน</button>\n}\n"
+
+
+@pytest.fixture(scope="module")
+def server():
+    return Server(translate=True, fix=False, locales_dir=None, validate=True)
+
+
+def request(method, params=None, id=1):
+    return {"jsonrpc": "2.0", "id": id, "method": method, "params": params or {}}
+
+
+def test_transform_returns_content_and_edits(server):
+    response = server.handle(request("transform", {"files": [{"path": "src/pages/Home.tsx", "content": PAGE}]}))
+    result = response["result"]["files"][0]
+    assert result["changed"]
+    assert '<button>{t("common:buttons.submit")}</button>' in result["content"]
+    assert result["diagnostics"] == []
+    assert result["edits"]
+
+
+def test_check_reports_balance_problems(server):
+    response = server.handle(request("check", {"files": [{"path": "a.tsx", "content": "const a = (\n"}]}))
+    assert response["result"]["files"][0]["diagnostics"][0]["message"] == "'(' is never closed"
+
+
+@pytest.mark.parametrize("message, code", [
+    ({"jsonrpc": "2.0", "id": 1}, INVALID_REQUEST),
+    ({"jsonrpc": "1.0", "id": 1, "method": "info"}, INVALID_REQUEST),
+    (request("nope"), METHOD_NOT_FOUND),
+    (request("transform", {"files": [{"path": "a.tsx"}]}), INVALID_PARAMS),
+])
+def test_bad_requests_get_error_codes(server, message, code):
+    assert server.handle(message)["error"]["code"] == code
+
+
+def test_parse_errors_and_empty_batches(server):
+    assert server.handle_line("{not json")["error"]["code"] == PARSE_ERROR
+    assert server.handle([])["error"]["code"] == INVALID_REQUEST
+
+
+def test_batches_answer_requests_but_not_notifications(server):
+    notification = {"jsonrpc": "2.0", "method": "info"}
+    responses = server.handle([request("info", id=7), notification])
+    assert [r["id"] for r in responses] == [7]
+    assert server.handle(notification) is None
+
+
+def test_failed_reload_keeps_the_engine(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    locales = tmp_path / "locales" / "th"
+    locales.mkdir(parents=True)
+    (locales / "common.json").write_text('{"buttons": {"submit": "ยืนยัน"}}', encoding="utf-8")
+    server = Server(translate=True, locales_dir=str(tmp_path / "locales"), rules=[])
+    engine = server.engine
+    (locales / "common.json").write_text("{", encoding="utf-8")
+    response = server.handle(request("reload"))
+    assert "error" in response
+    assert server.engine is engine
+
+
+def test_stdio_round_trip(monkeypatch):
+    monkeypatch.chdir(REPO)
+    with StdioClient(["--no-locales"]) as client:
+        [result] = client.transform([{"path": "src/pages/Home.tsx", "content": PAGE}])
+        assert result["changed"]
+        assert 'const { t } = useTranslation()' in result["content"]
+        assert client.call("info")["translate"] is True
@@ -0,0 +1,35 @@
+import re
+
+from i18n_tools.matcher import TranslationMatcher
+from i18n_tools.segment import Segmenter
+from i18n_tools.textutil import PLURAL_SUFFIX, LineIndex, build_trie, trie_to_regex
+
+
+def test_trie_regex_prefers_the_longest_phrase():
+    pattern = re.compile(trie_to_regex(build_trie(["ฝาก", "ฝากเงิน", "ถอน"])))
+    assert [m.group() for m in pattern.finditer("ฝากเงิน ถอน ฝาก")] == ["ฝากเงิน", "ถอน", "ฝาก"]
+
+
+def test_trie_regex_handles_values_longer_than_the_recursion_limit():
+    long_text = "ข้อกำหนด" * 400
+    pattern = re.compile(trie_to_regex(build_trie([long_text, long_text[:50], "ยืนยัน"])))
+    assert pattern.fullmatch(long_text)
+    assert pattern.fullmatch(long_text[:50])
+
+
+def test_matcher_and_segmenter_build_with_a_very_long_value():
+    long_text = "ข้อกำหนดและเงื่อนไข" * 100
+    TranslationMatcher({long_text: "common:terms", "ยืนยัน": "common:buttons.submit"})
+    Segmenter({"common:terms": long_text}, {long_text: "common:terms"})
+
+
+def test_numeric_endings_are_not_plural_forms():
+    assert PLURAL_SUFFIX.search("items_one")
+    assert not PLURAL_SUFFIX.search("betTypes.teng_bon_3")
+
+
+def test_line_index_locates_offsets():
+    lines = LineIndex("ab\ncd\n  ef")
+    assert lines.locate(0) == (1, 1)
+    assert lines.locate(4) == (2, 2)
+    assert lines.line_text(3) == "ef"
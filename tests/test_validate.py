@@ -0,0 +1,53 @@
+import pytest
+
+from i18n_tools.validate import ValidationError, check_balance, check_rewrite
+
+
+def messages(source, jsx=True):
+    return [(p.line, p.column, p.message) for p in check_balance(source, jsx)]
+
+
+def test_balanced_source_has_no_problems():
+    source = (
+        "const Foo = () => {\n"
+        "  const re = /[{(]/g\n"
+        "  return <p title={t(\"a:b\")}>{`x ${y}`} {a ? b : t(\"a:c\")}</p>\n"
+        "}\n"
+    )
+    assert messages(source) == []
+
+
+def test_extra_brace_in_jsx_text_is_reported():
+    assert messages('const A = () => <p>{t("a:b")}}</p>\n') == [(1, 30, "unexpected '}' in JSX text")]
+
+
+def test_unclosed_attribute_expression_is_reported():
+    problems = messages('const A = () => <input placeholder={t("a:b") />\n')
+    assert problems[0][2] == "'{' is not closed before '/>'"
+
+
+def test_mismatched_closing_tag_is_reported():
+    problems = messages("const A = () => <div><span></div>\n")
+    assert problems[0][2] == "</div> does not match <span> opened at 1:22"
+
+
+def test_unterminated_string_is_reported():
+    assert messages("const a = 'abc\n", jsx=False)[0][2] == "unterminated string literal"
+
+
+def test_rewrite_that_adds_a_problem_is_refused():
+    with pytest.raises(ValidationError) as info:
+        check_rewrite("a.tsx", "const A = () => <p>x</p>\n", 'const A = () => <p>{t("a:b")}}</p>\n')
+    assert info.value.problems[0].message == "unexpected '}' in JSX text"
+
+
+def test_rewrite_of_an_already_broken_file_is_allowed():
+    original = "const A = () => <p>x}</p>\nconst b = 'ยืนยัน'\n"
+    check_rewrite("a.tsx", original, original.replace("'ยืนยัน'", 't("a:b")'))
+
+
+def test_rewrite_that_trades_one_imbalance_for_another_is_refused():
+    original = "const A = () => <p>x}</p>\nconst b = 1\n"
+    content = "const A = () => <p>x</p>\nconst b = 1}\n"
+    with pytest.raises(ValidationError):
+        check_rewrite("a.tsx", original, content)